@@ -0,0 +1,123 @@
+import hashlib
+from datetime import date, datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Optional, Tuple
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.cache import TTLCache, table_version
+from backend.core.config import settings
+from backend.core.database import get_db
+from backend.models.user import User
+from backend.routers.auth import get_current_user
+
+# (row count, newest created/updated timestamp) per table. Entries are keyed
+# on the in-process table version, so local writes are seen immediately and
+# writes made by other workers within CACHE_TTL_SECONDS.
+_validator_cache = TTLCache(ttl=settings.CACHE_TTL_SECONDS, maxsize=64)
+
+
+async def table_validator(db: AsyncSession, model) -> Tuple[int, Optional[datetime]]:
+    table = model.__tablename__
+    key = (table,) + table_version(table)
+    validator = _validator_cache.get(key)
+    if validator is None:
+        validator = tuple((await db.execute(
+            select(func.count(), func.max(func.coalesce(model.updated_at, model.created_at)))
+            .select_from(model)
+        )).one())
+        _validator_cache.set(key, validator)
+    return validator
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def today(request: Request) -> date:
+    """``ConditionalGet`` key for responses computed as of the current date."""
+    return date.today()
+
+
+def date_param(name: str) -> Callable[[Request], str]:
+    """``ConditionalGet`` key for a date query parameter that defaults to today."""
+    def key(request: Request) -> str:
+        return request.query_params.get(name) or date.today().isoformat()
+    return key
+
+
+def _etag_matches(header: str, etag: str, exists: bool) -> bool:
+    candidates = [tag.strip() for tag in header.split(",")]
+    if "*" in candidates:
+        return exists
+    # Weak comparison: W/"x" matches "x"
+    return etag.removeprefix("W/") in [tag.removeprefix("W/") for tag in candidates]
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    return last_modified.replace(microsecond=0) <= _as_utc(since)
+
+
+class ConditionalGet:
+    """Dependency answering ``If-None-Match``/``If-Modified-Since`` with 304.
+
+    The validator is built from the row count and newest timestamp of each
+    table the response reads, the local write versions of those tables and
+    the request path and query. It costs at most one aggregate query per
+    table and runs before the endpoint loads or serializes any rows, but
+    after the caller is authenticated, so validators never reach anonymous
+    clients. ``If-None-Match: *`` is only honoured on collection routes:
+    a route with path parameters may be about to answer 404.
+
+    ``key`` adds request state the tables do not capture, such as the date
+    a report defaults to, to the ETag. Such responses send no Last-Modified,
+    which could not express it.
+    """
+
+    def __init__(self, *models, key: Optional[Callable[[Request], object]] = None):
+        self.models = models
+        self.key = key
+
+    async def __call__(self, request: Request, response: Response, db: AsyncSession = Depends(get_db),
+                       current_user: User = Depends(get_current_user)):
+        await self.check(request, response, db)
+
+    async def check(self, request: Request, response: Response, db: AsyncSession) -> None:
+        validators = [await table_validator(db, model) for model in self.models]
+        # Local write versions catch same-second edits the timestamps miss
+        versions = table_version(*(model.__tablename__ for model in self.models))
+        query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+        extra = self.key(request) if self.key is not None else None
+        digest = hashlib.sha1(repr((request.url.path, query, validators, versions, extra)).encode()).hexdigest()
+        headers = {"ETag": f'W/"{digest}"', "Cache-Control": "private, no-cache"}
+
+        timestamps = [_as_utc(ts) for _, ts in validators if ts is not None]
+        last_modified = max(timestamps) if timestamps and self.key is None else None
+        if last_modified is not None:
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+        response.headers.update(headers)
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            not_modified = _etag_matches(if_none_match, headers["ETag"], exists=not request.path_params)
+        else:
+            if_modified_since = request.headers.get("if-modified-since")
+            not_modified = bool(if_modified_since and last_modified
+                                and _not_modified_since(if_modified_since, last_modified))
+        if not_modified:
+            raise HTTPException(status_code=304, headers=headers)
+
+
+class PublicConditionalGet(ConditionalGet):
+    """``ConditionalGet`` for the few routes readable without a token."""
+
+    async def __call__(self, request: Request, response: Response, db: AsyncSession = Depends(get_db)):
+        await self.check(request, response, db)
@@ -1,15 +1,31 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 import os
 
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./hr_dashboard.db"
+    # Async URL for the API; derived from DATABASE_URL (aiosqlite/asyncpg) when empty
+    ASYNC_DATABASE_URL: str = ""
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
     
     # Security
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Embed user id and role claims in access tokens; a role claim that no
+    # longer matches the user's role rejects the token
+    TOKEN_EMBED_CLAIMS: bool = False
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_SIZE: int = 1024
+    
+    # Password hashing
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = 10.0
     
     # CORS
     ALLOWED_ORIGINS: List[str] = [
@@ -30,6 +46,61 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "uploads"
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
     
+    # Annual leave: statutory 28 days (5.6 weeks, bank holidays included)
+    # for a full-time five-day week, pro-rated by start date and employment type
+    LEAVE_YEAR_START_MONTH: int = 1
+    LEAVE_YEAR_START_DAY: int = 1
+    ANNUAL_LEAVE_DAYS: float = 28.0
+    LEAVE_CARRY_OVER_MAX_DAYS: float = 5.0
+    LEAVE_EMPLOYMENT_TYPE_FACTORS: Dict[str, float] = {"Full-time": 1.0, "Part-time": 0.6, "Contract": 1.0}
+    
+    # Working days: weekdays less the bank holidays of this division
+    # (england-and-wales, scotland or northern-ireland); an empty file path
+    # uses the bundled backend/data/uk_bank_holidays.json
+    BANK_HOLIDAY_REGION: str = "england-and-wales"
+    BANK_HOLIDAYS_FILE: str = ""
+    
+    # Statutory Sick Pay: qualifying days as a Monday-first weekmask
+    SSP_QUALIFYING_DAYS: str = "1111100"
+    
+    # Sickness analytics: Bradford factor (spells² × days) trigger points,
+    # counted per department by /api/reports/absence-analytics
+    ABSENCE_ANALYTICS_WINDOW_WEEKS: int = 52
+    BRADFORD_TRIGGER_POINTS: List[int] = [51, 201, 401, 651]
+    
+    # Pagination
+    DEFAULT_PAGE_SIZE: int = 100
+    MAX_PAGE_SIZE: int = 500
+    
+    # Caching
+    CACHE_TTL_SECONDS: int = 30
+    
+    # Search: "auto" uses SQLite FTS5 on SQLite and a LIKE scan elsewhere
+    SEARCH_BACKEND: str = "auto"
+    
+    # Document processing: text, page count, expiry dates and thumbnails are
+    # extracted after upload on a pool of worker processes
+    DOCUMENT_PROCESSING_ENABLED: bool = True
+    DOCUMENT_PROCESSING_WORKERS: int = 2
+    DOCUMENT_PROCESSING_QUEUE_SIZE: int = 100
+    DOCUMENT_PROCESSING_MAX_ATTEMPTS: int = 3
+    DOCUMENT_PROCESSING_RETRY_SECONDS: float = 30.0  # doubled after each failure
+    DOCUMENT_PROCESSING_TIMEOUT_SECONDS: float = 120.0
+    DOCUMENT_PROCESSING_POLL_SECONDS: float = 5.0
+    DOCUMENT_MAX_TEXT_CHARS: int = 200_000
+    
+    # Expiry sweeper: moves overdue documents and training records to the
+    # expired status; also runnable as ``python -m backend.services.expiry``
+    EXPIRY_SWEEP_ENABLED: bool = True
+    EXPIRY_SWEEP_INTERVAL_SECONDS: float = 3600.0
+    EXPIRY_SWEEP_BATCH_SIZE: int = 1000
+    EXPIRY_WARNING_DAYS: int = 30
+    
+    # Metrics
+    METRICS_ENABLED: bool = True
+    # Log a warning when one request issues more SQL statements than this
+    QUERY_COUNT_WARNING_THRESHOLD: int = 20
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -0,0 +1,72 @@
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from backend.core.database import AsyncSessionLocal
+
+EXPORT_BATCH_SIZE = 1000
+
+
+class ExportFormat(str, enum.Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+def _plain(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+async def _iter_batches(model) -> AsyncIterator[list]:
+    # The generator outlives the request's own session, so it owns one.
+    # Rows are fetched as plain column tuples in server-side batches rather
+    # than as ORM objects, keeping memory flat regardless of table size.
+    async with AsyncSessionLocal() as db:
+        stmt = select(*model.__table__.columns).order_by(model.id)
+        result = await db.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for batch in result.partitions():
+            yield batch
+
+
+async def _csv_stream(model) -> AsyncIterator[str]:
+    columns = [column.name for column in model.__table__.columns]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue()
+    async for batch in _iter_batches(model):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_plain(value) for value in row] for row in batch)
+        yield buffer.getvalue()
+
+
+async def _ndjson_stream(model) -> AsyncIterator[str]:
+    columns = [column.name for column in model.__table__.columns]
+    async for batch in _iter_batches(model):
+        yield "".join(
+            json.dumps(dict(zip(columns, map(_plain, row)))) + "\n" for row in batch
+        )
+
+
+def export_table(model, format: ExportFormat) -> StreamingResponse:
+    """Stream every row of ``model``'s table as CSV or newline-delimited JSON."""
+    filename = f"{model.__tablename__}.{format.value}"
+    if format == ExportFormat.CSV:
+        body, media_type = _csv_stream(model), "text/csv"
+    else:
+        body, media_type = _ndjson_stream(model), "application/x-ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+
+from backend.core.config import settings
+
+# min/max pin the cost, so hashes made with any other cost report
+# needs_update and are rehashed on the next successful login.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+# bcrypt releases the GIL while hashing, so a small dedicated thread pool
+# gives real parallelism without competing with the request threadpool.
+_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+_pending = 0
+_pending_lock = threading.Lock()
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue is full or a job waited too long."""
+
+
+def _job_done(future) -> None:
+    global _pending
+    with _pending_lock:
+        _pending -= 1
+
+
+async def _run(fn, *args):
+    global _pending
+    with _pending_lock:
+        if _pending >= settings.PASSWORD_HASH_MAX_QUEUE:
+            raise PasswordHasherBusy()
+        _pending += 1
+    try:
+        future = _executor.submit(fn, *args)
+    except BaseException:
+        _job_done(None)
+        raise
+    # A job that already started cannot be cancelled, so it stays counted
+    # until it actually finishes, not until its caller gives up
+    future.add_done_callback(_job_done)
+    try:
+        return await asyncio.wait_for(
+            asyncio.wrap_future(future), timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        future.cancel()
+        raise PasswordHasherBusy()
+
+
+async def hash_password(password: str) -> str:
+    return await _run(pwd_context.hash, password)
+
+
+async def verify_and_update_password(password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify ``password``; also return a new hash if the stored cost is outdated."""
+    return await _run(pwd_context.verify_and_update, password, hashed_password)
@@ -0,0 +1,259 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+
+from backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{str(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._lock = threading.Lock()
+
+    def header(self):
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        lines = self.header()
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels):
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (last is +Inf), sum, count]
+        self._values: Dict[Tuple, list] = {}
+
+    def observe(self, value: float, *labels):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(labels)
+            if series is None:
+                series = self._values[labels] = [[0] * (len(self.buckets) + 1), 0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        lines = self.header()
+        for labels, (counts, total, count) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += bucket_count
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, labels)} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Prometheus text exposition; only built when a scraper asks for it."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+REQUESTS = registry.register(Counter(
+    "http_requests_total", "HTTP requests by route, method and status.", ("method", "route", "status")))
+REQUEST_LATENCY = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route.", ("method", "route")))
+RESPONSE_SIZE = registry.register(Histogram(
+    "http_response_size_bytes", "HTTP response body size by route.", ("method", "route"), SIZE_BUCKETS))
+IN_FLIGHT = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served.", ("method",)))
+REQUEST_QUERIES = registry.register(Histogram(
+    "http_request_db_queries", "SQL statements issued per HTTP request.", ("method", "route"), QUERY_COUNT_BUCKETS))
+REQUEST_DB_TIME = registry.register(Histogram(
+    "http_request_db_duration_seconds", "Time spent in SQL statements per HTTP request.", ("method", "route")))
+DB_STATEMENTS = registry.register(Counter(
+    "db_statements_total", "SQL statements executed, including outside requests."))
+DB_STATEMENT_TIME = registry.register(Counter(
+    "db_statement_duration_seconds_total", "Total time spent executing SQL statements."))
+DOCUMENT_ANALYSES = registry.register(Counter(
+    "document_analyses_total", "Background document analyses by outcome.", ("outcome",)))
+DOCUMENT_ANALYSIS_TIME = registry.register(Histogram(
+    "document_analysis_duration_seconds", "Time spent extracting one document in a worker process."))
+EXPIRY_SWEEP_EXPIRED = registry.register(Counter(
+    "expiry_sweep_expired_total", "Rows moved to the expired status by the expiry sweeper.", ("entity",)))
+EXPIRY_SWEEP_EXPIRING = registry.register(Gauge(
+    "expiry_sweep_expiring", "Rows expiring within EXPIRY_WARNING_DAYS at the last sweep.", ("entity",)))
+EXPIRY_SWEEP_DURATION = registry.register(Gauge(
+    "expiry_sweep_last_duration_seconds", "Duration of the last expiry sweep."))
+EXPIRY_SWEEP_LAST_RUN = registry.register(Gauge(
+    "expiry_sweep_last_run_timestamp_seconds", "Unix time the last expiry sweep started."))
+
+
+class QueryStats:
+    __slots__ = ("count", "duration")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+
+# Statement counter for the request being served. The middleware installs a
+# fresh QueryStats; engine hooks add to whichever one is current.
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _query_stats.get()
+
+
+# The start time lives on the statement's execution context, so a statement
+# that fails (no after_cursor_execute) leaves nothing behind on the connection
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_start
+    DB_STATEMENTS.inc()
+    DB_STATEMENT_TIME.inc(amount=elapsed)
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += elapsed
+
+
+def instrument_engine(engine):
+    """Count statements and their time on a (sync) engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording latency, size and SQL use per route.
+
+    Recording is a few dictionary updates per request; formatting happens
+    only when ``/metrics`` is scraped. Routes are labelled by their path
+    template, so ``/api/employees/1`` and ``/api/employees/2`` share a series.
+    """
+
+    def __init__(self, app, skip_paths=("/metrics",)):
+        self.app = app
+        self.skip_paths = set(skip_paths)
+        self._route_templates: Dict = {}
+
+    def _route(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        template = self._route_templates.get(endpoint)
+        if template is None:
+            for route in scope["app"].routes:
+                if getattr(route, "endpoint", None) is endpoint:
+                    template = route.path
+                    break
+            else:
+                template = getattr(endpoint, "__name__", "unknown")
+            self._route_templates[endpoint] = template
+        return template
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        stats = QueryStats()
+        token = _query_stats.set(stats)
+        # The route is only known once routing ran, so in-flight requests
+        # are labelled by method alone
+        IN_FLIGHT.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            IN_FLIGHT.dec(method)
+            _query_stats.reset(token)
+            route = self._route(scope)
+            REQUESTS.inc(method, route, status)
+            REQUEST_LATENCY.observe(elapsed, method, route)
+            RESPONSE_SIZE.observe(size, method, route)
+            REQUEST_QUERIES.observe(stats.count, method, route)
+            REQUEST_DB_TIME.observe(stats.duration, method, route)
+            if stats.count > settings.QUERY_COUNT_WARNING_THRESHOLD:
+                logger.warning(
+                    "%s %s issued %d SQL statements (%.1f ms), possible N+1 query pattern",
+                    method, scope["path"], stats.count, stats.duration * 1000,
+                )
@@ -0,0 +1,100 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.config import settings
+from backend.core.expand import Expansion
+from backend.core.serialization import fast_json_response, schema_columns
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """Query parameters shared by every paginated list endpoint."""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="Opaque token from the previous page's X-Next-Cursor header"),
+        limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+        fast: bool = Query(False, description="Select plain columns and encode with orjson, skipping response validation"),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+        self.fast = fast
+
+
+def encode_cursor(values: List[Any]) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, (date, datetime)) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, columns) -> List[Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor arity mismatch")
+        return [_coerce(column, value) for column, value in zip(columns, values)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _coerce(column, value):
+    python_type = column.type.python_type
+    if value is not None and python_type in (date, datetime):
+        return python_type.fromisoformat(value)
+    return value
+
+
+async def paginate(db: AsyncSession, stmt: Select, page: PageParams, response: Response, *columns, schema=None,
+                   expand: Optional[Expansion] = None):
+    """Return one keyset page of ``stmt`` ordered by ``columns``.
+
+    The last column must be unique (normally the primary key) so the order is
+    total and a page can resume strictly after the previous one's last row.
+    Every page is a single index range scan, however deep into the table.
+
+    With ``page.fast`` and a response ``schema``, only the schema's columns
+    are selected and the page is returned as an already-encoded response.
+
+    With ``expand`` (even an empty one) the requested relationships are
+    eager-loaded and rows are returned as dicts for an expanded schema; the
+    fast path is only taken when nothing is expanded.
+    """
+    if page.cursor:
+        after = decode_cursor(page.cursor, columns)
+        stmt = stmt.where(tuple_(*columns) > tuple_(*after))
+    stmt = stmt.order_by(*columns).limit(page.limit + 1)
+
+    if expand:
+        stmt = expand.apply(stmt)
+    fast = page.fast and schema is not None and not expand
+    if fast:
+        model = columns[-1].class_
+        result = await db.execute(stmt.with_only_columns(*schema_columns(model, schema)))
+        rows = [dict(row) for row in result.mappings()]
+    else:
+        rows = (await db.execute(stmt)).scalars().all()
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([last[c.key] if fast else getattr(last, c.key) for c in columns])
+
+    if fast:
+        # A directly returned response does not inherit the injected one's headers
+        headers = dict(response.headers)
+        if next_cursor:
+            headers[NEXT_CURSOR_HEADER] = next_cursor
+        return fast_json_response(rows, headers=headers)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if expand is not None:
+        return expand.serialize_all(rows)
+    return rows
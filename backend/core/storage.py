@@ -0,0 +1,178 @@
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import NamedTuple, Optional, Tuple
+
+import anyio
+from starlette.responses import FileResponse
+from starlette.types import Receive, Scope, Send
+
+from backend.core.config import settings
+
+
+class FileTooLarge(Exception):
+    """Raised while streaming once an upload exceeds the size limit."""
+
+
+class StoredBlob(NamedTuple):
+    digest: str
+    size: int
+    path: str  # relative to the store root, as saved in Document.file_path
+    deduplicated: bool
+
+
+class BlobWriter:
+    """Streams one upload into a temp file, hashing and size-checking as it goes."""
+
+    def __init__(self, store: "ContentStore", max_size: int):
+        self.store = store
+        self.max_size = max_size
+        self.size = 0
+        self._hash = hashlib.sha256()
+        self._file = tempfile.NamedTemporaryFile(dir=store.tmp_dir, prefix="upload-", delete=False)
+
+    def write(self, data: bytes) -> None:
+        self.size += len(data)
+        if self.size > self.max_size:
+            raise FileTooLarge()
+        self._hash.update(data)
+        self._file.write(data)
+
+    def commit(self) -> StoredBlob:
+        """Move the temp file to its content address, or drop it if already stored."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        digest = self._hash.hexdigest()
+        relative = self.store.relative_path(digest)
+        target = self.store.root / relative
+        if target.exists():
+            os.unlink(self._file.name)
+            return StoredBlob(digest, self.size, relative, True)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic: concurrent uploads of the same content both land on one file
+        os.replace(self._file.name, target)
+        return StoredBlob(digest, self.size, relative, False)
+
+    def abort(self) -> None:
+        self._file.close()
+        try:
+            os.unlink(self._file.name)
+        except FileNotFoundError:
+            pass
+
+
+class ContentStore:
+    """Files stored once per SHA-256 under ``<root>/sha256/ab/cd/<digest>``."""
+
+    def __init__(self, root: str):
+        self.root = Path(root).resolve()
+        self.tmp_dir = self.root / "tmp"
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def relative_path(digest: str) -> str:
+        return f"sha256/{digest[:2]}/{digest[2:4]}/{digest}"
+
+    @staticmethod
+    def digest_of(relative: str) -> Optional[str]:
+        match = re.fullmatch(r"sha256/[0-9a-f]{2}/[0-9a-f]{2}/([0-9a-f]{64})", relative or "")
+        return match.group(1) if match else None
+
+    def open_writer(self, max_size: int = settings.MAX_FILE_SIZE) -> BlobWriter:
+        return BlobWriter(self, max_size)
+
+    def resolve(self, relative: str) -> Optional[Path]:
+        """Absolute path of a stored file, or None if missing or outside the store."""
+        path = (self.root / relative).resolve()
+        if not path.is_relative_to(self.root) or not path.is_file():
+            return None
+        return path
+
+
+content_store = ContentStore(settings.UPLOAD_DIR)
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Inclusive ``(start, end)`` for a single ``bytes=`` range.
+
+    Returns None when the whole file should be sent (no header, a
+    multi-range or malformed header) and raises ValueError when the range
+    cannot be satisfied.
+    """
+    if not header:
+        return None
+    match = re.fullmatch(r"\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*", header)
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("range not satisfiable")
+    return start, end
+
+
+class RangeFileResponse(FileResponse):
+    """FileResponse answering single ``Range`` requests with 206.
+
+    The body is handed to the server with the ASGI zero-copy send extension
+    (sendfile) when it offers one, and otherwise streamed from disk in
+    ``chunk_size`` pieces, so large files never sit in memory.
+    """
+
+    def __init__(self, path, request_headers, *args, **kwargs):
+        stat_result = os.stat(path)
+        super().__init__(path, *args, stat_result=stat_result, **kwargs)
+        self.headers["accept-ranges"] = "bytes"
+        size = stat_result.st_size
+        self.start, self.end = 0, size - 1
+
+        if_range = request_headers.get("if-range")
+        if if_range is not None and if_range != self.headers.get("etag"):
+            return
+        try:
+            byte_range = parse_range(request_headers.get("range"), size)
+        except ValueError:
+            self.status_code = 416
+            self.headers["content-range"] = f"bytes */{size}"
+            self.headers["content-length"] = "0"
+            self.send_header_only = True
+            return
+        if byte_range is not None:
+            self.start, self.end = byte_range
+            self.status_code = 206
+            self.headers["content-range"] = f"bytes {self.start}-{self.end}/{size}"
+            self.headers["content-length"] = str(self.end - self.start + 1)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        count = self.end - self.start + 1
+        if self.send_header_only or count <= 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif "http.response.zerocopysend" in scope.get("extensions", {}):
+            with open(self.path, "rb") as file:
+                await send({"type": "http.response.zerocopysend", "file": file,
+                            "offset": self.start, "count": count, "more_body": False})
+        else:
+            async with await anyio.open_file(self.path, mode="rb") as file:
+                await file.seek(self.start)
+                remaining = count
+                while remaining > 0:
+                    chunk = await file.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+                if remaining > 0:
+                    await send({"type": "http.response.body", "body": b"", "more_body": False})
+        if self.background is not None:
+            await self.background()
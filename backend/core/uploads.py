@@ -0,0 +1,121 @@
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
+
+from backend.core.config import settings
+from backend.core.storage import BlobWriter, ContentStore, FileTooLarge
+
+MAX_FIELD_SIZE = 64 * 1024
+MAX_FIELDS = 50
+# Room for boundaries, part headers and the metadata fields
+MULTIPART_OVERHEAD = 1024 * 1024
+
+
+class StreamedUpload:
+    """Form fields plus the single file part of a streamed multipart body."""
+
+    def __init__(self):
+        self.fields: Dict[str, str] = {}
+        self.writer: Optional[BlobWriter] = None
+        self.filename: Optional[str] = None
+        self.content_type: Optional[str] = None
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(status_code=413, detail=f"File exceeds the maximum size of {settings.MAX_FILE_SIZE} bytes")
+
+
+async def receive_upload(request: Request, store: ContentStore, file_field: str = "file") -> StreamedUpload:
+    """Parse a multipart body chunk by chunk, writing ``file_field`` straight to the store.
+
+    The file is hashed and size-checked as it arrives and never held in
+    memory; the caller commits or aborts ``upload.writer``. Other parts are
+    small text fields.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data upload")
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > settings.MAX_FILE_SIZE + MULTIPART_OVERHEAD:
+        raise _too_large()
+
+    upload = StreamedUpload()
+    # Parser callbacks are synchronous, so they only record what arrived;
+    # disk writes happen per received chunk in the threadpool.
+    state = {"name": None, "headers": {}, "field": b"", "value": b"", "is_file": False}
+    pending: List[bytes] = []
+    errors: List[HTTPException] = []
+
+    def on_part_begin():
+        state.update(name=None, headers={}, is_file=False, value=b"")
+
+    def on_header_field(data, start, end):
+        state["field"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        state["value"] += data[start:end]
+
+    def on_header_end():
+        state["headers"][state["field"].lower()] = state["value"]
+        state["field"] = state["value"] = b""
+
+    def on_headers_finished():
+        _, options = parse_options_header(state["headers"].get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("utf-8")
+        state["name"] = name
+        if name == file_field and b"filename" in options:
+            if upload.writer is not None:
+                errors.append(HTTPException(status_code=400, detail="Only one file may be uploaded"))
+                return
+            state["is_file"] = True
+            upload.filename = options[b"filename"].decode("utf-8")
+            part_type = state["headers"].get(b"content-type")
+            upload.content_type = part_type.decode("latin-1") if part_type else None
+            upload.writer = store.open_writer(settings.MAX_FILE_SIZE)
+        elif len(upload.fields) >= MAX_FIELDS:
+            errors.append(HTTPException(status_code=400, detail="Too many form fields"))
+
+    def on_part_data(data, start, end):
+        if state["is_file"]:
+            pending.append(data[start:end])
+        else:
+            state["value"] += data[start:end]
+            if len(state["value"]) > MAX_FIELD_SIZE:
+                errors.append(HTTPException(status_code=413, detail="Form field too large"))
+
+    def on_part_end():
+        if not state["is_file"] and state["name"]:
+            upload.fields[state["name"]] = state["value"].decode("utf-8")
+        state["value"] = b""
+
+    def flush():
+        upload.writer.write(b"".join(pending))
+        pending.clear()
+
+    parser = MultipartParser(params[b"boundary"], {
+        "on_part_begin": on_part_begin,
+        "on_part_data": on_part_data,
+        "on_part_end": on_part_end,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+    })
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            if errors:
+                raise errors[0]
+            if pending:
+                await run_in_threadpool(flush)
+        parser.finalize()
+    except FileTooLarge:
+        upload.writer.abort()
+        raise _too_large()
+    except BaseException:
+        if upload.writer is not None:
+            upload.writer.abort()
+        raise
+    return upload
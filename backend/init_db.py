@@ -2,18 +2,31 @@
 """
 Database Initialization Script
 Creates sample data for the HR Dashboard
+
+    python -m backend.init_db                                  # small sample
+    python -m backend.init_db --employees 100000 --years 5     # synthetic load-test data
 """
 
-import asyncio
-from sqlalchemy.orm import Session
-from backend.core.database import SessionLocal, engine
-from backend.models import Base, User, Department, Employee
+import argparse
+import time
+from datetime import date
+from backend.core.database import Base, SessionLocal, engine
+from backend.models import User, Department, Employee
 from backend.routers.auth import get_password_hash
 from backend.models.user import UserRole
+from backend.services.leave_balance import rebuild_leave_ledger
+from backend.services.org_chart import rebuild_hierarchy
+from backend.services.search import ensure_search_index
+from backend.services.synthetic_data import DEFAULT_AS_OF, seed_synthetic
+from backend.services.working_days import recompute_all_absence_days
+
+# Every synthetic user shares this password (and one precomputed hash)
+SYNTHETIC_PASSWORD = "password123"
 
 def init_db():
     # Create tables
     Base.metadata.create_all(bind=engine)
+    ensure_search_index()
     
     db = SessionLocal()
     
@@ -63,6 +76,18 @@ def init_db():
         db.add(hr_user)
         db.commit()
         
+        # Create sales employee user
+        sales_user = User(
+            email="emma.davis@company.com",
+            username="emma_davis",
+            full_name="Emma Davis",
+            hashed_password=get_password_hash("emma123"),
+            role=UserRole.EMPLOYEE,
+            is_active=True
+        )
+        db.add(sales_user)
+        db.commit()
+        
         # Create sample employees
         employees = [
             Employee(
@@ -71,7 +96,7 @@ def init_db():
                 department_id=departments[3].id,  # HR
                 first_name="Sarah",
                 last_name="Johnson",
-                hire_date="2023-01-15",
+                hire_date=date(2023, 1, 15),
                 position="HR Manager",
                 salary=65000.00,
                 employment_type="Full-time"
@@ -82,18 +107,18 @@ def init_db():
                 department_id=departments[0].id,  # Engineering
                 first_name="John",
                 last_name="Smith",
-                hire_date="2023-02-01",
+                hire_date=date(2023, 2, 1),
                 position="Senior Software Engineer",
                 salary=75000.00,
                 employment_type="Full-time"
             ),
             Employee(
                 employee_id="EMP003",
-                user_id=None,
+                user_id=sales_user.id,
                 department_id=departments[1].id,  # Sales
                 first_name="Emma",
                 last_name="Davis",
-                hire_date="2023-03-10",
+                hire_date=date(2023, 3, 10),
                 position="Sales Representative",
                 salary=45000.00,
                 employment_type="Full-time"
@@ -104,6 +129,9 @@ def init_db():
             db.add(emp)
         db.commit()
         
+        rebuild_hierarchy(db.connection())
+        db.commit()
+        
         print("Database initialized successfully!")
         print(f"Created {len(departments)} departments")
         print(f"Created {len(employees)} employees")
@@ -116,5 +144,87 @@ def init_db():
     finally:
         db.close()
 
+def rebuild_org_chart():
+    # Backfill the reporting-line closure table for an existing database
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        count = rebuild_hierarchy(conn)
+    print(f"Rebuilt employee hierarchy: {count} rows")
+
+def rebuild_leave_balances():
+    # Backfill the annual leave ledger from the absence history
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        count = rebuild_leave_ledger(conn)
+    print(f"Rebuilt leave balances: {count} rows")
+
+def rebuild_search_index():
+    # Re-index employees, documents and training from scratch
+    Base.metadata.create_all(bind=engine)
+    count = ensure_search_index(rebuild=True)
+    print(f"Rebuilt search index: {count} entries")
+
+def recompute_absence_days():
+    # Correct total_days on absences recorded before it was checked against the dates
+    Base.metadata.create_all(bind=engine)
+    result = recompute_all_absence_days()
+    print(f"Recomputed absence days ({result['region']}): {result['updated']} of {result['scanned']} absences "
+          f"corrected in {result['duration_seconds']:.1f}s")
+
+def init_synthetic_db(employees, years, seed=42, batch_size=5000, as_of=DEFAULT_AS_OF):
+    # Create tables
+    Base.metadata.create_all(bind=engine)
+    
+    with SessionLocal() as db:
+        if db.query(User).first():
+            print("Database already contains data. Skipping initialization.")
+            return
+    
+    print(f"Generating {employees} employees with {years} years of history to {as_of} (seed={seed})...")
+    started = time.perf_counter()
+    # Hash once; bcrypt per user would dominate seeding time
+    password_hash = get_password_hash(SYNTHETIC_PASSWORD)
+    with engine.begin() as conn:
+        seed_synthetic(conn, employees, years, password_hash, seed=seed, batch_size=batch_size, as_of=as_of)
+    
+    with SessionLocal() as db:
+        db.add(User(
+            email="admin@company.com",
+            username="admin",
+            full_name="System Administrator",
+            hashed_password=get_password_hash("admin123"),
+            role=UserRole.ADMIN,
+            is_active=True
+        ))
+        db.commit()
+    
+    print(f"Database seeded in {time.perf_counter() - started:.1f}s")
+    print(f"Created admin user: admin@company.com / admin123")
+    print(f"Synthetic users: employee<N>@company.com / {SYNTHETIC_PASSWORD}")
+
 if __name__ == "__main__":
-    init_db()
+    parser = argparse.ArgumentParser(description="Initialize the HR Dashboard database")
+    parser.add_argument("--employees", type=int, help="generate a synthetic dataset of this many employees")
+    parser.add_argument("--years", type=int, default=3, help="years of absence/review/training history")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for reproducible datasets")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=DEFAULT_AS_OF,
+                        help="date the synthetic history runs up to, YYYY-MM-DD (default %(default)s)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="rows per INSERT batch")
+    parser.add_argument("--rebuild-hierarchy", action="store_true", help="recompute the org chart closure table and exit")
+    parser.add_argument("--rebuild-leave-balances", action="store_true", help="recompute the annual leave ledger and exit")
+    parser.add_argument("--rebuild-search-index", action="store_true", help="recompute the full-text search index and exit")
+    parser.add_argument("--recompute-absence-days", action="store_true", help="correct absence total_days from working days and exit")
+    args = parser.parse_args()
+    
+    if args.rebuild_hierarchy:
+        rebuild_org_chart()
+    elif args.rebuild_leave_balances:
+        rebuild_leave_balances()
+    elif args.rebuild_search_index:
+        rebuild_search_index()
+    elif args.recompute_absence_days:
+        recompute_absence_days()
+    elif args.employees:
+        init_synthetic_db(args.employees, args.years, seed=args.seed, batch_size=args.batch_size, as_of=args.as_of)
+    else:
+        init_db()
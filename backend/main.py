@@ -1,7 +1,12 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from backend.routers import auth, employees, departments, absences, performance, training, documents
+from backend.routers import auth, employees, departments, absences, performance, training, documents, dashboard, search, reports
 from backend.core.config import settings
+from backend.core.database import async_engine, engine
+from backend.core.metrics import PROMETHEUS_CONTENT_TYPE, MetricsMiddleware, instrument_engine, registry
+from backend.services.document_processing import document_pipeline
+from backend.services.expiry import expiry_sweeper
+from backend.services.search import ensure_search_index
 
 app = FastAPI(
     title="HR Dashboard API",
@@ -18,8 +23,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified", "Accept-Ranges", "Content-Range", "Content-Disposition"],
 )
 
+# Request metrics, outermost so the timings include CORS handling
+if settings.METRICS_ENABLED:
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(employees.router, prefix="/api/employees", tags=["Employees"])
@@ -28,6 +40,33 @@ app.include_router(absences.router, prefix="/api/absences", tags=["Absences"])
 app.include_router(performance.router, prefix="/api/performance", tags=["Performance"])
 app.include_router(training.router, prefix="/api/training", tags=["Training"])
 app.include_router(documents.router, prefix="/api/documents", tags=["Documents"])
+app.include_router(dashboard.router, prefix="/api/dashboard", tags=["Dashboard"])
+app.include_router(search.router, prefix="/api/search", tags=["Search"])
+app.include_router(reports.router, prefix="/api/reports", tags=["Reports"])
+
+# Writes keep the search index in sync but never create it, so a database
+# from before the index existed is backfilled here, once
+@app.on_event("startup")
+def create_search_index():
+    ensure_search_index()
+
+if settings.DOCUMENT_PROCESSING_ENABLED:
+    @app.on_event("startup")
+    async def start_document_pipeline():
+        await document_pipeline.start()
+
+    @app.on_event("shutdown")
+    async def stop_document_pipeline():
+        await document_pipeline.stop()
+
+if settings.EXPIRY_SWEEP_ENABLED:
+    @app.on_event("startup")
+    async def start_expiry_sweeper():
+        expiry_sweeper.start()
+
+    @app.on_event("shutdown")
+    async def stop_expiry_sweeper():
+        await expiry_sweeper.stop()
 
 @app.get("/")
 async def root():
@@ -37,6 +76,11 @@ async def root():
 async def health_check():
     return {"status": "healthy", "service": "HR Dashboard API"}
 
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return Response(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,17 +1,23 @@
 from .user import User
 from .employee import Employee
+from .employee_hierarchy import EmployeeHierarchy
 from .department import Department
 from .absence import Absence
+from .leave_balance import LeaveBalance
 from .performance import Performance
 from .training import Training
 from .document import Document
+from .document_analysis import DocumentAnalysis
 
 __all__ = [
     "User",
     "Employee", 
+    "EmployeeHierarchy",
     "Department",
     "Absence",
+    "LeaveBalance",
     "Performance",
     "Training",
-    "Document"
+    "Document",
+    "DocumentAnalysis"
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, ForeignKey, Text, Float
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, ForeignKey, Text, Float, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from backend.core.database import Base
@@ -21,6 +21,12 @@ class AbsenceStatus(str, enum.Enum):
 
 class Absence(Base):
     __tablename__ = "absences"
+    __table_args__ = (
+        Index("ix_absences_status_start_date", "status", "start_date"),
+        Index("ix_absences_employee_id_start_date", "employee_id", "start_date"),
+        Index("ix_absences_type_start_date", "absence_type", "start_date"),
+        Index("ix_absences_start_date_end_date", "start_date", "end_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
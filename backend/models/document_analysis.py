@@ -0,0 +1,54 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Text, Enum, Index
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship, backref
+from backend.core.database import Base
+import enum
+
+class AnalysisStatus(str, enum.Enum):
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class DocumentAnalysis(Base):
+    """Background extraction results for one document.
+
+    Kept beside ``documents`` rather than on it so list queries never load
+    the extracted text, and so the table can be added without touching
+    existing rows.
+    """
+    __tablename__ = "document_analyses"
+    __table_args__ = (
+        Index("ix_document_analyses_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+    
+    document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), primary_key=True)
+    
+    # Processing state
+    status = Column(Enum(AnalysisStatus), nullable=False, default=AnalysisStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # Results
+    text = Column(Text, nullable=True)
+    page_count = Column(Integer, nullable=True)
+    detected_expiry_dates = Column(Text, nullable=True)  # JSON list of ISO dates
+    suggested_expiry_date = Column(Date, nullable=True)
+    thumbnail_path = Column(String(500), nullable=True)
+    
+    # Timestamps
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Relationships
+    document = relationship("Document", backref=backref("analysis", uselist=False, passive_deletes=True))
+    
+    @property
+    def has_thumbnail(self) -> bool:
+        return self.thumbnail_path is not None
+    
+    def __repr__(self):
+        return f"<DocumentAnalysis(document_id={self.document_id}, status='{self.status}', attempts={self.attempts})>"
@@ -9,7 +9,7 @@ class Employee(Base):
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(String(20), unique=True, nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    department_id = Column(Integer, ForeignKey("departments.id"), nullable=True)
+    department_id = Column(Integer, ForeignKey("departments.id"), nullable=True, index=True)
     
     # Personal Information
     first_name = Column(String(50), nullable=False)
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, ForeignKey, Index
+from backend.core.database import Base
+
+class EmployeeHierarchy(Base):
+    """Closure table of reporting lines.
+
+    One row per (manager, report) pair at every depth, plus a depth 0 row
+    per employee, so a whole subtree or management chain is one indexed
+    lookup instead of a walk along ``manager_id``.
+    """
+    __tablename__ = "employee_hierarchy"
+    __table_args__ = (
+        Index("ix_employee_hierarchy_descendant_id_depth", "descendant_id", "depth"),
+    )
+    
+    ancestor_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True)
+    descendant_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True)
+    depth = Column(Integer, nullable=False)
+    
+    def __repr__(self):
+        return f"<EmployeeHierarchy(ancestor_id={self.ancestor_id}, descendant_id={self.descendant_id}, depth={self.depth})>"
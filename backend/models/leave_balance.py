@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from backend.core.database import Base
+
+class LeaveBalance(Base):
+    """Annual leave ledger: one row per employee and leave year.
+
+    Entitlement and carry-over are set when the row is created; taken and
+    pending days move incrementally as annual leave is requested, approved,
+    changed or cancelled, so a balance is a primary-key lookup rather than
+    a sum over the employee's absence history.
+    """
+    __tablename__ = "leave_balances"
+    
+    employee_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True)
+    leave_year = Column(Integer, primary_key=True)  # calendar year the leave year starts in
+    
+    entitlement_days = Column(Float, nullable=False, default=0.0)
+    carried_over_days = Column(Float, nullable=False, default=0.0)
+    taken_days = Column(Float, nullable=False, default=0.0)  # approved annual leave
+    pending_days = Column(Float, nullable=False, default=0.0)  # requested, awaiting approval
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    @property
+    def remaining_days(self) -> float:
+        return self.entitlement_days + self.carried_over_days - self.taken_days
+    
+    def __repr__(self):
+        return f"<LeaveBalance(employee_id={self.employee_id}, leave_year={self.leave_year}, remaining={self.remaining_days})>"
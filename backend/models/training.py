@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, ForeignKey, Text, Float
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, ForeignKey, Text, Float, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from backend.core.database import Base
@@ -18,6 +18,11 @@ class TrainingType(str, enum.Enum):
 
 class Training(Base):
     __tablename__ = "training"
+    __table_args__ = (
+        Index("ix_training_status_due_date", "status", "due_date"),
+        Index("ix_training_status_expiry_date", "status", "expiry_date"),
+        Index("ix_training_employee_id_status", "employee_id", "status"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
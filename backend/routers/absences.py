@@ -1,27 +1,163 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date, datetime, timezone
+from backend.core.conditional import ConditionalGet
+from backend.core.config import settings
 from backend.core.database import get_db
-from backend.schemas.absence import AbsenceCreate, AbsenceUpdate, AbsenceResponse
-from backend.models.absence import Absence
+from backend.core.expand import Expand, Expansion
+from backend.core.export import ExportFormat, export_table
+from backend.core.pagination import PageParams, paginate
+from backend.schemas.absence import AbsenceCreate, AbsenceUpdate, AbsenceResponse, AbsenceExpandedResponse, AbsenceCalendarResponse, LeaveBalanceResponse, AbsenceDaysRecompute
+from backend.models.absence import Absence, AbsenceType, AbsenceStatus
+from backend.models.employee import Employee
+from backend.models.department import Department
+from backend.models.leave_balance import LeaveBalance
+from backend.services.leave_calendar import build_absence_calendar
+from backend.services.leave_balance import get_balances, leave_year_key, leave_year_of
+from backend.services.working_days import REGIONS, WorkingDaysError, recompute_all_absence_days, resolve_total_days
 from backend.routers.auth import get_current_user
-from backend.models.user import User
+from backend.models.user import User, UserRole
 
 router = APIRouter()
 
-@router.get("/", response_model=List[AbsenceResponse])
-def get_absences(db: Session = Depends(get_db)):
-    absences = db.query(Absence).all()
-    return absences
+MAX_CALENDAR_DAYS = 731
+
+@router.get("/", response_model=List[AbsenceExpandedResponse], response_model_exclude_unset=True,
+            dependencies=[Depends(ConditionalGet(Absence, Employee, Department))])
+async def get_absences(
+    response: Response,
+    employee_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    status: Optional[AbsenceStatus] = None,
+    absence_type: Optional[AbsenceType] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    page: PageParams = Depends(),
+    expand: Expansion = Depends(Expand(Absence, "employee", "employee.department", "approver")),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    stmt = select(Absence)
+    if employee_id is not None:
+        stmt = stmt.where(Absence.employee_id == employee_id)
+    if department_id is not None:
+        stmt = stmt.join(Employee, Absence.employee_id == Employee.id).where(
+            Employee.department_id == department_id
+        )
+    if status is not None:
+        stmt = stmt.where(Absence.status == status)
+    if absence_type is not None:
+        stmt = stmt.where(Absence.absence_type == absence_type)
+    # Absences overlapping [date_from, date_to]
+    if date_to is not None:
+        stmt = stmt.where(Absence.start_date <= date_to)
+    if date_from is not None:
+        stmt = stmt.where(Absence.end_date >= date_from)
+    return await paginate(db, stmt, page, response, Absence.start_date, Absence.id, schema=AbsenceResponse, expand=expand)
+
+@router.get("/export")
+async def export_absences(
+    format: ExportFormat = ExportFormat.CSV,
+    current_user: User = Depends(get_current_user)
+):
+    return export_table(Absence, format)
+
+@router.get("/calendar", response_model=AbsenceCalendarResponse, dependencies=[Depends(ConditionalGet(Absence, Employee, Department))])
+async def get_absence_calendar(
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    department_id: Optional[int] = None,
+    include_pending: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if date_to < date_from:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    if (date_to - date_from).days + 1 > MAX_CALENDAR_DAYS:
+        raise HTTPException(status_code=400, detail=f"Calendar range is limited to {MAX_CALENDAR_DAYS} days")
+    statuses = (AbsenceStatus.APPROVED, AbsenceStatus.PENDING) if include_pending else (AbsenceStatus.APPROVED,)
+    return await build_absence_calendar(db, date_from, date_to, department_id, statuses)
+
+@router.get("/balances", response_model=List[LeaveBalanceResponse],
+            dependencies=[Depends(ConditionalGet(Employee, LeaveBalance, key=leave_year_key))])
+async def get_leave_balances(
+    response: Response,
+    year: Optional[int] = Query(None, ge=1900, le=2999, description="Leave year by the calendar year it starts in; defaults to the current one"),
+    department_id: Optional[int] = None,
+    include_inactive: bool = False,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Annual leave balances, one per employee, paged by employee id."""
+    stmt = select(Employee)
+    if department_id is not None:
+        stmt = stmt.where(Employee.department_id == department_id)
+    if not include_inactive:
+        stmt = stmt.where(Employee.is_active == True)
+    employees = await paginate(db, stmt, page, response, Employee.id)
+    return await get_balances(db, employees, year if year is not None else leave_year_of(date.today()))
+
+@router.post("/recompute-days", response_model=AbsenceDaysRecompute)
+async def recompute_absence_days(
+    region: str = Query(settings.BANK_HOLIDAY_REGION, enum=list(REGIONS)),
+    current_user: User = Depends(get_current_user)
+):
+    """Correct total_days on historical absences whose dates do not account for it."""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    if region not in REGIONS:
+        raise HTTPException(status_code=400, detail=f"region must be one of {', '.join(REGIONS)}")
+    return await run_in_threadpool(recompute_all_absence_days, region)
 
 @router.post("/", response_model=AbsenceResponse)
-def create_absence(
+async def create_absence(
     absence: AbsenceCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    db_absence = Absence(**absence.dict())
+    data = absence.dict(exclude={"start_half_day", "end_half_day"})
+    try:
+        data["total_days"] = resolve_total_days(absence.start_date, absence.end_date, absence.absence_type,
+                                                absence.total_days, absence.start_half_day, absence.end_half_day)
+    except WorkingDaysError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    db_absence = Absence(**data)
     db.add(db_absence)
-    db.commit()
-    db.refresh(db_absence)
+    await db.commit()
+    await db.refresh(db_absence)
+    return db_absence
+
+@router.put("/{absence_id}", response_model=AbsenceResponse)
+async def update_absence(
+    absence_id: int,
+    absence: AbsenceUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Edit, approve, reject or cancel an absence; the leave ledger follows the change."""
+    db_absence = await db.get(Absence, absence_id)
+    if db_absence is None:
+        raise HTTPException(status_code=404, detail="Absence not found")
+    
+    changes = absence.dict(exclude_unset=True)
+    halves = {"start_half_day": changes.pop("start_half_day", False), "end_half_day": changes.pop("end_half_day", False)}
+    for field, value in changes.items():
+        setattr(db_absence, field, value)
+    if db_absence.end_date < db_absence.start_date:
+        raise HTTPException(status_code=400, detail="end_date must not be before start_date")
+    if changes.keys() & {"start_date", "end_date", "total_days", "absence_type"} or any(halves.values()):
+        try:
+            db_absence.total_days = resolve_total_days(db_absence.start_date, db_absence.end_date,
+                                                       db_absence.absence_type, changes.get("total_days"), **halves)
+        except WorkingDaysError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+    if changes.get("status") == AbsenceStatus.APPROVED and db_absence.approved_at is None:
+        db_absence.approved_at = datetime.now(timezone.utc)
+    
+    await db.commit()
+    await db.refresh(db_absence)
     return db_absence
@@ -1,25 +1,66 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
 from datetime import timedelta
+from backend.core.cache import TTLCache
 from backend.core.database import get_db
+from backend.core.hashing import PasswordHasherBusy, hash_password, pwd_context, verify_and_update_password
 from backend.core.config import settings
 from backend.schemas.user import UserCreate, UserLogin, UserResponse, Token
-from backend.models.user import User
-from passlib.context import CryptContext
+from backend.models.user import User, UserRole
 from jose import JWTError, jwt
 from datetime import datetime
 
 router = APIRouter()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Resolved principals keyed by token subject (email). Entries are column
+# snapshots rather than ORM instances, so they are never shared between
+# sessions; each hit builds a fresh transient User.
+_principal_cache = TTLCache(ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS, maxsize=settings.PRINCIPAL_CACHE_SIZE)
+_PRINCIPAL_COLUMNS = [column.key for column in User.__table__.columns]
+
+def invalidate_principal(email: str):
+    _principal_cache.invalidate(email)
+
+def principal_cache_stats():
+    return _principal_cache.stats()
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _queue_principal_invalidation(mapper, connection, target):
+    session = object_session(target)
+    if session is None:
+        return
+    stale = session.info.setdefault("stale_principals", set())
+    stale.add(target.email)
+    # A changed email leaves the old subject cached too
+    stale.update(inspect(target).attrs.email.history.deleted or ())
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_stale_principals(session):
+    for email in session.info.pop("stale_principals", ()):
+        invalidate_principal(email)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_principals(session):
+    session.info.pop("stale_principals", None)
+
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+def _hasher_busy_exception():
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication service is busy, please retry",
+        headers={"Retry-After": "1"},
+    )
+
 def create_access_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
     if expires_delta:
@@ -30,7 +71,7 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -44,25 +85,44 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.email == email).first()
-    if user is None:
+    snapshot = _principal_cache.get(email)
+    if snapshot is None:
+        # With embedded claims the lookup goes straight to the primary key
+        user_id = payload.get("uid")
+        if user_id is not None:
+            user = await db.get(User, user_id)
+        else:
+            user = await db.scalar(select(User).where(User.email == email))
+        if user is None or user.email != email:
+            raise credentials_exception
+        snapshot = {key: getattr(user, key) for key in _PRINCIPAL_COLUMNS}
+        _principal_cache.set(email, snapshot)
+    
+    if not snapshot["is_active"]:
+        raise credentials_exception
+    # Tokens minted before a role change stop working immediately
+    role = payload.get("role")
+    if role is not None and role != snapshot["role"].value:
         raise credentials_exception
-    return user
+    return User(**snapshot)
 
 @router.post("/register", response_model=UserResponse)
-def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     # Check if user already exists
-    db_user = db.query(User).filter(User.email == user.email).first()
+    db_user = await db.scalar(select(User).where(User.email == user.email))
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
     # Check if username already exists
-    db_user = db.query(User).filter(User.username == user.username).first()
+    db_user = await db.scalar(select(User).where(User.username == user.username))
     if db_user:
         raise HTTPException(status_code=400, detail="Username already taken")
     
     # Create new user
-    hashed_password = get_password_hash(user.password)
+    try:
+        hashed_password = await hash_password(user.password)
+    except PasswordHasherBusy:
+        raise _hasher_busy_exception()
     db_user = User(
         email=user.email,
         username=user.username,
@@ -71,26 +131,46 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
         role=user.role
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 @router.post("/login", response_model=Token)
-def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == user_credentials.email).first()
-    if not user or not verify_password(user_credentials.password, user.hashed_password):
+async def login(user_credentials: UserLogin, db: AsyncSession = Depends(get_db)):
+    user = await db.scalar(select(User).where(User.email == user_credentials.email))
+    valid = False
+    if user:
+        try:
+            valid, new_hash = await verify_and_update_password(user_credentials.password, user.hashed_password)
+        except PasswordHasherBusy:
+            raise _hasher_busy_exception()
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Transparently upgrade hashes made with a different bcrypt cost
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+    
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    claims = {"sub": user.email}
+    if settings.TOKEN_EMBED_CLAIMS:
+        claims.update({"uid": user.id, "role": user.role.value})
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data=claims, expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: User = Depends(get_current_user)):
     return current_user
+
+@router.get("/cache-stats")
+async def get_principal_cache_stats(current_user: User = Depends(get_current_user)):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return principal_cache_stats()
@@ -0,0 +1,113 @@
+from datetime import date, timedelta
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.core.cache import TTLCache, table_version
+from backend.core.conditional import ConditionalGet
+from backend.core.config import settings
+from backend.core.database import get_db
+from backend.schemas.dashboard import DashboardStats, ExpiringItems
+from backend.models.employee import Employee
+from backend.models.department import Department
+from backend.models.absence import Absence, AbsenceStatus
+from backend.models.performance import Performance, PerformanceRating
+from backend.models.document import Document
+from backend.models.training import Training
+from backend.routers.auth import get_current_user
+from backend.models.user import User
+from backend.services.expiry import EXPIRY_TARGETS, expiry_sweeper, live_expiring
+
+router = APIRouter()
+
+# Keyed on the versions of the tables the stats are computed from, so any
+# committed write to one of them makes the cached entry unreachable.
+_stats_cache = TTLCache(ttl=settings.CACHE_TTL_SECONDS, maxsize=8)
+_STATS_TABLES = ("employees", "departments", "absences", "performance")
+
+def _percentage(count: int, total: int) -> int:
+    return int(count * 100 / total + 0.5) if total else 0
+
+async def _compute_stats(db: AsyncSession) -> DashboardStats:
+    total_employees, active_employees = (await db.execute(select(
+        func.count(Employee.id),
+        func.count(case((Employee.is_active == True, 1))),
+    ))).one()
+
+    pending_absences = await db.scalar(
+        select(func.count(Absence.id)).where(Absence.status == AbsenceStatus.PENDING)
+    )
+
+    department_rows = (await db.execute(
+        select(Department.id, Department.name, func.count(Employee.id))
+        .outerjoin(Employee, Employee.department_id == Department.id)
+        .where(Department.is_active == True)
+        .group_by(Department.id, Department.name)
+        .order_by(Department.id)
+    )).all()
+
+    rating_counts = dict((await db.execute(
+        select(Performance.overall_rating, func.count(Performance.id))
+        .group_by(Performance.overall_rating)
+    )).all())
+    total_reviews = sum(rating_counts.values())
+
+    return DashboardStats(
+        total_employees=total_employees,
+        active_employees=active_employees,
+        pending_absences=pending_absences,
+        department_distribution=[
+            {
+                "department_id": dept_id,
+                "name": name,
+                "count": count,
+                "percentage": _percentage(count, total_employees),
+            }
+            for dept_id, name, count in department_rows
+        ],
+        performance_distribution=[
+            {
+                "rating": rating.value,
+                "count": rating_counts.get(rating, 0),
+                "percentage": _percentage(rating_counts.get(rating, 0), total_reviews),
+            }
+            for rating in PerformanceRating
+        ],
+    )
+
+@router.get("/stats", response_model=DashboardStats, dependencies=[Depends(ConditionalGet(Employee, Department, Absence, Performance))])
+async def get_dashboard_stats(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    key = ("stats",) + table_version(*_STATS_TABLES)
+    stats = _stats_cache.get(key)
+    if stats is None:
+        stats = await _compute_stats(db)
+        _stats_cache.set(key, stats)
+    return stats
+
+def _expiring_key(request: Request):
+    # The window moves daily and the body reports the last sweep
+    return date.today(), expiry_sweeper.last_run
+
+@router.get("/expiring", response_model=ExpiringItems,
+            dependencies=[Depends(ConditionalGet(Document, Training, key=_expiring_key))])
+async def get_expiring_items(
+    days: int = Query(settings.EXPIRY_WARNING_DAYS, ge=0, le=366),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Documents and training records that are still valid but expire within ``days``, soonest first."""
+    today = date.today()
+    items = {}
+    for target in EXPIRY_TARGETS:
+        model = target.model
+        items[target.name] = (await db.execute(
+            select(model)
+            .where(*live_expiring(target, today, today + timedelta(days=days)))
+            .order_by(model.expiry_date, model.id)
+            .limit(limit)
+        )).scalars().all()
+    return ExpiringItems(as_of=today, days=days, documents=items["documents"], training=items["training"],
+                         last_sweep=expiry_sweeper.last_run)
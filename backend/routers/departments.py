@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
+from backend.core.conditional import PublicConditionalGet
 from backend.core.database import get_db
+from backend.core.pagination import PageParams, paginate
 from backend.schemas.department import DepartmentCreate, DepartmentUpdate, DepartmentResponse
 from backend.models.department import Department
 from backend.routers.auth import get_current_user
@@ -9,19 +12,23 @@ from backend.models.user import User
 
 router = APIRouter()
 
-@router.get("/", response_model=List[DepartmentResponse])
-def get_departments(db: Session = Depends(get_db)):
-    departments = db.query(Department).filter(Department.is_active == True).all()
-    return departments
+@router.get("/", response_model=List[DepartmentResponse], dependencies=[Depends(PublicConditionalGet(Department))])
+async def get_departments(
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    stmt = select(Department).where(Department.is_active == True)
+    return await paginate(db, stmt, page, response, Department.name, Department.id, schema=DepartmentResponse)
 
 @router.post("/", response_model=DepartmentResponse)
-def create_department(
+async def create_department(
     department: DepartmentCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     db_dept = Department(**department.dict())
     db.add(db_dept)
-    db.commit()
-    db.refresh(db_dept)
+    await db.commit()
+    await db.refresh(db_dept)
     return db_dept
@@ -1,27 +1,175 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+import os
+from mimetypes import guess_type
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import FileResponse
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date
+from backend.core.conditional import ConditionalGet
 from backend.core.database import get_db
-from backend.schemas.document import DocumentCreate, DocumentUpdate, DocumentResponse
-from backend.models.document import Document
+from backend.core.expand import Expand, Expansion
+from backend.core.export import ExportFormat, export_table
+from backend.core.storage import RangeFileResponse, content_store
+from backend.core.uploads import receive_upload
+from backend.core.pagination import PageParams, paginate
+from backend.schemas.document import DocumentCreate, DocumentUpload, DocumentUpdate, DocumentResponse, DocumentExpandedResponse, DocumentAnalysisResponse
+from backend.models.document import Document, DocumentStatus, DocumentType
+from backend.models.document_analysis import DocumentAnalysis
+from backend.models.employee import Employee
+from backend.models.department import Department
 from backend.routers.auth import get_current_user
+from backend.services.document_processing import document_pipeline, request_analysis
 from backend.models.user import User
 
 router = APIRouter()
 
-@router.get("/", response_model=List[DocumentResponse])
-def get_documents(db: Session = Depends(get_db)):
-    documents = db.query(Document).all()
-    return documents
+@router.get("/", response_model=List[DocumentExpandedResponse], response_model_exclude_unset=True,
+            dependencies=[Depends(ConditionalGet(Document, Employee, Department))])
+async def get_documents(
+    response: Response,
+    employee_id: Optional[int] = None,
+    status: Optional[DocumentStatus] = None,
+    document_type: Optional[DocumentType] = None,
+    expires_from: Optional[date] = None,
+    expires_to: Optional[date] = None,
+    page: PageParams = Depends(),
+    expand: Expansion = Depends(Expand(Document, "employee", "employee.department")),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    stmt = select(Document)
+    if employee_id is not None:
+        stmt = stmt.where(Document.employee_id == employee_id)
+    if status is not None:
+        stmt = stmt.where(Document.status == status)
+    if document_type is not None:
+        stmt = stmt.where(Document.document_type == document_type)
+    if expires_from is not None:
+        stmt = stmt.where(Document.expiry_date >= expires_from)
+    if expires_to is not None:
+        stmt = stmt.where(Document.expiry_date <= expires_to)
+    return await paginate(db, stmt, page, response, Document.id, schema=DocumentResponse, expand=expand)
+
+@router.get("/export")
+async def export_documents(
+    format: ExportFormat = ExportFormat.CSV,
+    current_user: User = Depends(get_current_user)
+):
+    return export_table(Document, format)
 
 @router.post("/", response_model=DocumentResponse)
-def create_document(
+async def create_document(
     document: DocumentCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     db_document = Document(**document.dict())
     db.add(db_document)
-    db.commit()
-    db.refresh(db_document)
+    await db.commit()
+    await db.refresh(db_document)
     return db_document
+
+@router.post("/upload", response_model=DocumentResponse)
+async def upload_document(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Create a document from a multipart form: a ``file`` part plus the metadata fields."""
+    upload = await receive_upload(request, content_store)
+    if upload.writer is None:
+        raise HTTPException(status_code=400, detail="Expected a file upload in the 'file' field")
+    try:
+        # Empty form fields mean "not provided"
+        metadata = DocumentUpload(**{k: v for k, v in upload.fields.items() if v != ""})
+    except ValidationError as exc:
+        upload.writer.abort()
+        raise RequestValidationError(exc.errors())
+    blob = await run_in_threadpool(upload.writer.commit)
+    
+    file_name = os.path.basename((upload.filename or "").replace("\\", "/"))[:200] or blob.digest
+    db_document = Document(
+        **metadata.dict(),
+        file_path=blob.path,
+        file_name=file_name,
+        file_size=blob.size,
+        mime_type=upload.content_type or guess_type(file_name)[0] or "application/octet-stream",
+    )
+    db.add(db_document)
+    await db.flush()
+    # Parsed in the background; the upload returns as soon as the file is stored
+    await request_analysis(db, db_document)
+    await db.commit()
+    await db.refresh(db_document)
+    document_pipeline.enqueue(db_document.id)
+    return db_document
+
+@router.get("/{document_id}/download")
+async def download_document(
+    document_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    document = await db.get(Document, document_id)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+    path = content_store.resolve(document.file_path)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Document file not found")
+    
+    headers = {"Cache-Control": "private, no-cache"}
+    digest = content_store.digest_of(document.file_path)
+    if digest is not None:
+        # Content-addressed files never change, so the hash is a strong validator
+        headers["ETag"] = f'"{digest}"'
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+    return RangeFileResponse(path, request.headers, headers=headers,
+                             media_type=document.mime_type, filename=document.file_name)
+
+@router.get("/{document_id}/analysis", response_model=DocumentAnalysisResponse,
+            dependencies=[Depends(ConditionalGet(DocumentAnalysis))])
+async def get_document_analysis(
+    document_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    analysis = await db.get(DocumentAnalysis, document_id)
+    if analysis is None:
+        if await db.get(Document, document_id) is None:
+            raise HTTPException(status_code=404, detail="Document not found")
+        raise HTTPException(status_code=404, detail="Document has not been analysed")
+    return analysis
+
+@router.post("/{document_id}/analysis", response_model=DocumentAnalysisResponse, status_code=202)
+async def reanalyse_document(
+    document_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Queue (or re-queue) background analysis, e.g. after a failure."""
+    document = await db.get(Document, document_id)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+    analysis = await request_analysis(db, document)
+    await db.commit()
+    await db.refresh(analysis)
+    document_pipeline.enqueue(document_id)
+    return analysis
+
+@router.get("/{document_id}/thumbnail")
+async def get_document_thumbnail(
+    document_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    analysis = await db.get(DocumentAnalysis, document_id)
+    path = content_store.resolve(analysis.thumbnail_path) if analysis and analysis.thumbnail_path else None
+    if path is None:
+        raise HTTPException(status_code=404, detail="Thumbnail not found")
+    return FileResponse(path, media_type="image/jpeg", headers={"Cache-Control": "private, max-age=3600"})
@@ -1,89 +1,220 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+import csv
+import io
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date
+from backend.core.conditional import ConditionalGet, date_param
 from backend.core.database import get_db
-from backend.schemas.employee import EmployeeCreate, EmployeeUpdate, EmployeeResponse
+from backend.core.expand import Expand, Expansion
+from backend.core.export import ExportFormat, export_table
+from backend.core.pagination import PageParams, paginate
+from backend.schemas.employee import EmployeeCreate, EmployeeUpdate, EmployeeResponse, EmployeeExpandedResponse, EmployeeImportResult, ReportingLineEntry
+from backend.schemas.absence import LeaveBalanceResponse
+from backend.schemas.ssp import EmployeeSSPResponse
+from backend.models.absence import Absence
 from backend.models.employee import Employee
+from backend.models.department import Department
+from backend.models.leave_balance import LeaveBalance
+from backend.services.employee_import import import_employees
+from backend.services.org_chart import (
+    ReportingCycleError, attach_employees, detach_employee, get_management_chain, get_reports, move_employee
+)
+from backend.services.leave_balance import get_balances, leave_year_key, leave_year_of
+from backend.services.ssp import get_employee_ssp
 from backend.routers.auth import get_current_user
 from backend.models.user import User
 
 router = APIRouter()
 
-@router.get("/", response_model=List[EmployeeResponse])
-def get_employees(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+expand_employee = Expand(Employee, "department", "manager", "manager.department", "user")
+
+@router.get("/", response_model=List[EmployeeExpandedResponse], response_model_exclude_unset=True,
+            dependencies=[Depends(ConditionalGet(Employee, Department, User))])
+async def get_employees(
+    response: Response,
+    page: PageParams = Depends(),
+    expand: Expansion = Depends(expand_employee),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, select(Employee), page, response, Employee.id, schema=EmployeeResponse, expand=expand)
+
+@router.get("/export")
+async def export_employees(
+    format: ExportFormat = ExportFormat.CSV,
+    current_user: User = Depends(get_current_user)
+):
+    return export_table(Employee, format)
+
+@router.get("/{employee_id}", response_model=EmployeeExpandedResponse, response_model_exclude_unset=True,
+            dependencies=[Depends(ConditionalGet(Employee, Department, User))])
+async def get_employee(
+    employee_id: int,
+    expand: Expansion = Depends(expand_employee),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    employee = await db.get(Employee, employee_id, options=expand.options)
+    if employee is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    return expand.serialize(employee)
+
+@router.get("/{employee_id}/reports", response_model=List[ReportingLineEntry], dependencies=[Depends(ConditionalGet(Employee))])
+async def get_employee_reports(
+    employee_id: int,
+    depth: Optional[int] = Query(None, ge=1, description="1 for direct reports only; all levels when omitted"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if await db.get(Employee, employee_id) is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    return await get_reports(db, employee_id, depth)
+
+@router.get("/{employee_id}/chain", response_model=List[ReportingLineEntry], dependencies=[Depends(ConditionalGet(Employee))])
+async def get_employee_chain(
+    employee_id: int,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    employees = db.query(Employee).offset(skip).limit(limit).all()
-    return employees
+    if await db.get(Employee, employee_id) is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    return await get_management_chain(db, employee_id)
 
-@router.get("/{employee_id}", response_model=EmployeeResponse)
-def get_employee(
+@router.get("/{employee_id}/leave-balance", response_model=LeaveBalanceResponse,
+            dependencies=[Depends(ConditionalGet(Employee, LeaveBalance, key=leave_year_key))])
+async def get_employee_leave_balance(
     employee_id: int,
-    db: Session = Depends(get_db),
+    year: Optional[int] = Query(None, ge=1900, le=2999, description="Leave year by the calendar year it starts in; defaults to the current one"),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = await db.get(Employee, employee_id)
     if employee is None:
         raise HTTPException(status_code=404, detail="Employee not found")
-    return employee
+    balances = await get_balances(db, [employee], year if year is not None else leave_year_of(date.today()))
+    return balances[0]
+
+@router.get("/{employee_id}/ssp", response_model=EmployeeSSPResponse,
+            dependencies=[Depends(ConditionalGet(Employee, Absence, key=date_param("to")))])
+async def get_employee_statutory_sick_pay(
+    employee_id: int,
+    date_from: Optional[date] = Query(None, alias="from", description="Defaults to the whole sickness history"),
+    date_to: Optional[date] = Query(None, alias="to", description="Defaults to today"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Periods of incapacity for work with the waiting days and SSP due in ``[from, to]``."""
+    date_to = date_to or date.today()
+    if date_from is not None and date_to < date_from:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    if await db.get(Employee, employee_id) is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    return await get_employee_ssp(db, employee_id, date_from, date_to)
 
 @router.post("/", response_model=EmployeeResponse)
-def create_employee(
+async def create_employee(
     employee: EmployeeCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     # Check if employee_id already exists
-    existing_employee = db.query(Employee).filter(Employee.employee_id == employee.employee_id).first()
+    existing_employee = await db.scalar(select(Employee).where(Employee.employee_id == employee.employee_id))
     if existing_employee:
         raise HTTPException(status_code=400, detail="Employee ID already exists")
     
     db_employee = Employee(**employee.dict())
     db.add(db_employee)
-    db.commit()
-    db.refresh(db_employee)
+    await db.flush()
+    await attach_employees(db, [(db_employee.id, db_employee.manager_id)])
+    await db.commit()
+    await db.refresh(db_employee)
     return db_employee
 
+def _csv_rows(text_stream):
+    # Empty CSV cells mean "not provided"
+    for row in csv.DictReader(text_stream):
+        yield {key: (value if value != "" else None) for key, value in row.items()}
+
+@router.post("/bulk", response_model=EmployeeImportResult)
+async def bulk_create_employees(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Import employees from a JSON array, a text/csv body or a multipart CSV ``file``."""
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=400, detail="Expected a CSV upload in the 'file' field")
+        rows = _csv_rows(io.TextIOWrapper(upload.file, encoding="utf-8-sig"))
+    elif content_type.startswith("text/csv"):
+        try:
+            text = (await request.body()).decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise HTTPException(status_code=400, detail="CSV body must be UTF-8 encoded")
+        rows = _csv_rows(io.StringIO(text))
+    else:
+        try:
+            rows = await request.json()
+        except ValueError:  # json.JSONDecodeError, or a body that is not UTF-8
+            raise HTTPException(status_code=400, detail="Request body is not valid JSON")
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise HTTPException(status_code=400, detail="Expected a JSON array of employee objects")
+    return await import_employees(db, rows)
+
 @router.put("/{employee_id}", response_model=EmployeeResponse)
-def update_employee(
+async def update_employee(
     employee_id: int,
     employee: EmployeeUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    db_employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    db_employee = await db.get(Employee, employee_id)
     if db_employee is None:
         raise HTTPException(status_code=404, detail="Employee not found")
     
-    for field, value in employee.dict(exclude_unset=True).items():
+    changes = employee.dict(exclude_unset=True)
+    if "manager_id" in changes and changes["manager_id"] != db_employee.manager_id:
+        try:
+            await move_employee(db, employee_id, changes["manager_id"])
+        except ReportingCycleError:
+            raise HTTPException(status_code=400, detail="An employee cannot report to themselves or to one of their reports")
+    
+    for field, value in changes.items():
         setattr(db_employee, field, value)
     
-    db.commit()
-    db.refresh(db_employee)
+    await db.commit()
+    await db.refresh(db_employee)
     return db_employee
 
 @router.delete("/{employee_id}")
-def delete_employee(
+async def delete_employee(
     employee_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = await db.get(Employee, employee_id)
     if employee is None:
         raise HTTPException(status_code=404, detail="Employee not found")
     
-    db.delete(employee)
-    db.commit()
+    await detach_employee(db, employee_id)
+    await db.delete(employee)
+    await db.commit()
     return {"message": "Employee deleted successfully"}
 
-@router.get("/department/{department_id}", response_model=List[EmployeeResponse])
-def get_employees_by_department(
+@router.get("/department/{department_id}", response_model=List[EmployeeExpandedResponse], response_model_exclude_unset=True,
+            dependencies=[Depends(ConditionalGet(Employee, Department, User))])
+async def get_employees_by_department(
     department_id: int,
-    db: Session = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(),
+    expand: Expansion = Depends(expand_employee),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    employees = db.query(Employee).filter(Employee.department_id == department_id).all()
-    return employees
+    stmt = select(Employee).where(Employee.department_id == department_id)
+    return await paginate(db, stmt, page, response, Employee.id, schema=EmployeeResponse, expand=expand)
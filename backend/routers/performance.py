@@ -1,27 +1,48 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
+from backend.core.conditional import ConditionalGet
 from backend.core.database import get_db
-from backend.schemas.performance import PerformanceCreate, PerformanceUpdate, PerformanceResponse
+from backend.core.expand import Expand, Expansion
+from backend.core.export import ExportFormat, export_table
+from backend.core.pagination import PageParams, paginate
+from backend.schemas.performance import PerformanceCreate, PerformanceUpdate, PerformanceResponse, PerformanceExpandedResponse
 from backend.models.performance import Performance
+from backend.models.employee import Employee
+from backend.models.department import Department
 from backend.routers.auth import get_current_user
 from backend.models.user import User
 
 router = APIRouter()
 
-@router.get("/", response_model=List[PerformanceResponse])
-def get_performances(db: Session = Depends(get_db)):
-    performances = db.query(Performance).all()
-    return performances
+@router.get("/", response_model=List[PerformanceExpandedResponse], response_model_exclude_unset=True,
+            dependencies=[Depends(ConditionalGet(Performance, Employee, Department))])
+async def get_performances(
+    response: Response,
+    page: PageParams = Depends(),
+    expand: Expansion = Depends(Expand(Performance, "employee", "employee.department", "reviewer")),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, select(Performance), page, response, Performance.review_date, Performance.id,
+                          schema=PerformanceResponse, expand=expand)
+
+@router.get("/export")
+async def export_performance(
+    format: ExportFormat = ExportFormat.CSV,
+    current_user: User = Depends(get_current_user)
+):
+    return export_table(Performance, format)
 
 @router.post("/", response_model=PerformanceResponse)
-def create_performance(
+async def create_performance(
     performance: PerformanceCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     db_performance = Performance(**performance.dict())
     db.add(db_performance)
-    db.commit()
-    db.refresh(db_performance)
+    await db.commit()
+    await db.refresh(db_performance)
     return db_performance
@@ -0,0 +1,75 @@
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from datetime import date
+from backend.core.cache import TTLCache, table_version
+from backend.core.conditional import ConditionalGet, date_param
+from backend.core.config import settings
+from backend.core.database import get_db
+from backend.schemas.report import AbsenceAnalytics
+from backend.schemas.ssp import SSPPayrollRun
+from backend.models.absence import Absence
+from backend.models.employee import Employee
+from backend.models.department import Department
+from backend.routers.auth import get_current_user
+from backend.models.user import User
+from backend.services.absence_analytics import compute_absence_analytics, select_view
+from backend.services.ssp import run_ssp_payroll
+
+router = APIRouter()
+
+# Computed arrays per (window, as-of date), keyed on the table versions too so
+# a committed absence or employee write makes the entry unreachable. Filters
+# are applied to the cached arrays per request.
+_analytics_cache = TTLCache(ttl=settings.CACHE_TTL_SECONDS, maxsize=64)
+_ANALYTICS_TABLES = ("absences", "employees", "departments")
+_ssp_cache = TTLCache(ttl=settings.CACHE_TTL_SECONDS, maxsize=64)
+_SSP_TABLES = ("absences", "employees")
+
+@router.get("/absence-analytics", response_model=AbsenceAnalytics,
+            dependencies=[Depends(ConditionalGet(Absence, Employee, Department, key=date_param("as_of")))])
+async def get_absence_analytics(
+    response: Response,
+    weeks: int = Query(settings.ABSENCE_ANALYTICS_WINDOW_WEEKS, ge=1, le=260),
+    as_of: Optional[date] = None,
+    department_id: Optional[int] = None,
+    min_bradford: float = Query(0.0, ge=0),
+    limit: Optional[int] = Query(None, ge=1),
+    include_inactive: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Sickness spells, days, Bradford factor and absence rate over the ``weeks`` ending ``as_of``.
+
+    Employees come back ranked by Bradford factor, departments rolled up,
+    both as parallel arrays.
+    """
+    as_of = as_of or date.today()
+    key = (weeks, as_of, include_inactive) + table_version(*_ANALYTICS_TABLES)
+    analytics = _analytics_cache.get(key)
+    if analytics is None:
+        analytics = await compute_absence_analytics(db, as_of, weeks, include_inactive)
+        _analytics_cache.set(key, analytics)
+    body = orjson.dumps(select_view(analytics, department_id, min_bradford, limit), option=orjson.OPT_SERIALIZE_NUMPY)
+    # A directly returned response does not inherit the injected one's headers
+    return Response(content=body, media_type="application/json", headers=dict(response.headers))
+
+@router.get("/ssp", response_model=SSPPayrollRun, dependencies=[Depends(ConditionalGet(Absence, Employee))])
+async def get_ssp_payroll(
+    response: Response,
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Statutory Sick Pay due to every employee for the pay period ``[from, to]``."""
+    if date_to < date_from:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    key = (date_from, date_to) + table_version(*_SSP_TABLES)
+    body = _ssp_cache.get(key)
+    if body is None:
+        payroll = await run_ssp_payroll(db, date_from, date_to)
+        body = orjson.dumps(payroll, option=orjson.OPT_SERIALIZE_NUMPY)
+        _ssp_cache.set(key, body)
+    return Response(content=body, media_type="application/json", headers=dict(response.headers))
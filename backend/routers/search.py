@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from backend.core.conditional import ConditionalGet
+from backend.core.database import get_db
+from backend.schemas.search import SearchEntityType, SearchResults
+from backend.models.document import Document
+from backend.models.employee import Employee
+from backend.models.training import Training
+from backend.services.search import match_terms, search
+from backend.routers.auth import get_current_user
+from backend.models.user import User
+
+router = APIRouter()
+
+@router.get("/", response_model=SearchResults, dependencies=[Depends(ConditionalGet(Employee, Document, Training))])
+async def search_all(
+    q: str = Query(..., min_length=1, max_length=200),
+    type: Optional[List[SearchEntityType]] = Query(None, description="Restrict results to these entity types"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=10000),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if not match_terms(q):
+        raise HTTPException(status_code=400, detail="Search query must contain letters or digits")
+    total, hits = await search(db, q, [t.value for t in type] if type else None, limit, offset)
+    next_offset = offset + limit if offset + limit < total else None
+    return {"query": q, "total": total, "results": hits, "next_offset": next_offset}
@@ -1,27 +1,101 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date
+from backend.core.cache import TTLCache, table_version
+from backend.core.conditional import ConditionalGet, today
+from backend.core.config import settings
 from backend.core.database import get_db
-from backend.schemas.training import TrainingCreate, TrainingUpdate, TrainingResponse
-from backend.models.training import Training
+from backend.core.expand import Expand, Expansion
+from backend.core.export import ExportFormat, export_table
+from backend.core.pagination import PageParams, paginate
+from backend.schemas.training import TrainingCreate, TrainingUpdate, TrainingResponse, TrainingExpandedResponse, TrainingComplianceMatrix
+from backend.models.training import Training, TrainingStatus, TrainingType
+from backend.models.employee import Employee
+from backend.models.department import Department
 from backend.routers.auth import get_current_user
 from backend.models.user import User
+from backend.services.training_compliance import build_compliance_matrix
 
 router = APIRouter()
 
-@router.get("/", response_model=List[TrainingResponse])
-def get_trainings(db: Session = Depends(get_db)):
-    trainings = db.query(Training).all()
-    return trainings
+# Encoded matrices keyed on the training and employee table versions, so any
+# committed write to either makes the cached entry unreachable.
+_compliance_cache = TTLCache(ttl=settings.CACHE_TTL_SECONDS, maxsize=64)
+_COMPLIANCE_TABLES = ("training", "employees")
+
+@router.get("/", response_model=List[TrainingExpandedResponse], response_model_exclude_unset=True,
+            dependencies=[Depends(ConditionalGet(Training, Employee, Department))])
+async def get_trainings(
+    response: Response,
+    employee_id: Optional[int] = None,
+    status: Optional[TrainingStatus] = None,
+    training_type: Optional[TrainingType] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    expires_from: Optional[date] = None,
+    expires_to: Optional[date] = None,
+    page: PageParams = Depends(),
+    expand: Expansion = Depends(Expand(Training, "employee", "employee.department")),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    stmt = select(Training)
+    if employee_id is not None:
+        stmt = stmt.where(Training.employee_id == employee_id)
+    if status is not None:
+        stmt = stmt.where(Training.status == status)
+    if training_type is not None:
+        stmt = stmt.where(Training.training_type == training_type)
+    if due_from is not None:
+        stmt = stmt.where(Training.due_date >= due_from)
+    if due_to is not None:
+        stmt = stmt.where(Training.due_date <= due_to)
+    if expires_from is not None:
+        stmt = stmt.where(Training.expiry_date >= expires_from)
+    if expires_to is not None:
+        stmt = stmt.where(Training.expiry_date <= expires_to)
+    return await paginate(db, stmt, page, response, Training.id, schema=TrainingResponse, expand=expand)
+
+@router.get("/compliance", response_model=TrainingComplianceMatrix,
+            dependencies=[Depends(ConditionalGet(Training, Employee, key=today))])
+async def get_training_compliance(
+    response: Response,
+    department_id: Optional[int] = None,
+    include_inactive: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Employee × mandatory-course status matrix; see ``statuses`` for the cell codes."""
+    as_of = date.today()
+    key = (department_id, include_inactive, as_of) + table_version(*_COMPLIANCE_TABLES)
+    body = _compliance_cache.get(key)
+    if body is None:
+        matrix = await build_compliance_matrix(db, as_of, department_id, include_inactive)
+        # Cached already encoded: a hit is a dictionary lookup, with no
+        # validation or serialization of the 10^5-cell body
+        body = orjson.dumps(matrix, option=orjson.OPT_SERIALIZE_NUMPY)
+        _compliance_cache.set(key, body)
+    # A directly returned response does not inherit the injected one's headers
+    return Response(content=body, media_type="application/json", headers=dict(response.headers))
+
+@router.get("/export")
+async def export_training(
+    format: ExportFormat = ExportFormat.CSV,
+    current_user: User = Depends(get_current_user)
+):
+    return export_table(Training, format)
 
 @router.post("/", response_model=TrainingResponse)
-def create_training(
+async def create_training(
     training: TrainingCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     db_training = Training(**training.dict())
     db.add(db_training)
-    db.commit()
-    db.refresh(db_training)
+    await db.commit()
+    await db.refresh(db_training)
     return db_training
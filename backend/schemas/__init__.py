@@ -1,17 +1,29 @@
 from .user import UserCreate, UserLogin, UserResponse, Token
-from .employee import EmployeeCreate, EmployeeUpdate, EmployeeResponse
-from .department import DepartmentCreate, DepartmentUpdate, DepartmentResponse
-from .absence import AbsenceCreate, AbsenceUpdate, AbsenceResponse
-from .performance import PerformanceCreate, PerformanceUpdate, PerformanceResponse
-from .training import TrainingCreate, TrainingUpdate, TrainingResponse
-from .document import DocumentCreate, DocumentUpdate, DocumentResponse
+from .employee import EmployeeCreate, EmployeeUpdate, EmployeeResponse, EmployeeImportResult, EmployeeSummary, EmployeeExpandedResponse, ReportingLineEntry
+from .department import DepartmentCreate, DepartmentUpdate, DepartmentResponse, DepartmentSummary
+from .absence import AbsenceCreate, AbsenceUpdate, AbsenceResponse, AbsenceExpandedResponse, AbsenceCalendarResponse, LeaveBalanceResponse, AbsenceDaysRecompute
+from .performance import PerformanceCreate, PerformanceUpdate, PerformanceResponse, PerformanceExpandedResponse
+from .training import TrainingCreate, TrainingUpdate, TrainingResponse, TrainingExpandedResponse, ComplianceStatus, ComplianceEmployees, TrainingComplianceMatrix
+from .document import DocumentCreate, DocumentUpload, DocumentUpdate, DocumentResponse, DocumentExpandedResponse, DocumentAnalysisResponse
+from .dashboard import DashboardStats, DepartmentStat, RatingStat, ExpirySweepSummary, ExpiringItems
+from .search import SearchEntityType, SearchHit, SearchResults
+from .report import AbsenceTotals, DepartmentAbsenceStats, EmployeeAbsenceStats, AbsenceAnalytics
+from .ssp import SSPPeriod, SSPLinkedPeriod, EmployeeSSPResponse, SSPPayrollEmployees, SSPPayrollTotals, SSPPayrollRun
 
 __all__ = [
     "UserCreate", "UserLogin", "UserResponse", "Token",
-    "EmployeeCreate", "EmployeeUpdate", "EmployeeResponse",
-    "DepartmentCreate", "DepartmentUpdate", "DepartmentResponse",
-    "AbsenceCreate", "AbsenceUpdate", "AbsenceResponse",
-    "PerformanceCreate", "PerformanceUpdate", "PerformanceResponse",
-    "TrainingCreate", "TrainingUpdate", "TrainingResponse",
-    "DocumentCreate", "DocumentUpdate", "DocumentResponse"
+    "EmployeeCreate", "EmployeeUpdate", "EmployeeResponse", "EmployeeImportResult",
+    "EmployeeSummary", "EmployeeExpandedResponse", "ReportingLineEntry",
+    "DepartmentCreate", "DepartmentUpdate", "DepartmentResponse", "DepartmentSummary",
+    "AbsenceCreate", "AbsenceUpdate", "AbsenceResponse", "AbsenceExpandedResponse", "AbsenceCalendarResponse",
+    "LeaveBalanceResponse", "AbsenceDaysRecompute",
+    "PerformanceCreate", "PerformanceUpdate", "PerformanceResponse", "PerformanceExpandedResponse",
+    "TrainingCreate", "TrainingUpdate", "TrainingResponse", "TrainingExpandedResponse",
+    "ComplianceStatus", "ComplianceEmployees", "TrainingComplianceMatrix",
+    "DocumentCreate", "DocumentUpload", "DocumentUpdate", "DocumentResponse", "DocumentExpandedResponse",
+    "DocumentAnalysisResponse",
+    "DashboardStats", "DepartmentStat", "RatingStat", "ExpirySweepSummary", "ExpiringItems",
+    "SearchEntityType", "SearchHit", "SearchResults",
+    "AbsenceTotals", "DepartmentAbsenceStats", "EmployeeAbsenceStats", "AbsenceAnalytics",
+    "SSPPeriod", "SSPLinkedPeriod", "EmployeeSSPResponse", "SSPPayrollEmployees", "SSPPayrollTotals", "SSPPayrollRun"
 ]
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import date, datetime
+from backend.schemas.employee import EmployeeSummary
 from backend.models.absence import AbsenceType, AbsenceStatus
 
 class AbsenceBase(BaseModel):
@@ -13,13 +14,18 @@ class AbsenceBase(BaseModel):
     notes: Optional[str] = None
 
 class AbsenceCreate(AbsenceBase):
-    pass
+    # Working days between the dates when omitted; checked against them otherwise
+    total_days: Optional[float] = None
+    start_half_day: bool = False
+    end_half_day: bool = False
 
 class AbsenceUpdate(BaseModel):
     absence_type: Optional[AbsenceType] = None
     start_date: Optional[date] = None
     end_date: Optional[date] = None
     total_days: Optional[float] = None
+    start_half_day: bool = False
+    end_half_day: bool = False
     reason: Optional[str] = None
     notes: Optional[str] = None
     status: Optional[AbsenceStatus] = None
@@ -35,3 +41,40 @@ class AbsenceResponse(AbsenceBase):
 
     class Config:
         from_attributes = True
+
+class AbsenceExpandedResponse(AbsenceResponse):
+    employee: Optional[EmployeeSummary] = None
+    approver: Optional[EmployeeSummary] = None
+
+class CalendarSeries(BaseModel):
+    department_id: Optional[int] = None
+    name: Optional[str] = None
+    headcount: int
+    absent: List[int]
+    available: List[int]
+
+class AbsenceCalendarResponse(BaseModel):
+    date_from: date
+    date_to: date
+    days: List[date]
+    departments: List[CalendarSeries]
+    total: CalendarSeries
+
+class LeaveBalanceResponse(BaseModel):
+    employee_id: int
+    leave_year: int
+    year_start: date
+    year_end: date
+    entitlement_days: float
+    carried_over_days: float
+    taken_days: float
+    pending_days: float
+    remaining_days: float  # entitlement + carried over - taken
+    available_days: float  # remaining - pending
+
+class AbsenceDaysRecompute(BaseModel):
+    region: str
+    scanned: int
+    updated: int
+    annual_leave_updated: int
+    duration_seconds: float
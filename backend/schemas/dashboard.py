@@ -0,0 +1,37 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+from datetime import date, datetime
+from backend.schemas.document import DocumentResponse
+from backend.schemas.training import TrainingResponse
+
+class DepartmentStat(BaseModel):
+    department_id: int
+    name: str
+    count: int
+    percentage: int
+
+class RatingStat(BaseModel):
+    rating: str
+    count: int
+    percentage: int
+
+class DashboardStats(BaseModel):
+    total_employees: int
+    active_employees: int
+    pending_absences: int
+    department_distribution: List[DepartmentStat]
+    performance_distribution: List[RatingStat]
+
+class ExpirySweepSummary(BaseModel):
+    as_of: date
+    started_at: datetime
+    duration_seconds: float
+    expired: Dict[str, int]
+    expiring: Dict[str, int]
+
+class ExpiringItems(BaseModel):
+    as_of: date
+    days: int
+    documents: List[DocumentResponse]
+    training: List[TrainingResponse]
+    last_sweep: Optional[ExpirySweepSummary] = None
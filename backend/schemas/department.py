@@ -16,6 +16,13 @@ class DepartmentUpdate(BaseModel):
     manager_id: Optional[int] = None
     is_active: Optional[bool] = None
 
+class DepartmentSummary(BaseModel):
+    id: int
+    name: str
+
+    class Config:
+        from_attributes = True
+
 class DepartmentResponse(DepartmentBase):
     id: int
     is_active: bool
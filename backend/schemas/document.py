@@ -1,7 +1,10 @@
-from pydantic import BaseModel
-from typing import Optional
+import json
+from pydantic import BaseModel, field_validator
+from typing import List, Optional
 from datetime import date, datetime
+from backend.schemas.employee import EmployeeSummary
 from backend.models.document import DocumentType, DocumentStatus
+from backend.models.document_analysis import AnalysisStatus
 
 class DocumentBase(BaseModel):
     employee_id: int
@@ -19,6 +22,16 @@ class DocumentBase(BaseModel):
 class DocumentCreate(DocumentBase):
     pass
 
+class DocumentUpload(BaseModel):
+    # Metadata fields of a multipart upload; file details come from the file part
+    employee_id: int
+    title: str
+    description: Optional[str] = None
+    document_type: DocumentType
+    expiry_date: Optional[date] = None
+    tags: Optional[str] = None
+    version: str = "1.0"
+
 class DocumentUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
@@ -42,3 +55,32 @@ class DocumentResponse(DocumentBase):
 
     class Config:
         from_attributes = True
+
+class DocumentExpandedResponse(DocumentResponse):
+    employee: Optional[EmployeeSummary] = None
+
+class DocumentAnalysisResponse(BaseModel):
+    document_id: int
+    status: AnalysisStatus
+    attempts: int
+    error: Optional[str] = None
+    text: Optional[str] = None
+    page_count: Optional[int] = None
+    detected_expiry_dates: List[date] = []
+    suggested_expiry_date: Optional[date] = None
+    has_thumbnail: bool = False
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    @field_validator("detected_expiry_dates", mode="before")
+    @classmethod
+    def parse_dates(cls, value):
+        # Stored as a JSON list of ISO dates
+        if isinstance(value, str):
+            return json.loads(value)
+        return value or []
+
+    class Config:
+        from_attributes = True
@@ -1,6 +1,8 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import date, datetime
+from backend.schemas.department import DepartmentSummary
+from backend.schemas.user import UserResponse
 
 class EmployeeBase(BaseModel):
     employee_id: str
@@ -43,3 +45,41 @@ class EmployeeResponse(EmployeeBase):
 
     class Config:
         from_attributes = True
+
+class EmployeeSummary(BaseModel):
+    id: int
+    employee_id: str
+    first_name: str
+    last_name: str
+    position: str
+    department_id: Optional[int] = None
+    department: Optional[DepartmentSummary] = None
+
+    class Config:
+        from_attributes = True
+
+class EmployeeExpandedResponse(EmployeeResponse):
+    department: Optional[DepartmentSummary] = None
+    manager: Optional[EmployeeSummary] = None
+    user: Optional[UserResponse] = None
+
+class ReportingLineEntry(BaseModel):
+    id: int
+    employee_id: str
+    first_name: str
+    last_name: str
+    position: str
+    department_id: Optional[int] = None
+    manager_id: Optional[int] = None
+    is_active: bool
+    depth: int
+
+class EmployeeImportError(BaseModel):
+    row: int
+    employee_id: Optional[str] = None
+    errors: List[str]
+
+class EmployeeImportResult(BaseModel):
+    created: int
+    failed: int
+    errors: List[EmployeeImportError]
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from typing import Optional
 from datetime import date, datetime
+from backend.schemas.employee import EmployeeSummary
 from backend.models.performance import PerformanceRating
 
 class PerformanceBase(BaseModel):
@@ -46,3 +47,7 @@ class PerformanceResponse(PerformanceBase):
 
     class Config:
         from_attributes = True
+
+class PerformanceExpandedResponse(PerformanceResponse):
+    employee: Optional[EmployeeSummary] = None
+    reviewer: Optional[EmployeeSummary] = None
@@ -0,0 +1,42 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+
+class AbsenceTotals(BaseModel):
+    headcount: int
+    spells: int
+    days: float
+    available_days: float  # working days in the window, from hire date where later
+    absence_rate: float  # percent of available days lost to sickness
+    mean_bradford: float
+    over_trigger: List[int]  # employees at or above each trigger point
+
+class DepartmentAbsenceStats(BaseModel):
+    # Parallel arrays, one entry per department
+    department_id: List[Optional[int]]
+    name: List[Optional[str]]
+    headcount: List[int]
+    spells: List[int]
+    days: List[float]
+    available_days: List[float]
+    absence_rate: List[float]
+    mean_bradford: List[float]
+    over_trigger: List[List[int]]  # over_trigger[department][trigger point]
+
+class EmployeeAbsenceStats(BaseModel):
+    # Parallel arrays, one entry per employee, highest Bradford factor first
+    id: List[int]
+    department_id: List[Optional[int]]
+    spells: List[int]
+    days: List[float]
+    bradford: List[float]
+    absence_rate: List[float]
+
+class AbsenceAnalytics(BaseModel):
+    as_of: date
+    window_start: date
+    window_weeks: int
+    trigger_points: List[int]
+    totals: AbsenceTotals
+    departments: DepartmentAbsenceStats
+    employees: EmployeeAbsenceStats
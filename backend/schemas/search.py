@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from typing import List, Optional
+import enum
+
+class SearchEntityType(str, enum.Enum):
+    EMPLOYEE = "employee"
+    DOCUMENT = "document"
+    TRAINING = "training"
+
+class SearchHit(BaseModel):
+    type: SearchEntityType
+    id: int
+    title: str
+    snippet: Optional[str] = None
+    rank: float
+
+class SearchResults(BaseModel):
+    query: str
+    total: int
+    results: List[SearchHit]
+    next_offset: Optional[int] = None
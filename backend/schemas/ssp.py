@@ -0,0 +1,54 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+
+class SSPPeriod(BaseModel):
+    # One period of incapacity for work; day counts and amount cover the requested period
+    start_date: date
+    end_date: date
+    linked_to_previous: bool
+    linked_period_start: date
+    qualifying_days: int
+    waiting_days: int
+    paid_days: int
+    amount: float
+
+class SSPLinkedPeriod(BaseModel):
+    start_date: date
+    links_until: date  # a new PIW starting by this date links to it
+    paid_days: int
+    weeks_remaining: float  # of the 28 weeks payable per linked PIW
+
+class EmployeeSSPResponse(BaseModel):
+    employee_id: int
+    period_start: Optional[date] = None
+    period_end: date
+    qualifying_days_per_week: int
+    weekly_earnings: Optional[float] = None
+    periods: List[SSPPeriod]
+    waiting_days: int
+    paid_days: int
+    amount: float
+    current_linked_period: Optional[SSPLinkedPeriod] = None
+
+class SSPPayrollEmployees(BaseModel):
+    # Parallel arrays, one entry per employee with sickness in the period
+    employee_id: List[int]
+    periods: List[int]
+    qualifying_days: List[int]
+    waiting_days: List[int]
+    paid_days: List[int]
+    amount: List[float]
+    weeks_remaining: List[float]
+
+class SSPPayrollTotals(BaseModel):
+    employees: int
+    paid_days: int
+    amount: float
+
+class SSPPayrollRun(BaseModel):
+    period_start: date
+    period_end: date
+    qualifying_days_per_week: int
+    employees: SSPPayrollEmployees
+    totals: SSPPayrollTotals
@@ -1,6 +1,8 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import date, datetime
+import enum
+from backend.schemas.employee import EmployeeSummary
 from backend.models.training import TrainingStatus, TrainingType
 
 class TrainingBase(BaseModel):
@@ -50,3 +52,31 @@ class TrainingResponse(TrainingBase):
 
     class Config:
         from_attributes = True
+
+class TrainingExpandedResponse(TrainingResponse):
+    employee: Optional[EmployeeSummary] = None
+
+class ComplianceStatus(str, enum.Enum):
+    MISSING = "missing"
+    COMPLETED = "completed"
+    OVERDUE = "overdue"
+    EXPIRED = "expired"
+    IN_PROGRESS = "in_progress"
+    NOT_STARTED = "not_started"
+
+class ComplianceEmployees(BaseModel):
+    # Parallel arrays, one entry per matrix row
+    id: List[int]
+    employee_id: List[str]
+    name: List[str]
+    department_id: List[Optional[int]]
+
+class TrainingComplianceMatrix(BaseModel):
+    as_of: date
+    department_id: Optional[int] = None
+    statuses: List[ComplianceStatus]  # cell code i means statuses[i]
+    courses: List[str]  # column labels
+    employees: ComplianceEmployees  # row labels
+    cells: List[List[int]]  # cells[row][column]
+    completed: List[int]  # per course
+    completion_rate: List[float]  # per course, percent of rows
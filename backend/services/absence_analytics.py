@@ -0,0 +1,149 @@
+from datetime import date, timedelta
+from typing import Dict, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.config import settings
+from backend.models.absence import Absence, AbsenceStatus, AbsenceType
+from backend.models.department import Department
+from backend.models.employee import Employee
+from backend.services.working_days import get_calendar
+
+# Sickness is recorded rather than requested, so pending spells count too
+SICKNESS_STATUSES = (AbsenceStatus.APPROVED, AbsenceStatus.PENDING)
+NO_DEPARTMENT = -1
+
+
+def _dates(values) -> np.ndarray:
+    return np.array(values, dtype="datetime64[D]")
+
+
+def _rate(days: np.ndarray, available: np.ndarray) -> np.ndarray:
+    return np.round(np.divide(days * 100.0, available, out=np.zeros_like(days, dtype=float), where=available > 0), 2)
+
+
+async def compute_absence_analytics(db: AsyncSession, as_of: date, weeks: int, include_inactive: bool = False) -> dict:
+    """Bradford factors and absence rates over the ``weeks`` ending ``as_of``.
+
+    Employees and sickness spells are each fetched in one columnar query;
+    everything after that is array arithmetic, with ``np.bincount`` doing
+    the per-employee and per-department group-bys. The returned arrays are
+    indexed by employee (ordered by id) and by department.
+    """
+    window_start = as_of - timedelta(weeks=weeks) + timedelta(days=1)
+
+    employee_stmt = select(Employee.id, Employee.department_id, Employee.hire_date).order_by(Employee.id)
+    if not include_inactive:
+        employee_stmt = employee_stmt.where(Employee.is_active == True)
+    employee_rows = (await db.execute(employee_stmt)).all()
+    spell_rows = (await db.execute(
+        select(Absence.employee_id, Absence.start_date, Absence.end_date, Absence.total_days)
+        .where(Absence.absence_type == AbsenceType.SICK_LEAVE,
+               Absence.status.in_(SICKNESS_STATUSES),
+               Absence.start_date <= as_of,
+               Absence.end_date >= window_start)
+    )).all()
+    names = dict((await db.execute(select(Department.id, Department.name))).all())
+
+    employee_ids = np.array([row.id for row in employee_rows], dtype=np.int64)
+    department_ids = np.array(
+        [row.department_id if row.department_id is not None else NO_DEPARTMENT for row in employee_rows], dtype=np.int64
+    )
+    hire_dates = _dates([row.hire_date for row in employee_rows])
+    count = len(employee_ids)
+    start, end = np.datetime64(window_start, "D"), np.datetime64(as_of, "D")
+
+    spells = np.zeros(count, dtype=np.int64)
+    days = np.zeros(count, dtype=float)
+    if spell_rows and count:
+        spell_employee, spell_start, spell_end, spell_days = zip(*spell_rows)
+        spell_employee = np.array(spell_employee, dtype=np.int64)
+        spell_start, spell_end = _dates(spell_start), _dates(spell_end)
+        # A spell straddling the window edge contributes the share of its
+        # days that falls inside the window
+        overlap = (np.minimum(spell_end, end) - np.maximum(spell_start, start)).astype(np.int64) + 1
+        length = np.maximum((spell_end - spell_start).astype(np.int64) + 1, 1)
+        spell_days = np.array(spell_days, dtype=float) * overlap / length
+        # Row of each spell's employee; spells of employees out of scope drop out
+        index = np.minimum(np.searchsorted(employee_ids, spell_employee), count - 1)
+        known = employee_ids[index] == spell_employee
+        spells = np.bincount(index[known], minlength=count)
+        days = np.bincount(index[known], weights=spell_days[known], minlength=count)
+
+    bradford = spells.astype(float) ** 2 * days
+    # Working days each employee could have worked in the window
+    available = get_calendar().count(np.maximum(hire_dates, start), end).astype(float)
+
+    departments, department_index = np.unique(department_ids, return_inverse=True)
+    trigger_points = np.array(settings.BRADFORD_TRIGGER_POINTS, dtype=float)
+    # Employee × trigger point: whether the score has reached that trigger
+    over_trigger = (bradford[:, None] >= trigger_points[None, :]).astype(float)
+
+    def group(values: np.ndarray) -> np.ndarray:
+        return np.bincount(department_index, weights=values, minlength=len(departments))
+
+    headcount = np.bincount(department_index, minlength=len(departments))
+    department_days = group(days)
+    department_available = group(available)
+    return {
+        "as_of": as_of,
+        "window_start": window_start,
+        "window_weeks": weeks,
+        "trigger_points": settings.BRADFORD_TRIGGER_POINTS,
+        "totals": {
+            "headcount": count,
+            "spells": int(spells.sum()),
+            "days": round(float(days.sum()), 2),
+            "available_days": float(available.sum()),
+            "absence_rate": float(_rate(days.sum(keepdims=True), available.sum(keepdims=True))[0]),
+            "mean_bradford": round(float(bradford.mean()), 1) if count else 0.0,
+            "over_trigger": over_trigger.sum(axis=0).astype(np.int64),
+        },
+        "departments": {
+            "department_id": departments,
+            "name": [names.get(int(department_id)) for department_id in departments],
+            "headcount": headcount,
+            "spells": group(spells.astype(float)).astype(np.int64),
+            "days": np.round(department_days, 2),
+            "available_days": department_available,
+            "absence_rate": _rate(department_days, department_available),
+            "mean_bradford": np.round(group(bradford) / np.maximum(headcount, 1), 1),
+            "over_trigger": np.stack([group(column) for column in over_trigger.T], axis=1).astype(np.int64)
+            if len(trigger_points) else np.zeros((len(departments), 0), dtype=np.int64),
+        },
+        "employees": {
+            "id": employee_ids,
+            "department_id": department_ids,
+            "spells": spells,
+            "days": np.round(days, 2),
+            "bradford": np.round(bradford, 1),
+            "absence_rate": _rate(days, available),
+        },
+    }
+
+
+def _columns(columns: Dict[str, object], index: np.ndarray) -> dict:
+    selected = {key: [values[i] for i in index] if isinstance(values, list) else values[index]
+                for key, values in columns.items()}
+    selected["department_id"] = [None if value == NO_DEPARTMENT else value for value in selected["department_id"].tolist()]
+    return selected
+
+
+def select_view(analytics: dict, department_id: Optional[int] = None, min_bradford: float = 0.0,
+                limit: Optional[int] = None) -> dict:
+    """One request's slice of the cached analytics, employees ranked by Bradford factor."""
+    employees, departments = analytics["employees"], analytics["departments"]
+    employee_mask = employees["bradford"] >= min_bradford
+    department_mask = np.ones(len(departments["department_id"]), dtype=bool)
+    if department_id is not None:
+        employee_mask &= employees["department_id"] == department_id
+        department_mask &= departments["department_id"] == department_id
+    ranked = np.flatnonzero(employee_mask)
+    # Highest score first, ties by employee id
+    ranked = ranked[np.lexsort((employees["id"][ranked], -employees["bradford"][ranked]))][:limit]
+    view = dict(analytics)
+    view["departments"] = _columns(departments, np.flatnonzero(department_mask))
+    view["employees"] = _columns(employees, ranked)
+    return view
@@ -0,0 +1,137 @@
+"""
+Pure document parsing run inside the analysis process pool.
+
+Nothing here touches the database or settings, so worker processes import
+only this module. pypdf and Pillow are imported lazily; without them the
+corresponding fields are simply left empty.
+"""
+
+import io
+import os
+import re
+from datetime import date, datetime
+from typing import List, Optional
+
+THUMBNAIL_SIZE = (320, 320)
+
+_MONTHS = {name: index for index, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+_DATE_PATTERNS = [
+    # 2030-05-15
+    (re.compile(r"\b(\d{4})-(\d{1,2})-(\d{1,2})\b"), lambda m: (int(m[1]), int(m[2]), int(m[3]))),
+    # 15/05/2030, 15-05-2030, 15.05.2030 (day first, UK documents)
+    (re.compile(r"\b(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})\b"), lambda m: (int(m[3]), int(m[2]), int(m[1]))),
+    # 15 May 2030, 15th May 2030
+    (re.compile(r"\b(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]{3,9})\.?,?\s+(\d{4})\b"),
+     lambda m: (int(m[3]), _MONTHS.get(m[2][:3].lower(), 0), int(m[1]))),
+    # May 15, 2030
+    (re.compile(r"\b([A-Za-z]{3,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})\b"),
+     lambda m: (int(m[3]), _MONTHS.get(m[1][:3].lower(), 0), int(m[2]))),
+]
+_EXPIRY_KEYWORDS = re.compile(
+    r"expir(?:y|es|ation|ing)|valid\s+(?:until|to|thru|through)|renewal\s+date|date\s+of\s+expiry|review\s+by",
+    re.IGNORECASE,
+)
+# Characters after a keyword searched for its date
+_KEYWORD_WINDOW = 80
+
+
+def find_dates(text: str) -> List[tuple]:
+    """``(offset, date)`` for every parseable date in ``text``."""
+    found = []
+    for pattern, parts in _DATE_PATTERNS:
+        for match in pattern.finditer(text):
+            try:
+                found.append((match.start(), date(*parts(match))))
+            except ValueError:
+                continue
+    return sorted(found)
+
+
+def detect_expiry_dates(text: str) -> List[date]:
+    """Dates that follow an expiry keyword, in document order, without duplicates."""
+    dates = find_dates(text)
+    detected = []
+    for keyword in _EXPIRY_KEYWORDS.finditer(text):
+        for offset, value in dates:
+            if keyword.end() <= offset <= keyword.end() + _KEYWORD_WINDOW:
+                if value not in detected:
+                    detected.append(value)
+                break
+    return detected
+
+
+def _save_thumbnail(image, thumbnail_path: str) -> Optional[str]:
+    image = image.convert("RGB")
+    image.thumbnail(THUMBNAIL_SIZE)
+    os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
+    image.save(thumbnail_path, "JPEG", quality=80)
+    return thumbnail_path
+
+
+def _analyze_pdf(path: str, thumbnail_path: str, max_text_chars: int) -> dict:
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    texts = []
+    length = 0
+    for page in reader.pages:
+        if length >= max_text_chars:
+            break
+        page_text = page.extract_text() or ""
+        texts.append(page_text)
+        length += len(page_text)
+    result = {"page_count": len(reader.pages), "text": "\n".join(texts)[:max_text_chars], "thumbnail_path": None}
+
+    # Scanned PDFs are one image per page; there is no pure-Python renderer
+    # for vector pages, so those get no thumbnail.
+    if reader.pages:
+        try:
+            images = reader.pages[0].images
+            if images:
+                result["thumbnail_path"] = _save_thumbnail(images[0].image, thumbnail_path)
+        except Exception:
+            pass
+    return result
+
+
+def _analyze_image(path: str, thumbnail_path: str) -> dict:
+    from PIL import Image
+
+    with Image.open(path) as image:
+        page_count = getattr(image, "n_frames", 1)
+        return {"page_count": page_count, "text": "", "thumbnail_path": _save_thumbnail(image, thumbnail_path)}
+
+
+def analyze_file(path: str, mime_type: Optional[str], thumbnail_path: str, max_text_chars: int) -> dict:
+    """Extract text, page count, expiry dates and a thumbnail from one file.
+
+    Runs in a worker process; raises on unreadable files so the caller can
+    record the failure and retry.
+    """
+    with open(path, "rb") as file:
+        head = file.read(8)
+    mime_type = (mime_type or "").lower()
+
+    empty = {"page_count": None, "text": "", "thumbnail_path": None}
+
+    if head.startswith(b"%PDF") or mime_type == "application/pdf":
+        try:
+            result = _analyze_pdf(path, thumbnail_path, max_text_chars)
+        except ImportError:
+            result = empty
+    elif mime_type.startswith("image/"):
+        try:
+            result = _analyze_image(path, thumbnail_path)
+        except ImportError:
+            result = empty
+    elif mime_type.startswith("text/") or mime_type in ("application/json", ""):
+        with io.open(path, encoding="utf-8", errors="replace") as file:
+            result = {"page_count": None, "text": file.read(max_text_chars), "thumbnail_path": None}
+    else:
+        result = empty
+
+    expiry_dates = detect_expiry_dates(result["text"])
+    result["detected_expiry_dates"] = [value.isoformat() for value in expiry_dates]
+    result["extracted_at"] = datetime.utcnow().isoformat()
+    return result
@@ -0,0 +1,276 @@
+import asyncio
+import json
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Set
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.config import settings
+from backend.core.database import AsyncSessionLocal
+from backend.core.metrics import DOCUMENT_ANALYSES, DOCUMENT_ANALYSIS_TIME
+from backend.core.storage import content_store
+from backend.models.document import Document
+from backend.models.document_analysis import AnalysisStatus, DocumentAnalysis
+from backend.services.document_extraction import analyze_file
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_DIR = "thumbnails"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def thumbnail_relative_path(document: Document) -> str:
+    # Keyed by content hash, so identical uploads share one thumbnail
+    key = content_store.digest_of(document.file_path) or f"document-{document.id}"
+    return f"{THUMBNAIL_DIR}/{key}.jpg"
+
+
+def _apply_result(analysis: DocumentAnalysis, result: dict) -> None:
+    analysis.status = AnalysisStatus.COMPLETED
+    analysis.error = None
+    analysis.next_attempt_at = None
+    analysis.text = result["text"]
+    analysis.page_count = result["page_count"]
+    analysis.detected_expiry_dates = json.dumps(result["detected_expiry_dates"])
+    dates = [date.fromisoformat(value) for value in result["detected_expiry_dates"]]
+    # The latest date is the expiry; earlier ones are usually issue dates
+    # that happen to follow an "expires" heading in a table
+    analysis.suggested_expiry_date = max(dates) if dates else None
+    analysis.thumbnail_path = result["thumbnail_path"]
+    analysis.completed_at = _utcnow()
+
+
+class DocumentPipeline:
+    """Extracts text, page count, expiry dates and thumbnails off the request path.
+
+    Uploads only insert a pending ``DocumentAnalysis`` row and enqueue its id.
+    A fixed set of dispatcher tasks takes ids from a bounded queue and hands
+    the CPU-heavy parsing to a process pool, then writes the results back.
+    The queue is an accelerator, not the source of truth: when it is full, or
+    after a restart, a poller picks pending rows up from the database, so a
+    burst of uploads never blocks a request or grows memory without bound.
+    Failures are retried with exponential backoff up to ``max_attempts``.
+    """
+
+    def __init__(self, workers: int, queue_size: int, max_attempts: int,
+                 retry_seconds: float, timeout_seconds: float, poll_seconds: float):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.max_attempts = max_attempts
+        self.retry_seconds = retry_seconds
+        self.timeout_seconds = timeout_seconds
+        self.poll_seconds = poll_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._queued: Set[int] = set()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # spawn: workers start from a fresh interpreter rather than a fork
+        # of the event loop, threads and database connections of this process
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._executor = self._new_executor()
+        async with AsyncSessionLocal() as db:
+            # Jobs interrupted by a shutdown or crash start over; anything
+            # started more recently may still be running in another process
+            stale = _utcnow() - timedelta(seconds=self.timeout_seconds)
+            await db.execute(
+                update(DocumentAnalysis)
+                .where(DocumentAnalysis.status == AnalysisStatus.PROCESSING,
+                       DocumentAnalysis.started_at < stale)
+                .values(status=AnalysisStatus.PENDING)
+            )
+            await db.commit()
+        self._tasks = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._poll()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queued.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def enqueue(self, document_id: int) -> bool:
+        """Queue a document without waiting; False leaves it to the poller."""
+        if not self.running or document_id in self._queued:
+            return False
+        try:
+            self._queue.put_nowait(document_id)
+        except asyncio.QueueFull:
+            return False
+        self._queued.add(document_id)
+        return True
+
+    async def _poll(self) -> None:
+        while True:
+            try:
+                free = self.queue_size - self._queue.qsize()
+                if free > 0:
+                    async with AsyncSessionLocal() as db:
+                        ids = (await db.execute(
+                            select(DocumentAnalysis.document_id)
+                            .where(DocumentAnalysis.status == AnalysisStatus.PENDING,
+                                   or_(DocumentAnalysis.next_attempt_at.is_(None),
+                                       DocumentAnalysis.next_attempt_at <= _utcnow()))
+                            .order_by(DocumentAnalysis.created_at)
+                            .limit(free + len(self._queued))
+                        )).scalars().all()
+                    for document_id in ids:
+                        self.enqueue(document_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Polling for pending document analyses failed")
+            await asyncio.sleep(self.poll_seconds)
+
+    async def _dispatch(self) -> None:
+        while True:
+            document_id = await self._queue.get()
+            try:
+                await self.process(document_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Document analysis %s failed unexpectedly", document_id)
+            finally:
+                self._queued.discard(document_id)
+                self._queue.task_done()
+
+    async def process(self, document_id: int) -> None:
+        async with AsyncSessionLocal() as db:
+            analysis = await db.get(DocumentAnalysis, document_id)
+            if analysis is None or analysis.status != AnalysisStatus.PENDING:
+                return
+            document = await db.get(Document, document_id)
+            if await self._reuse_existing(db, analysis, document):
+                await db.commit()
+                DOCUMENT_ANALYSES.inc("reused")
+                return
+            # Claim the row with a conditional update, so when several app
+            # processes run a pipeline each document is parsed by only one
+            claimed = await db.execute(
+                update(DocumentAnalysis)
+                .where(DocumentAnalysis.document_id == document_id,
+                       DocumentAnalysis.status == AnalysisStatus.PENDING)
+                .values(status=AnalysisStatus.PROCESSING, attempts=DocumentAnalysis.attempts + 1,
+                        started_at=_utcnow())
+                .execution_options(synchronize_session="fetch")
+            )
+            await db.commit()
+            if claimed.rowcount != 1:
+                return
+
+            started = time.perf_counter()
+            try:
+                result = await self._extract(document)
+            except Exception as exc:
+                self._record_failure(analysis, exc)
+            else:
+                _apply_result(analysis, result)
+                DOCUMENT_ANALYSES.inc("completed")
+            DOCUMENT_ANALYSIS_TIME.observe(time.perf_counter() - started)
+            await db.commit()
+
+    async def _reuse_existing(self, db: AsyncSession, analysis: DocumentAnalysis, document: Document) -> bool:
+        # Stored files are content-addressed: a re-upload of the same bytes
+        # copies the earlier results instead of parsing the file again
+        if content_store.digest_of(document.file_path) is None:
+            return False
+        previous = (await db.execute(
+            select(DocumentAnalysis)
+            .join(Document, Document.id == DocumentAnalysis.document_id)
+            .where(Document.file_path == document.file_path,
+                   Document.id != document.id,
+                   DocumentAnalysis.status == AnalysisStatus.COMPLETED)
+            .limit(1)
+        )).scalar_one_or_none()
+        if previous is None:
+            return False
+        for field in ("text", "page_count", "detected_expiry_dates", "suggested_expiry_date", "thumbnail_path"):
+            setattr(analysis, field, getattr(previous, field))
+        analysis.status = AnalysisStatus.COMPLETED
+        analysis.error = None
+        analysis.next_attempt_at = None
+        analysis.completed_at = _utcnow()
+        return True
+
+    async def _extract(self, document: Document) -> dict:
+        path = content_store.resolve(document.file_path)
+        if path is None:
+            raise FileNotFoundError(f"Stored file {document.file_path!r} is missing")
+        relative_thumbnail = thumbnail_relative_path(document)
+        loop = asyncio.get_running_loop()
+        try:
+            # A timed-out job keeps its worker busy until it finishes, but
+            # the row is released for a retry straight away
+            result = await asyncio.wait_for(loop.run_in_executor(
+                self._executor, analyze_file, str(path), document.mime_type,
+                str(content_store.root / relative_thumbnail), settings.DOCUMENT_MAX_TEXT_CHARS,
+            ), timeout=self.timeout_seconds)
+        except BrokenProcessPool:
+            # A worker died (e.g. a crash inside a parser); replace the pool
+            self._executor = self._new_executor()
+            raise
+        if result["thumbnail_path"] is not None:
+            result["thumbnail_path"] = relative_thumbnail
+        return result
+
+    def _record_failure(self, analysis: DocumentAnalysis, exc: Exception) -> None:
+        analysis.error = f"{type(exc).__name__}: {exc}"[:2000]
+        if analysis.attempts >= self.max_attempts:
+            analysis.status = AnalysisStatus.FAILED
+            analysis.next_attempt_at = None
+            analysis.completed_at = _utcnow()
+            DOCUMENT_ANALYSES.inc("failed")
+            logger.warning("Giving up on document analysis %s after %s attempts: %s",
+                           analysis.document_id, analysis.attempts, analysis.error)
+        else:
+            analysis.status = AnalysisStatus.PENDING
+            delay = self.retry_seconds * 2 ** (analysis.attempts - 1)
+            analysis.next_attempt_at = _utcnow() + timedelta(seconds=delay)
+            DOCUMENT_ANALYSES.inc("retried")
+
+
+document_pipeline = DocumentPipeline(
+    workers=settings.DOCUMENT_PROCESSING_WORKERS,
+    queue_size=settings.DOCUMENT_PROCESSING_QUEUE_SIZE,
+    max_attempts=settings.DOCUMENT_PROCESSING_MAX_ATTEMPTS,
+    retry_seconds=settings.DOCUMENT_PROCESSING_RETRY_SECONDS,
+    timeout_seconds=settings.DOCUMENT_PROCESSING_TIMEOUT_SECONDS,
+    poll_seconds=settings.DOCUMENT_PROCESSING_POLL_SECONDS,
+)
+
+
+async def request_analysis(db: AsyncSession, document: Document) -> DocumentAnalysis:
+    """Create or reset the analysis row for ``document``; the caller commits."""
+    analysis = await db.get(DocumentAnalysis, document.id)
+    if analysis is None:
+        analysis = DocumentAnalysis(document_id=document.id)
+        db.add(analysis)
+    analysis.status = AnalysisStatus.PENDING
+    analysis.attempts = 0
+    analysis.error = None
+    analysis.next_attempt_at = None
+    return analysis
@@ -0,0 +1,99 @@
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.cache import bump_tables
+from backend.models.department import Department
+from backend.models.employee import Employee
+from backend.models.user import User
+from backend.schemas.employee import EmployeeCreate
+from backend.services.org_chart import attach_employees
+from backend.services.search import reindex
+
+IMPORT_CHUNK_SIZE = 1000
+
+
+def _chunks(rows: Iterable[dict], size: int) -> Iterator[List[Tuple[int, dict]]]:
+    chunk = []
+    for number, row in enumerate(rows, start=1):
+        chunk.append((number, row))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _existing(db: AsyncSession, column, values: set) -> set:
+    if not values:
+        return set()
+    return set((await db.scalars(select(column).where(column.in_(values)))).all())
+
+
+async def import_employees(db: AsyncSession, rows: Iterable[dict]) -> dict:
+    """Validate and insert employee rows chunk by chunk.
+
+    Each chunk costs one set-based lookup per reference (duplicate
+    employee_id, users, departments, managers) and one multi-row INSERT in
+    its own transaction, so a bad row only rejects itself.
+    """
+    created = 0
+    errors: List[Dict] = []
+    seen_employee_ids = set()
+
+    for chunk in _chunks(rows, IMPORT_CHUNK_SIZE):
+        valid: List[Tuple[int, EmployeeCreate]] = []
+        for number, row in chunk:
+            try:
+                valid.append((number, EmployeeCreate(**row)))
+            except (ValidationError, TypeError) as exc:
+                messages = (
+                    [f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors()]
+                    if isinstance(exc, ValidationError) else [str(exc)]
+                )
+                errors.append({"row": number, "employee_id": row.get("employee_id"), "errors": messages})
+
+        duplicates = await _existing(db, Employee.employee_id, {e.employee_id for _, e in valid})
+        users = await _existing(db, User.id, {e.user_id for _, e in valid})
+        departments = await _existing(db, Department.id, {e.department_id for _, e in valid if e.department_id is not None})
+        managers = await _existing(db, Employee.id, {e.manager_id for _, e in valid if e.manager_id is not None})
+
+        to_insert = []
+        for number, employee in valid:
+            problems = []
+            if employee.employee_id in duplicates:
+                problems.append("employee_id: Employee ID already exists")
+            elif employee.employee_id in seen_employee_ids:
+                problems.append("employee_id: duplicated earlier in this import")
+            if employee.user_id not in users:
+                problems.append("user_id: user does not exist")
+            if employee.department_id is not None and employee.department_id not in departments:
+                problems.append("department_id: department does not exist")
+            if employee.manager_id is not None and employee.manager_id not in managers:
+                problems.append("manager_id: manager does not exist")
+            if problems:
+                errors.append({"row": number, "employee_id": employee.employee_id, "errors": problems})
+                continue
+            seen_employee_ids.add(employee.employee_id)
+            to_insert.append(employee.dict())
+
+        if to_insert:
+            await db.execute(insert(Employee), to_insert)
+            # Managers must already exist, so their closure rows are in place
+            inserted = await db.execute(
+                select(Employee.id, Employee.manager_id)
+                .where(Employee.employee_id.in_([row["employee_id"] for row in to_insert]))
+            )
+            pairs = [tuple(row) for row in inserted]
+            await attach_employees(db, pairs)
+            await reindex(db, Employee, [employee_id for employee_id, _ in pairs])
+            await db.commit()
+            created += len(to_insert)
+
+    if created:
+        # Core inserts bypass the ORM flush hooks that version the table
+        bump_tables(Employee.__tablename__)
+    errors.sort(key=lambda error: error["row"])
+    return {"created": created, "failed": len(errors), "errors": errors}
@@ -0,0 +1,168 @@
+"""
+Expiry sweeper: moves documents and training records past their expiry date
+into the EXPIRED status, so reads filter on an indexed status column instead
+of comparing every expiry date with today.
+
+Runs inside the API when EXPIRY_SWEEP_ENABLED is set, or standalone:
+
+    python -m backend.services.expiry            # sweep every EXPIRY_SWEEP_INTERVAL_SECONDS
+    python -m backend.services.expiry --once     # single sweep, e.g. from cron
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import NamedTuple, Optional, Tuple
+
+from sqlalchemy import func, select, update
+from sqlalchemy.engine import Connection, Engine
+from starlette.concurrency import run_in_threadpool
+
+from backend.core.cache import bump_tables
+from backend.core.config import settings
+from backend.core.database import engine
+from backend.core.metrics import EXPIRY_SWEEP_DURATION, EXPIRY_SWEEP_EXPIRED, EXPIRY_SWEEP_EXPIRING, EXPIRY_SWEEP_LAST_RUN
+from backend.models.document import Document, DocumentStatus
+from backend.models.training import Training, TrainingStatus
+
+logger = logging.getLogger(__name__)
+
+
+class ExpiryTarget(NamedTuple):
+    name: str
+    model: type
+    live_statuses: Tuple
+    expired_status: object
+
+
+EXPIRY_TARGETS = [
+    # Archived documents are withdrawn on purpose and keep that status
+    ExpiryTarget("documents", Document, (DocumentStatus.ACTIVE, DocumentStatus.PENDING_APPROVAL), DocumentStatus.EXPIRED),
+    ExpiryTarget("training", Training,
+                 (TrainingStatus.NOT_STARTED, TrainingStatus.IN_PROGRESS, TrainingStatus.COMPLETED), TrainingStatus.EXPIRED),
+]
+
+
+def live_expiring(target: ExpiryTarget, start: date, end: date):
+    """Condition for rows of ``target`` not yet expired whose expiry falls in ``[start, end]``."""
+    model = target.model
+    # IN over the live statuses, not ``!= expired``, so each status is a
+    # range scan of the (status, expiry_date) index
+    return (model.status.in_(target.live_statuses), model.expiry_date >= start, model.expiry_date <= end)
+
+
+def expire_rows(conn: Connection, target: ExpiryTarget, today: date, batch_size: int) -> int:
+    """Mark one batch of overdue rows expired; returns how many changed."""
+    model = target.model
+    ids = conn.execute(
+        select(model.id)
+        .where(model.status.in_(target.live_statuses), model.expiry_date < today)
+        .limit(batch_size)
+    ).scalars().all()
+    if not ids:
+        return 0
+    conn.execute(
+        update(model)
+        .where(model.id.in_(ids), model.status.in_(target.live_statuses))
+        .values(status=target.expired_status)
+    )
+    return len(ids)
+
+
+def sweep(bind: Engine = engine, today: Optional[date] = None, batch_size: int = settings.EXPIRY_SWEEP_BATCH_SIZE,
+          warning_days: int = settings.EXPIRY_WARNING_DAYS) -> dict:
+    """Expire everything overdue as of ``today`` and count what expires soon.
+
+    Each batch commits on its own, so a large backlog never holds a long
+    write lock and an interrupted sweep keeps the work already done.
+    """
+    today = today or date.today()
+    started = time.perf_counter()
+    result = {"as_of": today, "started_at": datetime.now(timezone.utc), "expired": {}, "expiring": {}}
+    for target in EXPIRY_TARGETS:
+        expired = 0
+        while True:
+            with bind.begin() as conn:
+                count = expire_rows(conn, target, today, batch_size)
+            if not count:
+                break
+            expired += count
+            # Core updates bypass the ORM write hooks that invalidate caches
+            bump_tables(target.model.__tablename__)
+        with bind.connect() as conn:
+            expiring = conn.execute(
+                select(func.count()).select_from(target.model)
+                .where(*live_expiring(target, today, today + timedelta(days=warning_days)))
+            ).scalar()
+        result["expired"][target.name] = expired
+        result["expiring"][target.name] = expiring
+        EXPIRY_SWEEP_EXPIRED.inc(target.name, amount=expired)
+        EXPIRY_SWEEP_EXPIRING.set(expiring, target.name)
+    result["duration_seconds"] = time.perf_counter() - started
+    EXPIRY_SWEEP_DURATION.set(result["duration_seconds"])
+    EXPIRY_SWEEP_LAST_RUN.set(result["started_at"].timestamp())
+    logger.info("Expiry sweep for %s: expired %s, expiring within %s days %s",
+                today, result["expired"], warning_days, result["expiring"])
+    return result
+
+
+class ExpirySweeper:
+    """Runs ``sweep`` now and then every ``interval_seconds`` on the event loop.
+
+    The sweep itself uses the sync engine on a worker thread. Running it in
+    several app processes at once is harmless: the updates are idempotent.
+    """
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.last_run: Optional[dict] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def run_once(self) -> dict:
+        self.last_run = await run_in_threadpool(sweep)
+        return self.last_run
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Expiry sweep failed")
+            await asyncio.sleep(self.interval_seconds)
+
+
+expiry_sweeper = ExpirySweeper(settings.EXPIRY_SWEEP_INTERVAL_SECONDS)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Expire overdue documents and training records")
+    parser.add_argument("--once", action="store_true", help="run a single sweep and exit")
+    parser.add_argument("--as-of", type=date.fromisoformat, help="treat this date (YYYY-MM-DD) as today")
+    parser.add_argument("--interval", type=float, default=settings.EXPIRY_SWEEP_INTERVAL_SECONDS,
+                        help="seconds between sweeps")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    while True:
+        sweep(today=args.as_of)
+        if args.once:
+            break
+        time.sleep(args.interval)
@@ -0,0 +1,354 @@
+import math
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, event, insert, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.core.config import settings
+from backend.models.absence import Absence, AbsenceStatus, AbsenceType
+from backend.models.employee import Employee
+from backend.models.leave_balance import LeaveBalance
+
+REBUILD_BATCH_SIZE = 5000
+
+# Fields whose change can move an absence's debit
+_ABSENCE_FIELDS = ("employee_id", "absence_type", "status", "start_date", "total_days")
+# Fields that change an employee's entitlement
+_EMPLOYEE_FIELDS = ("hire_date", "employment_type")
+
+
+def leave_year_of(day: date) -> int:
+    """The leave year ``day`` falls in, named by the calendar year it starts in."""
+    if (day.month, day.day) >= (settings.LEAVE_YEAR_START_MONTH, settings.LEAVE_YEAR_START_DAY):
+        return day.year
+    return day.year - 1
+
+
+def leave_year_key(request) -> str:
+    """``ConditionalGet`` key: the leave year a balance request resolves to."""
+    return request.query_params.get("year") or str(leave_year_of(date.today()))
+
+
+def leave_year_bounds(year: int) -> Tuple[date, date]:
+    start = date(year, settings.LEAVE_YEAR_START_MONTH, settings.LEAVE_YEAR_START_DAY)
+    end = date(year + 1, settings.LEAVE_YEAR_START_MONTH, settings.LEAVE_YEAR_START_DAY) - timedelta(days=1)
+    return start, end
+
+
+def accrued_entitlement(hire_date: date, employment_type: Optional[str], year: int) -> float:
+    """Full-year entitlement, pro-rated for a start part way through the year.
+
+    Rounded up to the nearest half day, as statutory leave may be rounded up
+    but never down.
+    """
+    start, end = leave_year_bounds(year)
+    if hire_date > end:
+        return 0.0
+    days = settings.ANNUAL_LEAVE_DAYS * settings.LEAVE_EMPLOYMENT_TYPE_FACTORS.get(employment_type, 1.0)
+    if hire_date > start:
+        days *= ((end - hire_date).days + 1) / ((end - start).days + 1)
+    return math.ceil(days * 2 - 1e-9) / 2
+
+
+def carry_over(previous_remaining: float) -> float:
+    return min(max(previous_remaining, 0.0), settings.LEAVE_CARRY_OVER_MAX_DAYS)
+
+
+def unbooked_remaining(hire_date: date, employment_type: Optional[str], year: int) -> float:
+    """Remaining days of a leave year with no ledger row, i.e. no leave booked."""
+    entitlement = accrued_entitlement(hire_date, employment_type, year)
+    if entitlement >= settings.LEAVE_CARRY_OVER_MAX_DAYS or year <= leave_year_of(hire_date):
+        # Carry-over is capped, so the years before cannot change the result
+        return entitlement
+    return entitlement + carry_over(unbooked_remaining(hire_date, employment_type, year - 1))
+
+
+def debit(absence_type, status, start_date, total_days) -> Optional[Tuple[int, float, float]]:
+    """``(leave year, taken, pending)`` an absence contributes, or None.
+
+    Only annual leave counts. A booking that spans two leave years is
+    charged to the year it starts in.
+    """
+    if absence_type != AbsenceType.ANNUAL_LEAVE or start_date is None or not total_days:
+        return None
+    if status == AbsenceStatus.APPROVED:
+        return leave_year_of(start_date), total_days, 0.0
+    if status == AbsenceStatus.PENDING:
+        return leave_year_of(start_date), 0.0, total_days
+    return None
+
+
+# -- Ledger maintenance on the sync connection of the writing transaction --
+
+def _insert_ignoring_existing(conn: Connection):
+    """INSERT that skips an (employee, year) row another transaction already created."""
+    dialect = {"postgresql": postgresql, "sqlite": sqlite}.get(conn.dialect.name)
+    if dialect is None:
+        return insert(LeaveBalance)
+    return dialect.insert(LeaveBalance).on_conflict_do_nothing(
+        index_elements=[LeaveBalance.employee_id, LeaveBalance.leave_year]
+    )
+
+
+def _create_row(conn: Connection, employee_id: int, year: int) -> None:
+    employee = conn.execute(
+        select(Employee.hire_date, Employee.employment_type).where(Employee.id == employee_id)
+    ).first()
+    if employee is None:
+        return
+    previous = conn.execute(
+        select(LeaveBalance).where(LeaveBalance.employee_id == employee_id, LeaveBalance.leave_year == year - 1)
+    ).first()
+    if previous is not None:
+        previous_remaining = _remaining(previous)
+    else:
+        previous_remaining = unbooked_remaining(employee.hire_date, employee.employment_type, year - 1)
+    conn.execute(_insert_ignoring_existing(conn).values(
+        employee_id=employee_id,
+        leave_year=year,
+        entitlement_days=accrued_entitlement(employee.hire_date, employee.employment_type, year),
+        carried_over_days=carry_over(previous_remaining),
+        taken_days=0.0,
+        pending_days=0.0,
+    ))
+
+
+def _remaining(row) -> float:
+    return row.entitlement_days + row.carried_over_days - row.taken_days
+
+
+def _refresh_carry_over(conn: Connection, employee_id: int, from_year: int) -> None:
+    """Re-derive carry-over for the years after ``from_year`` once it changed."""
+    employee = conn.execute(
+        select(Employee.hire_date, Employee.employment_type).where(Employee.id == employee_id)
+    ).first()
+    rows = conn.execute(
+        select(LeaveBalance)
+        .where(LeaveBalance.employee_id == employee_id, LeaveBalance.leave_year >= from_year)
+        .order_by(LeaveBalance.leave_year)
+    ).all()
+    if employee is None:
+        return
+    previous_year = previous_remaining = None
+    for row in rows:
+        carried = row.carried_over_days
+        if previous_year is not None:
+            if previous_year != row.leave_year - 1:
+                # A gap year without bookings
+                previous_remaining = unbooked_remaining(employee.hire_date, employee.employment_type, row.leave_year - 1)
+            carried = carry_over(previous_remaining)
+            if carried != row.carried_over_days:
+                conn.execute(
+                    update(LeaveBalance)
+                    .where(LeaveBalance.employee_id == employee_id, LeaveBalance.leave_year == row.leave_year)
+                    .values(carried_over_days=carried)
+                )
+        previous_year = row.leave_year
+        previous_remaining = row.entitlement_days + carried - row.taken_days
+
+
+def apply_debits(conn: Connection, deltas: Dict[Tuple[int, int], List[float]]) -> None:
+    """Add ``{(employee id, year): [taken, pending]}`` to the ledger."""
+    first_year: Dict[int, int] = {}
+    for (employee_id, year), (taken, pending) in sorted(deltas.items()):
+        if not taken and not pending:
+            continue
+        increment = (
+            update(LeaveBalance)
+            .where(LeaveBalance.employee_id == employee_id, LeaveBalance.leave_year == year)
+            .values(taken_days=LeaveBalance.taken_days + taken, pending_days=LeaveBalance.pending_days + pending)
+        )
+        if conn.execute(increment).rowcount == 0:
+            # The row may appear concurrently; either way it exists afterwards
+            # and the increment adds to whatever it holds
+            _create_row(conn, employee_id, year)
+            conn.execute(increment)
+        # Sorted, so this keeps each employee's earliest touched year
+        first_year.setdefault(employee_id, year)
+    for employee_id, year in first_year.items():
+        _refresh_carry_over(conn, employee_id, year)
+
+
+def recompute_entitlements(conn: Connection, employee_ids: Iterable[int]) -> None:
+    """Re-accrue every ledger year of employees whose start date or type changed."""
+    for employee in conn.execute(
+        select(Employee.id, Employee.hire_date, Employee.employment_type).where(Employee.id.in_(list(employee_ids)))
+    ):
+        years = conn.execute(
+            select(LeaveBalance.leave_year).where(LeaveBalance.employee_id == employee.id)
+        ).scalars().all()
+        for year in years:
+            conn.execute(
+                update(LeaveBalance)
+                .where(LeaveBalance.employee_id == employee.id, LeaveBalance.leave_year == year)
+                .values(entitlement_days=accrued_entitlement(employee.hire_date, employee.employment_type, year))
+            )
+        if years:
+            first = min(years)
+            conn.execute(
+                update(LeaveBalance)
+                .where(LeaveBalance.employee_id == employee.id, LeaveBalance.leave_year == first)
+                .values(carried_over_days=carry_over(
+                    unbooked_remaining(employee.hire_date, employee.employment_type, first - 1)))
+            )
+            _refresh_carry_over(conn, employee.id, first)
+
+
+def rebuild_leave_ledger(conn: Connection, today: Optional[date] = None, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """Recompute the whole ledger from the absence history; returns rows written.
+
+    Each employee gets a row for every leave year from their first booking
+    (or the current year) to their last, so carry-over chains are complete.
+    """
+    current_year = leave_year_of(today or date.today())
+    booked: Dict[int, Dict[int, List[float]]] = defaultdict(lambda: defaultdict(lambda: [0.0, 0.0]))
+    result = conn.execution_options(yield_per=batch_size).execute(
+        select(Absence.employee_id, Absence.absence_type, Absence.status, Absence.start_date, Absence.total_days)
+        .where(Absence.absence_type == AbsenceType.ANNUAL_LEAVE,
+               Absence.status.in_((AbsenceStatus.APPROVED, AbsenceStatus.PENDING)))
+    )
+    for row in result:
+        contribution = debit(row.absence_type, row.status, row.start_date, row.total_days)
+        if contribution is not None:
+            year, taken, pending = contribution
+            totals = booked[row.employee_id][year]
+            totals[0] += taken
+            totals[1] += pending
+
+    conn.execute(delete(LeaveBalance))
+    count = 0
+    batch = []
+    for employee in conn.execute(select(Employee.id, Employee.hire_date, Employee.employment_type)).all():
+        years = booked.get(employee.id, {})
+        first = max(min(years, default=current_year), leave_year_of(employee.hire_date))
+        last = max(max(years, default=current_year), current_year)
+        remaining = unbooked_remaining(employee.hire_date, employee.employment_type, first - 1)
+        for year in range(first, last + 1):
+            taken, pending = years.get(year, (0.0, 0.0))
+            row = {
+                "employee_id": employee.id,
+                "leave_year": year,
+                "entitlement_days": accrued_entitlement(employee.hire_date, employee.employment_type, year),
+                "carried_over_days": carry_over(remaining),
+                "taken_days": taken,
+                "pending_days": pending,
+            }
+            remaining = row["entitlement_days"] + row["carried_over_days"] - taken
+            batch.append(row)
+        if len(batch) >= batch_size:
+            conn.execute(insert(LeaveBalance), batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        conn.execute(insert(LeaveBalance), batch)
+        count += len(batch)
+    return count
+
+
+def _previous_value(state, field):
+    history = state.attrs[field].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(state.object, field)
+
+
+def _absence_debit(obj, previous: bool):
+    if previous:
+        state = inspect(obj)
+        values = [_previous_value(state, field) for field in _ABSENCE_FIELDS]
+    else:
+        values = [getattr(obj, field) for field in _ABSENCE_FIELDS]
+    employee_id, absence_type, status, start_date, total_days = values
+    contribution = debit(absence_type, status, start_date, total_days)
+    return None if contribution is None else (employee_id,) + contribution
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_leave_ledger(session, flush_context):
+    deltas: Dict[Tuple[int, int], List[float]] = defaultdict(lambda: [0.0, 0.0])
+
+    def add(contribution, sign):
+        if contribution is not None:
+            employee_id, year, taken, pending = contribution
+            deltas[(employee_id, year)][0] += sign * taken
+            deltas[(employee_id, year)][1] += sign * pending
+
+    reaccrue = set()
+    for obj in session.new:
+        if isinstance(obj, Absence):
+            add(_absence_debit(obj, previous=False), 1)
+    for obj in session.dirty:
+        if isinstance(obj, Absence):
+            state = inspect(obj)
+            if any(state.attrs[field].history.has_changes() for field in _ABSENCE_FIELDS):
+                add(_absence_debit(obj, previous=True), -1)
+                add(_absence_debit(obj, previous=False), 1)
+        elif isinstance(obj, Employee):
+            state = inspect(obj)
+            if any(state.attrs[field].history.has_changes() for field in _EMPLOYEE_FIELDS):
+                reaccrue.add(obj.id)
+    for obj in session.deleted:
+        if isinstance(obj, Absence):
+            add(_absence_debit(obj, previous=True), -1)
+    if not deltas and not reaccrue:
+        return
+
+    conn = session.connection()
+    if reaccrue:
+        recompute_entitlements(conn, reaccrue)
+    if deltas:
+        apply_debits(conn, deltas)
+    # Core statements bypass the ORM hook that invalidates cached reads
+    session.info.setdefault("written_tables", set()).add(LeaveBalance.__tablename__)
+
+
+# -- Reads --
+
+def _balance(employee: Employee, year: int, row: Optional[LeaveBalance], previous: Optional[LeaveBalance]) -> dict:
+    if row is not None:
+        entitlement, carried, taken, pending = row.entitlement_days, row.carried_over_days, row.taken_days, row.pending_days
+    else:
+        # No bookings yet this year: the row would be created with these values
+        entitlement = accrued_entitlement(employee.hire_date, employee.employment_type, year)
+        if previous is not None:
+            previous_remaining = previous.remaining_days
+        else:
+            previous_remaining = unbooked_remaining(employee.hire_date, employee.employment_type, year - 1)
+        carried = carry_over(previous_remaining)
+        taken = pending = 0.0
+    start, end = leave_year_bounds(year)
+    remaining = entitlement + carried - taken
+    return {
+        "employee_id": employee.id,
+        "leave_year": year,
+        "year_start": start,
+        "year_end": end,
+        "entitlement_days": entitlement,
+        "carried_over_days": carried,
+        "taken_days": taken,
+        "pending_days": pending,
+        "remaining_days": remaining,
+        "available_days": remaining - pending,
+    }
+
+
+async def get_balances(db: AsyncSession, employees: Sequence[Employee], year: int) -> List[dict]:
+    """Balances of ``employees`` for ``year`` from one indexed ledger query."""
+    if not employees:
+        return []
+    rows = (await db.execute(
+        select(LeaveBalance)
+        .where(LeaveBalance.employee_id.in_([employee.id for employee in employees]),
+               LeaveBalance.leave_year.in_((year - 1, year)))
+        .execution_options(populate_existing=True)
+    )).scalars().all()
+    ledger = {(row.employee_id, row.leave_year): row for row in rows}
+    return [
+        _balance(employee, year, ledger.get((employee.id, year)), ledger.get((employee.id, year - 1)))
+        for employee in employees
+    ]
@@ -0,0 +1,114 @@
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.absence import Absence, AbsenceStatus
+from backend.models.department import Department
+from backend.models.employee import Employee
+
+
+def occupancy_grid(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    groups: np.ndarray,
+    n_groups: int,
+    window_start: date,
+    n_days: int,
+) -> np.ndarray:
+    """Count the intervals covering each day of the window, per group.
+
+    ``starts``/``ends`` are inclusive ``datetime64[D]`` arrays. Each interval
+    adds +1 at its first day and -1 after its last day of a difference array,
+    and one cumulative sum along the day axis turns that into per-day
+    counts, so the cost is O(intervals + groups * days) rather than
+    O(intervals * days).
+    """
+    diff = np.zeros((n_groups, n_days + 1), dtype=np.int32)
+    if len(starts):
+        origin = np.datetime64(window_start, "D")
+        first = np.maximum((starts - origin).astype(np.int64), 0)
+        last = np.minimum((ends - origin).astype(np.int64), n_days - 1)
+        valid = first <= last
+        np.add.at(diff, (groups[valid], first[valid]), 1)
+        np.add.at(diff, (groups[valid], last[valid] + 1), -1)
+    return np.cumsum(diff[:, :-1], axis=1)
+
+
+def _to_day_array(values: Iterable[date]) -> np.ndarray:
+    return np.array(list(values), dtype="datetime64[D]")
+
+
+async def build_absence_calendar(
+    db: AsyncSession,
+    window_start: date,
+    window_end: date,
+    department_id: Optional[int] = None,
+    statuses: Tuple[AbsenceStatus, ...] = (AbsenceStatus.APPROVED,),
+) -> dict:
+    n_days = (window_end - window_start).days + 1
+
+    # Active headcount per department defines the rows of the grid
+    headcount_stmt = (
+        select(Employee.department_id, Department.name, func.count(Employee.id))
+        .outerjoin(Department, Employee.department_id == Department.id)
+        .where(Employee.is_active == True)
+        .group_by(Employee.department_id, Department.name)
+        .order_by(Employee.department_id)
+    )
+    if department_id is not None:
+        headcount_stmt = headcount_stmt.where(Employee.department_id == department_id)
+    departments: List[tuple] = (await db.execute(headcount_stmt)).all()
+    row_of = {dept_id: row for row, (dept_id, _, _) in enumerate(departments)}
+
+    # Only absences overlapping the window, via the (start_date, end_date) index
+    absence_stmt = (
+        select(Employee.department_id, Absence.start_date, Absence.end_date)
+        .join(Employee, Absence.employee_id == Employee.id)
+        .where(
+            Absence.start_date <= window_end,
+            Absence.end_date >= window_start,
+            Absence.status.in_(statuses),
+            Employee.is_active == True,
+        )
+    )
+    if department_id is not None:
+        absence_stmt = absence_stmt.where(Employee.department_id == department_id)
+    rows = (await db.execute(absence_stmt)).all()
+
+    groups = np.fromiter((row_of[r[0]] for r in rows), dtype=np.int64, count=len(rows))
+    absent = occupancy_grid(
+        _to_day_array(r[1] for r in rows),
+        _to_day_array(r[2] for r in rows),
+        groups,
+        len(departments),
+        window_start,
+        n_days,
+    )
+    headcount = np.array([count for _, _, count in departments], dtype=np.int32)
+    available = np.maximum(headcount[:, None] - absent, 0)
+
+    return {
+        "date_from": window_start,
+        "date_to": window_end,
+        "days": [window_start + timedelta(days=i) for i in range(n_days)],
+        "departments": [
+            {
+                "department_id": dept_id,
+                "name": name,
+                "headcount": int(headcount[row]),
+                "absent": absent[row].tolist(),
+                "available": available[row].tolist(),
+            }
+            for row, (dept_id, name, _) in enumerate(departments)
+        ],
+        "total": {
+            "department_id": department_id,
+            "name": None,
+            "headcount": int(headcount.sum()),
+            "absent": absent.sum(axis=0).tolist(),
+            "available": available.sum(axis=0).tolist(),
+        },
+    }
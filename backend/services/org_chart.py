@@ -0,0 +1,170 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import delete, insert, literal, select, true, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from backend.models.employee import Employee
+from backend.models.employee_hierarchy import EmployeeHierarchy
+
+REBUILD_BATCH_SIZE = 5000
+
+_ENTRY_COLUMNS = (
+    Employee.id,
+    Employee.employee_id,
+    Employee.first_name,
+    Employee.last_name,
+    Employee.position,
+    Employee.department_id,
+    Employee.manager_id,
+    Employee.is_active,
+)
+
+
+class ReportingCycleError(ValueError):
+    """Raised when a new manager is the employee or one of their reports."""
+
+
+def closure_rows(pairs: Iterable[Tuple[int, Optional[int]]]) -> Iterator[dict]:
+    """Closure rows for ``(employee id, manager id)`` pairs.
+
+    Each employee's ancestor list is its manager's list shifted by one, so
+    the table is built in O(rows) with memoised chains. Managers that do not
+    exist end a chain, and a cycle in existing data is cut where it closes
+    rather than looping forever.
+    """
+    managers = dict(pairs)
+    chains: Dict[int, List[int]] = {}
+    for start in managers:
+        path = []
+        on_path = set()
+        node = start
+        while node in managers and node not in chains and node not in on_path:
+            path.append(node)
+            on_path.add(node)
+            node = managers.get(node)
+        above = chains.get(node, []) if node not in on_path else []
+        for employee_id in reversed(path):
+            above = [employee_id] + above
+            chains[employee_id] = above
+    for employee_id, chain in chains.items():
+        for depth, ancestor_id in enumerate(chain):
+            yield {"ancestor_id": ancestor_id, "descendant_id": employee_id, "depth": depth}
+
+
+def rebuild_hierarchy(conn: Connection, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """Recompute the whole closure table from ``manager_id``; returns rows written."""
+    pairs = conn.execute(select(Employee.id, Employee.manager_id)).all()
+    conn.execute(delete(EmployeeHierarchy))
+    count = 0
+    batch = []
+    for row in closure_rows(pairs):
+        batch.append(row)
+        if len(batch) == batch_size:
+            conn.execute(insert(EmployeeHierarchy), batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        conn.execute(insert(EmployeeHierarchy), batch)
+        count += len(batch)
+    return count
+
+
+async def attach_employees(db: AsyncSession, pairs: List[Tuple[int, Optional[int]]]) -> None:
+    """Add closure rows for new employees whose managers are already linked."""
+    if not pairs:
+        return
+    manager_ids = {manager_id for _, manager_id in pairs if manager_id is not None}
+    chains: Dict[int, List[Tuple[int, int]]] = {}
+    if manager_ids:
+        result = await db.execute(
+            select(EmployeeHierarchy.descendant_id, EmployeeHierarchy.ancestor_id, EmployeeHierarchy.depth)
+            .where(EmployeeHierarchy.descendant_id.in_(manager_ids))
+        )
+        for manager_id, ancestor_id, depth in result:
+            chains.setdefault(manager_id, []).append((ancestor_id, depth))
+    rows = []
+    for employee_id, manager_id in pairs:
+        rows.append({"ancestor_id": employee_id, "descendant_id": employee_id, "depth": 0})
+        for ancestor_id, depth in chains.get(manager_id, ()):
+            rows.append({"ancestor_id": ancestor_id, "descendant_id": employee_id, "depth": depth + 1})
+    await db.execute(insert(EmployeeHierarchy), rows)
+
+
+async def move_employee(db: AsyncSession, employee_id: int, manager_id: Optional[int]) -> None:
+    """Re-parent ``employee_id`` and its whole subtree under ``manager_id``.
+
+    Only the rows linking the subtree to its old chain are deleted and the
+    cross product of the new chain and the subtree is inserted, so the cost
+    is proportional to subtree size times chain length, not the org size.
+    """
+    if manager_id is not None:
+        in_subtree = await db.scalar(
+            select(EmployeeHierarchy.depth).where(
+                EmployeeHierarchy.ancestor_id == employee_id,
+                EmployeeHierarchy.descendant_id == manager_id,
+            )
+        )
+        if in_subtree is not None or manager_id == employee_id:
+            raise ReportingCycleError()
+
+    subtree = select(EmployeeHierarchy.descendant_id).where(EmployeeHierarchy.ancestor_id == employee_id)
+    await db.execute(
+        delete(EmployeeHierarchy).where(
+            EmployeeHierarchy.descendant_id.in_(subtree),
+            EmployeeHierarchy.ancestor_id.not_in(subtree),
+        )
+    )
+    if manager_id is None:
+        return
+    above = aliased(EmployeeHierarchy)
+    below = aliased(EmployeeHierarchy)
+    await db.execute(
+        insert(EmployeeHierarchy).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(above.ancestor_id, below.descendant_id, above.depth + below.depth + literal(1))
+            .select_from(above)
+            .join(below, true())
+            .where(above.descendant_id == manager_id, below.ancestor_id == employee_id),
+        )
+    )
+
+
+async def detach_employee(db: AsyncSession, employee_id: int) -> None:
+    """Unlink an employee about to be deleted; their direct reports move up to their manager."""
+    manager_id = await db.scalar(select(Employee.manager_id).where(Employee.id == employee_id))
+    reports = (await db.execute(select(Employee.id).where(Employee.manager_id == employee_id))).scalars().all()
+    for report_id in reports:
+        await move_employee(db, report_id, manager_id)
+    if reports:
+        await db.execute(update(Employee).where(Employee.id.in_(reports)).values(manager_id=manager_id))
+    await db.execute(
+        delete(EmployeeHierarchy).where(
+            (EmployeeHierarchy.ancestor_id == employee_id) | (EmployeeHierarchy.descendant_id == employee_id)
+        )
+    )
+
+
+async def get_reports(db: AsyncSession, employee_id: int, depth: Optional[int] = None) -> List[dict]:
+    """Direct (depth 1) and transitive reports, nearest first."""
+    stmt = (
+        select(*_ENTRY_COLUMNS, EmployeeHierarchy.depth)
+        .join(EmployeeHierarchy, EmployeeHierarchy.descendant_id == Employee.id)
+        .where(EmployeeHierarchy.ancestor_id == employee_id, EmployeeHierarchy.depth > 0)
+        .order_by(EmployeeHierarchy.depth, Employee.id)
+    )
+    if depth is not None:
+        stmt = stmt.where(EmployeeHierarchy.depth <= depth)
+    return [dict(row) for row in (await db.execute(stmt)).mappings()]
+
+
+async def get_management_chain(db: AsyncSession, employee_id: int) -> List[dict]:
+    """Managers above ``employee_id``, from the direct manager to the top."""
+    stmt = (
+        select(*_ENTRY_COLUMNS, EmployeeHierarchy.depth)
+        .join(EmployeeHierarchy, EmployeeHierarchy.ancestor_id == Employee.id)
+        .where(EmployeeHierarchy.descendant_id == employee_id, EmployeeHierarchy.depth > 0)
+        .order_by(EmployeeHierarchy.depth)
+    )
+    return [dict(row) for row in (await db.execute(stmt)).mappings()]
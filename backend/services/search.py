@@ -0,0 +1,282 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event, func, inspect, or_, select, text
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.core.config import settings
+from backend.core.database import engine
+from backend.models.document import Document
+from backend.models.employee import Employee
+from backend.models.training import Training
+
+REINDEX_BATCH_SIZE = 5000
+
+
+class SearchEntity:
+    """How one model is flattened into a (title, body) search document."""
+
+    def __init__(self, name: str, code: int, model, title_fields: Sequence[str], body_fields: Sequence[str]):
+        self.name = name
+        self.code = code
+        self.model = model
+        self.title_fields = tuple(title_fields)
+        self.body_fields = tuple(body_fields)
+        self.fields = self.title_fields + self.body_fields
+
+    def columns(self):
+        return [self.model.id] + [getattr(self.model, field) for field in self.fields]
+
+    def document(self, values) -> Tuple[str, str]:
+        def join(fields):
+            return " ".join(str(values[field]) for field in fields if values[field] not in (None, ""))
+        return join(self.title_fields), join(self.body_fields)
+
+
+SEARCH_ENTITIES = [
+    SearchEntity("employee", 1, Employee, ("first_name", "last_name"), ("position", "employee_id")),
+    SearchEntity("document", 2, Document, ("title",), ("description", "tags")),
+    SearchEntity("training", 3, Training, ("title",), ("provider",)),
+]
+_BY_NAME = {entity.name: entity for entity in SEARCH_ENTITIES}
+_BY_MODEL = {entity.model: entity for entity in SEARCH_ENTITIES}
+_BY_CODE = {entity.code: entity for entity in SEARCH_ENTITIES}
+
+
+def match_terms(query: str) -> List[str]:
+    # Only word characters reach the backend, so user input can never be
+    # parsed as FTS query syntax
+    return re.findall(r"\w+", query.lower())
+
+
+class SearchBackend(ABC):
+    """Interface for search index implementations.
+
+    ``upsert``/``remove``/``rebuild`` run on the sync connection of the
+    writing transaction, so the index commits or rolls back with the data.
+    The index itself is created by ``ensure_search_index`` at startup and
+    by ``init_db``, never from a request or a flush.
+    """
+
+    name = ""
+
+    def ensure_index(self, conn: Connection) -> bool:
+        """Create the index if missing; True when it was created (and is empty)."""
+        return False
+
+    def upsert(self, conn: Connection, entity: SearchEntity, rows: Iterable) -> None:
+        pass
+
+    def remove(self, conn: Connection, entity: SearchEntity, ids: Iterable[int]) -> None:
+        pass
+
+    def rebuild(self, conn: Connection, batch_size: int = REINDEX_BATCH_SIZE) -> int:
+        return 0
+
+    @abstractmethod
+    async def search(self, db: AsyncSession, terms: List[str], entities: List[SearchEntity],
+                     limit: int, offset: int) -> Tuple[int, List[dict]]:
+        """Return ``(total, hits)`` for the already tokenised ``terms``."""
+
+    def reindex(self, conn: Connection, entity: SearchEntity, ids: Iterable[int]) -> None:
+        ids = list(ids)
+        for start in range(0, len(ids), REINDEX_BATCH_SIZE):
+            chunk = ids[start:start + REINDEX_BATCH_SIZE]
+            rows = conn.execute(select(*entity.columns()).where(entity.model.id.in_(chunk))).mappings()
+            self.upsert(conn, entity, rows)
+
+
+class SqliteFtsBackend(SearchBackend):
+    """SQLite FTS5 index with bm25 ranking.
+
+    All entities share one virtual table; the rowid encodes the entity
+    (``id * 4 + code``) so updates and deletes are rowid lookups and a
+    query is a single inverted-index probe, never a scan of the source
+    tables.
+    """
+
+    name = "sqlite_fts"
+    table = "search_index"
+
+    def ensure_index(self, conn: Connection) -> bool:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": self.table}
+        ).first()
+        if exists:
+            return False
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE {self.table} USING fts5("
+            "title, body, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        ))
+        return True
+
+    @staticmethod
+    def _rowid(entity: SearchEntity, entity_id: int) -> int:
+        return entity_id * 4 + entity.code
+
+    def upsert(self, conn: Connection, entity: SearchEntity, rows: Iterable) -> None:
+        params = []
+        for row in rows:
+            title, body = entity.document(row)
+            params.append({"rowid": self._rowid(entity, row["id"]), "title": title, "body": body})
+        if params:
+            conn.execute(text(f"DELETE FROM {self.table} WHERE rowid = :rowid"), [{"rowid": p["rowid"]} for p in params])
+            conn.execute(text(f"INSERT INTO {self.table} (rowid, title, body) VALUES (:rowid, :title, :body)"), params)
+
+    def remove(self, conn: Connection, entity: SearchEntity, ids: Iterable[int]) -> None:
+        params = [{"rowid": self._rowid(entity, entity_id)} for entity_id in ids]
+        if params:
+            conn.execute(text(f"DELETE FROM {self.table} WHERE rowid = :rowid"), params)
+
+    def rebuild(self, conn: Connection, batch_size: int = REINDEX_BATCH_SIZE) -> int:
+        conn.execute(text(f"DELETE FROM {self.table}"))
+        count = 0
+        for entity in SEARCH_ENTITIES:
+            # Keyset batches, each fully read before it is written, so no
+            # cursor stays open on the connection doing the inserts
+            last_id = 0
+            while True:
+                rows = conn.execute(
+                    select(*entity.columns()).where(entity.model.id > last_id)
+                    .order_by(entity.model.id).limit(batch_size)
+                ).mappings().all()
+                if not rows:
+                    break
+                self.upsert(conn, entity, rows)
+                count += len(rows)
+                last_id = rows[-1]["id"]
+        return count
+
+    async def search(self, db, terms, entities, limit, offset):
+        params = {"match": " ".join(f'"{term}"*' for term in terms), "limit": limit, "offset": offset}
+        where = f"{self.table} MATCH :match"
+        if len(entities) < len(SEARCH_ENTITIES):
+            codes = ", ".join(str(entity.code) for entity in entities)
+            where += f" AND (rowid % 4) IN ({codes})"
+        total = (await db.execute(text(f"SELECT count(*) FROM {self.table} WHERE {where}"), params)).scalar()
+        rows = await db.execute(text(
+            f"SELECT rowid, title, snippet({self.table}, -1, '<mark>', '</mark>', '…', 12) AS snippet, "
+            f"bm25({self.table}, 10.0, 1.0) AS rank "
+            f"FROM {self.table} WHERE {where} ORDER BY rank LIMIT :limit OFFSET :offset"
+        ), params)
+        hits = [
+            {"type": _BY_CODE[row.rowid % 4].name, "id": row.rowid // 4,
+             "title": row.title, "snippet": row.snippet, "rank": -row.rank}
+            for row in rows
+        ]
+        return total, hits
+
+
+class LikeBackend(SearchBackend):
+    """Portable fallback: case-insensitive substring match on the source tables.
+
+    Needs no index maintenance but scans the tables, and every hit ranks
+    equally. Meant for databases without a native full-text backend here.
+    """
+
+    name = "like"
+
+    async def search(self, db, terms, entities, limit, offset):
+        total = 0
+        hits = []
+        for entity in entities:
+            columns = [getattr(entity.model, field) for field in entity.fields]
+            conditions = [or_(*(column.ilike(f"%{term}%") for column in columns)) for term in terms]
+            total += (await db.execute(select(func.count()).select_from(entity.model).where(*conditions))).scalar()
+            rows = await db.execute(
+                select(*entity.columns()).where(*conditions).order_by(entity.model.id).limit(offset + limit)
+            )
+            for row in rows.mappings():
+                title, body = entity.document(row)
+                hits.append({"type": entity.name, "id": row["id"], "title": title, "snippet": body, "rank": 0.0})
+        return total, hits[offset:offset + limit]
+
+
+SEARCH_BACKENDS = {
+    SqliteFtsBackend.name: SqliteFtsBackend,
+    LikeBackend.name: LikeBackend,
+}
+
+
+def _create_backend() -> SearchBackend:
+    name = settings.SEARCH_BACKEND
+    if name == "auto":
+        dialect = make_url(settings.DATABASE_URL).get_backend_name()
+        name = SqliteFtsBackend.name if dialect == "sqlite" else LikeBackend.name
+    if name not in SEARCH_BACKENDS:
+        raise ValueError(f"Unknown SEARCH_BACKEND {name!r}; expected one of {', '.join(SEARCH_BACKENDS)}")
+    return SEARCH_BACKENDS[name]()
+
+
+search_backend = _create_backend()
+
+
+def ensure_search_index(rebuild: bool = False) -> Optional[int]:
+    """Create the index on the sync engine, backfilling it when it is new.
+
+    Returns the number of rows indexed, or None when the index already
+    existed and ``rebuild`` was not asked for.
+    """
+    with engine.begin() as conn:
+        created = search_backend.ensure_index(conn)
+        # A brand new database has nothing to index until init_db creates the tables
+        tables = inspect(conn)
+        if (created or rebuild) and all(tables.has_table(entity.model.__tablename__) for entity in SEARCH_ENTITIES):
+            return search_backend.rebuild(conn)
+    return None
+
+
+def get_entities(names: Optional[Iterable[str]] = None) -> List[SearchEntity]:
+    return [_BY_NAME[name] for name in names] if names else list(SEARCH_ENTITIES)
+
+
+async def search(db: AsyncSession, query: str, types: Optional[Iterable[str]], limit: int, offset: int):
+    """Return ``(total, hits)`` for ``query``, best match first."""
+    terms = match_terms(query)
+    if not terms:
+        return 0, []
+    return await search_backend.search(db, terms, get_entities(types), limit, offset)
+
+
+async def reindex(db: AsyncSession, model, ids: Iterable[int]) -> None:
+    """Index rows written with Core statements, which bypass the ORM hooks."""
+    entity = _BY_MODEL[model]
+    ids = list(ids)
+
+    await db.run_sync(lambda session: search_backend.reindex(session.connection(), entity, ids))
+
+
+def _changed(obj, entity: SearchEntity) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[field].history.has_changes() for field in entity.fields)
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_search_index(session, flush_context):
+    upserts: Dict[SearchEntity, list] = {}
+    removals: Dict[SearchEntity, list] = {}
+    for obj in session.new:
+        entity = _BY_MODEL.get(type(obj))
+        if entity is not None:
+            upserts.setdefault(entity, []).append(obj)
+    for obj in session.dirty:
+        entity = _BY_MODEL.get(type(obj))
+        if entity is not None and _changed(obj, entity):
+            upserts.setdefault(entity, []).append(obj)
+    for obj in session.deleted:
+        entity = _BY_MODEL.get(type(obj))
+        if entity is not None:
+            removals.setdefault(entity, []).append(obj.id)
+    if not upserts and not removals:
+        return
+
+    conn = session.connection()
+    for entity, objs in upserts.items():
+        search_backend.upsert(conn, entity, [
+            {"id": obj.id, **{field: getattr(obj, field) for field in entity.fields}} for obj in objs
+        ])
+    for entity, ids in removals.items():
+        search_backend.remove(conn, entity, ids)
@@ -0,0 +1,293 @@
+"""
+Statutory Sick Pay from SICK_LEAVE absences.
+
+Sickness on consecutive days forms a period of incapacity for work (PIW)
+once it lasts at least four calendar days. PIWs no more than eight weeks
+apart link into one, and SSP is paid per qualifying day after the waiting
+days, up to 28 weeks per linked PIW. Qualifying days follow the
+SSP_QUALIFYING_DAYS weekly pattern.
+
+Everything runs on arrays built from one scan of the sickness absences,
+sorted by employee and start date, so a payroll run over every employee
+costs one query however long the history.
+"""
+
+from datetime import date, timedelta
+from typing import Dict, NamedTuple, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.config import settings
+from backend.models.absence import Absence, AbsenceType
+from backend.models.employee import Employee
+from backend.services.absence_analytics import SICKNESS_STATUSES
+
+PIW_MIN_DAYS = 4
+LINKING_GAP_DAYS = 56
+MAX_WEEKS = 28
+MAX_PIW_YEARS = 3
+WEEKS_PER_YEAR = 52
+
+
+class SSPRate(NamedTuple):
+    effective_from: date
+    weekly_rate: float
+    waiting_days: int
+    lower_earnings_limit: Optional[float]  # no SSP when weekly earnings are below this
+    earnings_percent: Optional[float]  # SSP capped at this share of weekly earnings
+
+
+SSP_RATES = [
+    SSPRate(date(2014, 4, 6), 87.55, 3, 111.0, None),
+    SSPRate(date(2015, 4, 6), 88.45, 3, 112.0, None),
+    SSPRate(date(2017, 4, 6), 89.35, 3, 113.0, None),
+    SSPRate(date(2018, 4, 6), 92.05, 3, 116.0, None),
+    SSPRate(date(2019, 4, 6), 94.25, 3, 118.0, None),
+    SSPRate(date(2020, 4, 6), 95.85, 3, 120.0, None),
+    SSPRate(date(2021, 4, 6), 96.35, 3, 120.0, None),
+    SSPRate(date(2022, 4, 6), 99.35, 3, 123.0, None),
+    SSPRate(date(2023, 4, 6), 109.40, 3, 123.0, None),
+    SSPRate(date(2024, 4, 6), 116.75, 3, 123.0, None),
+    SSPRate(date(2025, 4, 6), 118.75, 3, 125.0, None),
+    # Employment Rights Act 2025: no waiting days and no earnings threshold;
+    # low earners get 80% of their weekly earnings instead of the flat rate
+    SSPRate(date(2026, 4, 6), 123.25, 0, None, 80.0),
+]
+_RATE_STARTS = np.array([rate.effective_from for rate in SSP_RATES], dtype="datetime64[D]").astype(np.int64)
+_WEEKLY_RATE = np.array([rate.weekly_rate for rate in SSP_RATES])
+_WAITING_DAYS = np.array([rate.waiting_days for rate in SSP_RATES])
+_LOWER_EARNINGS_LIMIT = np.array([np.nan if rate.lower_earnings_limit is None else rate.lower_earnings_limit
+                                  for rate in SSP_RATES])
+_EARNINGS_PERCENT = np.array([np.nan if rate.earnings_percent is None else rate.earnings_percent for rate in SSP_RATES])
+
+# Wider than any day number, so (employee, day) pairs sort as one integer
+_EMPLOYEE_STRIDE = 1 << 20
+
+
+class PIWs(NamedTuple):
+    """Periods of incapacity as parallel arrays, ordered by employee then start."""
+    employee_id: np.ndarray
+    start: np.ndarray  # day numbers (days since 1970-01-01)
+    end: np.ndarray
+    chain: np.ndarray  # linked PIWs share a chain number
+    chain_start: np.ndarray
+    qualifying_days: np.ndarray  # counts within the period
+    waiting_days: np.ndarray
+    paid_days: np.ndarray
+    amount: np.ndarray
+    chain_paid_days: np.ndarray  # paid days in the whole linked PIW up to the period end
+
+
+def _day_numbers(values) -> np.ndarray:
+    return np.asarray(values, dtype="datetime64[D]").astype(np.int64)
+
+
+def to_date(day: int) -> date:
+    return date(1970, 1, 1) + timedelta(days=int(day))
+
+
+def qualifying_days_per_week(weekmask: str = settings.SSP_QUALIFYING_DAYS) -> int:
+    return weekmask.count("1")
+
+
+def _years_later(days: np.ndarray, years: int) -> np.ndarray:
+    """Day numbers ``years`` later on the same day of the month (29 February moves to 1 March)."""
+    dates = days.astype("datetime64[D]")
+    months = dates.astype("datetime64[M]")
+    return ((months + 12 * years).astype("datetime64[D]") + (dates - months.astype("datetime64[D]"))).astype(np.int64)
+
+
+def _ordinal_in_group(flags: np.ndarray, group: np.ndarray) -> np.ndarray:
+    """For each element, how many flagged elements precede it in its group (groups are contiguous)."""
+    before = np.cumsum(flags) - flags
+    if not len(group):
+        return before
+    first = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+    return before - np.repeat(before[first], np.diff(np.r_[first, len(group)]))
+
+
+def calculate_ssp(employee_ids, starts, ends, weekly_earnings: Dict[int, Optional[float]],
+                  period_start: Optional[date], period_end: date,
+                  weekmask: str = settings.SSP_QUALIFYING_DAYS) -> PIWs:
+    """SSP for sickness spells sorted by employee id then start date.
+
+    Days after ``period_end`` are ignored; amounts and day counts cover
+    ``[period_start, period_end]``, while waiting days and the 28-week cap
+    take the whole history into account. ``weekly_earnings`` is keyed by
+    employee id; an employee without earnings is assumed to qualify at the
+    flat rate.
+    """
+    employee = np.asarray(employee_ids, dtype=np.int64)
+    start, end = _day_numbers(starts), _day_numbers(ends)
+    last_day = _day_numbers(period_end)
+    first_day = _day_numbers(period_start) if period_start is not None else np.iinfo(np.int64).min
+
+    # Overlapping or back-to-back spells are one continuous run of sickness.
+    # The running maximum of (employee, end) is the furthest end so far
+    # within the employee, since employees are sorted.
+    reach = np.maximum.accumulate(employee * _EMPLOYEE_STRIDE + end) - employee * _EMPLOYEE_STRIDE
+    new_run = np.r_[True, (employee[1:] != employee[:-1]) | (start[1:] > reach[:-1] + 1)] if len(employee) else \
+        np.zeros(0, dtype=bool)
+    run_first = np.flatnonzero(new_run)
+    run_end = np.maximum.reduceat(end, run_first) if len(run_first) else end[:0]
+    run_employee, run_start = employee[run_first], start[run_first]
+
+    piw = run_end - run_start + 1 >= PIW_MIN_DAYS
+    piw_employee, piw_start, piw_end = run_employee[piw], run_start[piw], run_end[piw]
+    count = len(piw_employee)
+    linked = np.r_[False, (piw_employee[1:] == piw_employee[:-1])
+                   & (piw_start[1:] - piw_end[:-1] - 1 <= LINKING_GAP_DAYS)] if count else np.zeros(0, dtype=bool)
+    chain = np.cumsum(~linked) - 1
+    chain_start = piw_start[~linked][chain]
+
+    # One element per qualifying day of incapacity up to the period end
+    length = piw_end - piw_start + 1
+    piw_of_day = np.repeat(np.arange(count), length)
+    day = piw_start[piw_of_day] + np.arange(length.sum()) - np.repeat(np.cumsum(length) - length, length)
+    keep = (day <= last_day) & np.is_busday(day.astype("datetime64[D]"), weekmask=weekmask)
+    day, piw_of_day = day[keep], piw_of_day[keep]
+    chain_of_day = chain[piw_of_day]
+
+    rate = np.searchsorted(_RATE_STARTS, day, side="right") - 1
+    known_rate = rate >= 0
+    rate = np.maximum(rate, 0)
+    earnings = np.array([np.nan if weekly_earnings.get(e) is None else weekly_earnings[e] for e in piw_employee],
+                        dtype=float)[piw_of_day]
+    lower_limit, percent = _LOWER_EARNINGS_LIMIT[rate], _EARNINGS_PERCENT[rate]
+    # Comparisons with NaN are false: no threshold, or earnings unknown, qualifies.
+    # No SSP is due once a linked PIW has lasted three years.
+    eligible = known_rate & ~(earnings < lower_limit) & (day < _years_later(chain_start, MAX_PIW_YEARS)[piw_of_day])
+
+    # Waiting days are the first eligible qualifying days of the linked PIW,
+    # so ones served in an earlier linked PIW count
+    waiting = eligible & (_ordinal_in_group(eligible, chain_of_day) < _WAITING_DAYS[rate])
+    payable = eligible & ~waiting
+    paid = payable & (_ordinal_in_group(payable, chain_of_day) < MAX_WEEKS * qualifying_days_per_week(weekmask))
+    weekly = np.where(np.isnan(percent) | np.isnan(earnings), _WEEKLY_RATE[rate],
+                      np.minimum(_WEEKLY_RATE[rate], earnings * np.nan_to_num(percent) / 100))
+    daily = weekly / qualifying_days_per_week(weekmask)
+
+    in_period = day >= first_day
+
+    def per_piw(values: np.ndarray) -> np.ndarray:
+        return np.bincount(piw_of_day, weights=values, minlength=count)
+
+    chain_paid = np.bincount(chain_of_day, weights=paid, minlength=chain[-1] + 1 if count else 0)
+    return PIWs(
+        employee_id=piw_employee,
+        start=piw_start,
+        end=piw_end,
+        chain=chain,
+        chain_start=chain_start,
+        qualifying_days=per_piw(in_period).astype(np.int64),
+        waiting_days=per_piw(waiting & in_period).astype(np.int64),
+        paid_days=per_piw(paid & in_period).astype(np.int64),
+        amount=np.round(per_piw(np.where(paid & in_period, daily, 0.0)), 2),
+        chain_paid_days=chain_paid[chain].astype(np.int64),
+    )
+
+
+async def load_sickness(db: AsyncSession, period_end: date, employee_id: Optional[int] = None):
+    """Sickness spells up to ``period_end`` sorted for ``calculate_ssp``, and weekly earnings by employee."""
+    conditions = [Absence.absence_type == AbsenceType.SICK_LEAVE,
+                  Absence.status.in_(SICKNESS_STATUSES),
+                  Absence.start_date <= period_end]
+    salaries = select(Employee.id, Employee.salary)
+    if employee_id is not None:
+        conditions.append(Absence.employee_id == employee_id)
+        salaries = salaries.where(Employee.id == employee_id)
+    rows = (await db.execute(
+        select(Absence.employee_id, Absence.start_date, Absence.end_date)
+        .where(*conditions)
+        .order_by(Absence.employee_id, Absence.start_date)
+    )).all()
+    earnings = {row.id: row.salary / WEEKS_PER_YEAR if row.salary else None for row in (await db.execute(salaries)).all()}
+    columns = tuple(zip(*rows)) if rows else ((), (), ())
+    return columns, earnings
+
+
+def _remaining_weeks(paid_days: np.ndarray, weekmask: str) -> np.ndarray:
+    return np.round(MAX_WEEKS - paid_days / qualifying_days_per_week(weekmask), 2)
+
+
+async def get_employee_ssp(db: AsyncSession, employee_id: int, period_start: Optional[date], period_end: date,
+                           weekmask: str = settings.SSP_QUALIFYING_DAYS) -> dict:
+    """One employee's PIWs overlapping the period, with the SSP due in it and their open linked PIW."""
+    (employee_ids, starts, ends), earnings = await load_sickness(db, period_end, employee_id)
+    piws = calculate_ssp(employee_ids, starts, ends, earnings, period_start, period_end, weekmask)
+    first_day = _day_numbers(period_start) if period_start is not None else None
+    shown = np.ones(len(piws.start), dtype=bool) if first_day is None else piws.end >= first_day
+    periods = [
+        {
+            "start_date": to_date(piws.start[i]),
+            "end_date": to_date(piws.end[i]),
+            "linked_to_previous": bool(i and piws.chain[i] == piws.chain[i - 1]),
+            "linked_period_start": to_date(piws.chain_start[i]),
+            "qualifying_days": int(piws.qualifying_days[i]),
+            "waiting_days": int(piws.waiting_days[i]),
+            "paid_days": int(piws.paid_days[i]),
+            "amount": float(piws.amount[i]),
+        }
+        for i in np.flatnonzero(shown)
+    ]
+    current = None
+    if len(piws.start):
+        # The latest linked PIW stays open to linking for eight weeks after it ends
+        links_until = to_date(piws.end[-1] + LINKING_GAP_DAYS)
+        if links_until >= period_end:
+            current = {
+                "start_date": to_date(piws.chain_start[-1]),
+                "links_until": links_until,
+                "paid_days": int(piws.chain_paid_days[-1]),
+                "weeks_remaining": float(_remaining_weeks(piws.chain_paid_days[-1], weekmask)),
+            }
+    return {
+        "employee_id": employee_id,
+        "period_start": period_start,
+        "period_end": period_end,
+        "qualifying_days_per_week": qualifying_days_per_week(weekmask),
+        "weekly_earnings": earnings.get(employee_id),
+        "periods": periods,
+        "waiting_days": sum(p["waiting_days"] for p in periods),
+        "paid_days": sum(p["paid_days"] for p in periods),
+        "amount": round(sum(p["amount"] for p in periods), 2),
+        "current_linked_period": current,
+    }
+
+
+async def run_ssp_payroll(db: AsyncSession, period_start: date, period_end: date,
+                          weekmask: str = settings.SSP_QUALIFYING_DAYS) -> dict:
+    """SSP for every employee over one pay period, as parallel arrays of the employees with sickness in it."""
+    (employee_ids, starts, ends), earnings = await load_sickness(db, period_end)
+    piws = calculate_ssp(employee_ids, starts, ends, earnings, period_start, period_end, weekmask)
+    active = piws.qualifying_days > 0
+    employees, first = np.unique(piws.employee_id[active], return_index=True)
+    index = np.flatnonzero(active)
+
+    def per_employee(values: np.ndarray) -> np.ndarray:
+        return np.add.reduceat(values[index], first) if len(first) else values[:0]
+
+    # The employee's last PIW in the period carries their linked-PIW state
+    last = index[np.r_[first[1:], len(index)] - 1] if len(first) else index
+    amount = np.round(per_employee(piws.amount), 2)
+    return {
+        "period_start": period_start,
+        "period_end": period_end,
+        "qualifying_days_per_week": qualifying_days_per_week(weekmask),
+        "employees": {
+            "employee_id": employees,
+            "periods": per_employee(np.ones(len(piws.start), dtype=np.int64)),
+            "qualifying_days": per_employee(piws.qualifying_days),
+            "waiting_days": per_employee(piws.waiting_days),
+            "paid_days": per_employee(piws.paid_days),
+            "amount": amount,
+            "weeks_remaining": _remaining_weeks(piws.chain_paid_days[last], weekmask),
+        },
+        "totals": {
+            "employees": len(employees),
+            "paid_days": int(piws.paid_days[index].sum()),
+            "amount": round(float(amount.sum()), 2),
+        },
+    }
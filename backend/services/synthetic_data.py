@@ -0,0 +1,407 @@
+import json
+import random
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List
+
+from sqlalchemy import insert, text
+from sqlalchemy.engine import Connection
+
+from backend.models.absence import Absence, AbsenceStatus, AbsenceType
+from backend.models.department import Department
+from backend.models.document import Document, DocumentStatus, DocumentType
+from backend.models.employee import Employee
+from backend.models.employee_hierarchy import EmployeeHierarchy
+from backend.models.leave_balance import LeaveBalance
+from backend.models.performance import Performance, PerformanceRating
+from backend.models.training import Training, TrainingStatus, TrainingType
+from backend.models.user import User, UserRole
+from backend.services.leave_balance import accrued_entitlement, debit, rebuild_leave_ledger
+from backend.services.org_chart import rebuild_hierarchy
+from backend.services.search import search_backend
+from backend.services.working_days import get_calendar
+
+DEPARTMENTS = [
+    ("Engineering", "Software development and technical teams"),
+    ("Sales", "Sales and business development"),
+    ("Marketing", "Marketing and communications"),
+    ("HR", "Human resources and people operations"),
+    ("Finance", "Finance and accounting"),
+    ("Operations", "Business operations and support"),
+    ("Customer Success", "Customer onboarding and account management"),
+    ("Support", "Technical and customer support"),
+    ("Legal", "Legal and compliance"),
+    ("Product", "Product management"),
+    ("Design", "Product and brand design"),
+    ("Data", "Data engineering and analytics"),
+    ("Security", "Information security"),
+    ("IT", "Internal IT and infrastructure"),
+    ("Procurement", "Purchasing and supplier management"),
+    ("Facilities", "Offices and workplace services"),
+    ("Logistics", "Warehousing and distribution"),
+    ("Manufacturing", "Production and quality"),
+    ("Research", "Research and development"),
+    ("Training", "Learning and development"),
+]
+
+FIRST_NAMES = [
+    "Oliver", "Amelia", "George", "Isla", "Harry", "Ava", "Noah", "Mia", "Jack", "Ivy",
+    "Leo", "Lily", "Arthur", "Isabella", "Muhammad", "Rosie", "Oscar", "Sophia", "Charlie", "Grace",
+    "Jacob", "Freya", "Thomas", "Poppy", "Henry", "Evie", "William", "Ella", "James", "Emily",
+    "Alfie", "Florence", "Theo", "Willow", "Freddie", "Sienna", "Archie", "Daisy", "Joshua", "Alice",
+]
+
+LAST_NAMES = [
+    "Smith", "Jones", "Taylor", "Brown", "Williams", "Wilson", "Johnson", "Davies", "Patel", "Robinson",
+    "Wright", "Thompson", "Evans", "Walker", "White", "Roberts", "Green", "Hall", "Thomas", "Clarke",
+    "Jackson", "Wood", "Harris", "Edwards", "Turner", "Martin", "Cooper", "Hill", "Ward", "Hughes",
+    "Moore", "Clark", "King", "Harrison", "Lewis", "Baker", "Lee", "Allen", "Morris", "Khan",
+]
+
+POSITIONS = ["Associate", "Specialist", "Senior Specialist", "Analyst", "Engineer", "Coordinator", "Lead"]
+
+MANDATORY_COURSES = [
+    "Health and Safety Awareness",
+    "Fire Safety",
+    "GDPR and Data Protection",
+    "Equality, Diversity and Inclusion",
+    "Anti-Bribery and Corruption",
+    "Information Security Essentials",
+    "Safeguarding",
+    "Manual Handling",
+]
+
+OPTIONAL_COURSES = [
+    ("Leadership Foundations", "Institute of Leadership"),
+    ("Advanced Excel", "LinkedIn Learning"),
+    ("Project Management Fundamentals", "APM"),
+    ("Effective Communication", "Internal Academy"),
+    ("Negotiation Skills", "Internal Academy"),
+]
+
+RATINGS = list(PerformanceRating)
+RATING_WEIGHTS = [10, 35, 40, 11, 4]
+
+# Employees per manager when building reporting lines
+MANAGER_SPAN = 8
+# Reference "today" of a generated dataset, fixed so a seed always gives the same rows
+DEFAULT_AS_OF = date(2026, 1, 1)
+
+
+def _years_before(day: date, years: int) -> date:
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:  # 29 February
+        return day.replace(year=day.year - years, day=28)
+
+
+def _batched(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _bulk_insert(conn: Connection, model, rows: Iterable[dict], batch_size: int) -> int:
+    count = 0
+    for batch in _batched(rows, batch_size):
+        conn.execute(insert(model.__table__), batch)
+        count += len(batch)
+    return count
+
+
+def _reset_sequences(conn: Connection, models) -> None:
+    # Explicit primary keys leave PostgreSQL serial sequences behind
+    if conn.dialect.name != "postgresql":
+        return
+    for model in models:
+        table = model.__tablename__
+        conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {table}), 1))"
+        ))
+
+
+class SyntheticDataset:
+    """Deterministic generator for a production-sized HR dataset.
+
+    Primary keys are assigned up front so that reporting lines, reviewers
+    and foreign keys can be wired without reading anything back, and every
+    table is written with multi-row INSERTs in ``batch_size`` chunks.
+    """
+
+    def __init__(self, employees: int, years: int, seed: int = 42, as_of: date = DEFAULT_AS_OF):
+        self.n_employees = employees
+        self.years = years
+        self.as_of = as_of
+        self.window_start = _years_before(self.as_of, years)
+        self.rng = random.Random(seed)
+        self.departments = DEPARTMENTS[:max(6, min(len(DEPARTMENTS), employees // 250))]
+        # Filled in while employees are generated
+        self.hire_dates: List[date] = []
+        self.employment_types: List[str] = []
+        self.managers: List[int] = []
+
+    def _department_of(self, index: int) -> int:
+        return index % len(self.departments) + 1
+
+    def department_rows(self) -> Iterator[dict]:
+        for dept_id, (name, description) in enumerate(self.departments, start=1):
+            # The first employee generated for each department heads it
+            yield {"id": dept_id, "name": name, "description": description,
+                   "manager_id": dept_id, "is_active": True}
+
+    def user_rows(self, password_hash: str) -> Iterator[dict]:
+        for index in range(self.n_employees):
+            role = UserRole.MANAGER if index < len(self.departments) else UserRole.EMPLOYEE
+            yield {
+                "id": index + 1,
+                "email": f"employee{index + 1}@company.com",
+                "username": f"employee{index + 1}",
+                "full_name": self._name(index),
+                "hashed_password": password_hash,
+                "role": role,
+                "is_active": True,
+            }
+
+    def _name(self, index: int) -> str:
+        return f"{FIRST_NAMES[index % len(FIRST_NAMES)]} {LAST_NAMES[(index * 7 + index // len(FIRST_NAMES)) % len(LAST_NAMES)]}"
+
+    def employee_rows(self) -> Iterator[dict]:
+        rng = self.rng
+        n_departments = len(self.departments)
+        earliest_hire = _years_before(self.as_of, max(self.years * 3, 10))
+        hire_span = (self.as_of - earliest_hire).days
+        for index in range(self.n_employees):
+            # Employees are dealt round-robin into departments; within a
+            # department the k-th member reports to member (k - 1) // span,
+            # which gives a balanced tree per department.
+            position_in_dept = index // n_departments
+            if position_in_dept == 0:
+                manager_id = None
+            else:
+                manager_index = ((position_in_dept - 1) // MANAGER_SPAN) * n_departments + index % n_departments
+                manager_id = manager_index + 1
+            hire_date = earliest_hire + timedelta(days=rng.randrange(hire_span))
+            first_name, last_name = self._name(index).split(" ", 1)
+            employment_type = rng.choices(["Full-time", "Part-time", "Contract"], [80, 15, 5])[0]
+            self.hire_dates.append(hire_date)
+            self.employment_types.append(employment_type)
+            self.managers.append(manager_id)
+            yield {
+                "id": index + 1,
+                "employee_id": f"EMP{index + 1:07d}",
+                "user_id": index + 1,
+                "department_id": self._department_of(index),
+                "first_name": first_name,
+                "last_name": last_name,
+                "date_of_birth": hire_date - timedelta(days=rng.randint(20 * 365, 45 * 365)),
+                "gender": rng.choice(["Female", "Male", "Non-binary"]),
+                "hire_date": hire_date,
+                "position": "Head of Department" if manager_id is None else rng.choice(POSITIONS),
+                "salary": round(rng.lognormvariate(10.6, 0.35), -2),
+                "employment_type": employment_type,
+                "manager_id": manager_id,
+                "is_active": rng.random() > 0.04,
+            }
+
+    def _spells(self, start: date, end: date, per_year: float, max_days: int) -> Iterator[tuple]:
+        rng = self.rng
+        span = (end - start).days
+        if span <= 0:
+            return
+        count = int(rng.expovariate(1 / per_year) * span / 365 + 0.5)
+        for _ in range(count):
+            first = start + timedelta(days=rng.randrange(span))
+            last = min(first + timedelta(days=rng.randint(1, max_days) - 1), end)
+            yield first, last
+
+    def absence_rows(self) -> Iterator[dict]:
+        rng = self.rng
+        horizon = self.as_of + timedelta(days=90)
+        calendar = get_calendar()
+        for index, hire_date in enumerate(self.hire_dates):
+            start = max(hire_date, self.window_start)
+            spells = [(AbsenceType.ANNUAL_LEAVE, s) for s in self._spells(start, horizon, 6, 10)]
+            spells += [(AbsenceType.SICK_LEAVE, s) for s in self._spells(start, self.as_of, 2, 7)]
+            if rng.random() < 0.15:
+                kind = rng.choice([AbsenceType.PERSONAL_LEAVE, AbsenceType.BEREAVEMENT_LEAVE, AbsenceType.OTHER])
+                spells += [(kind, s) for s in self._spells(start, self.as_of, 1, 3)]
+            # Annual leave booked per leave year, kept within the entitlement
+            booked: Dict[int, float] = {}
+            for absence_type, (first, last) in spells:
+                if first > self.as_of:
+                    status = rng.choices([AbsenceStatus.PENDING, AbsenceStatus.APPROVED], [60, 40])[0]
+                else:
+                    status = rng.choices(
+                        [AbsenceStatus.APPROVED, AbsenceStatus.REJECTED, AbsenceStatus.CANCELLED], [92, 4, 4]
+                    )[0]
+                days = calendar.working_days(first, last)
+                if not days and absence_type == AbsenceType.ANNUAL_LEAVE:
+                    continue
+                contribution = debit(absence_type, status, first, days)
+                if contribution is not None:
+                    year = contribution[0]
+                    if booked.get(year, 0.0) + days > accrued_entitlement(hire_date, self.employment_types[index], year):
+                        continue
+                    booked[year] = booked.get(year, 0.0) + days
+                yield {
+                    "employee_id": index + 1,
+                    "absence_type": absence_type,
+                    "status": status,
+                    "start_date": first,
+                    "end_date": last,
+                    "total_days": days,
+                    "approved_by": self.managers[index] if status == AbsenceStatus.APPROVED else None,
+                }
+
+    def performance_rows(self) -> Iterator[dict]:
+        rng = self.rng
+        for index, hire_date in enumerate(self.hire_dates):
+            reviewer = self.managers[index] or index + 1
+            for year in range(self.window_start.year, self.as_of.year):
+                period_start = max(date(year, 1, 1), hire_date)
+                period_end = date(year, 12, 31)
+                if period_start >= period_end:
+                    continue
+                ratings = rng.choices(RATINGS, RATING_WEIGHTS, k=6)
+                yield {
+                    "employee_id": index + 1,
+                    "reviewer_id": reviewer,
+                    "review_date": date(year + 1, 1, 15) + timedelta(days=rng.randrange(45)),
+                    "review_period_start": period_start,
+                    "review_period_end": period_end,
+                    "overall_rating": ratings[0],
+                    "technical_skills": ratings[1],
+                    "communication": ratings[2],
+                    "teamwork": ratings[3],
+                    "leadership": ratings[4],
+                    "initiative": ratings[5],
+                    "is_completed": True,
+                    "employee_acknowledged": rng.random() < 0.9,
+                }
+
+    def training_rows(self) -> Iterator[dict]:
+        rng = self.rng
+        for index, hire_date in enumerate(self.hire_dates):
+            start = max(hire_date, self.window_start)
+            due_span = (self.as_of - start).days + 60
+            for title in MANDATORY_COURSES:
+                due = start + timedelta(days=rng.randrange(due_span))
+                roll = rng.random()
+                if roll < 0.75 and due <= self.as_of + timedelta(days=30):
+                    completed = due - timedelta(days=rng.randint(0, 13))
+                    expiry = completed + timedelta(days=365 * rng.choice([1, 2, 3]))
+                    status = TrainingStatus.EXPIRED if expiry < self.as_of else TrainingStatus.COMPLETED
+                    progress, score = 100.0, round(rng.uniform(60, 100), 1)
+                else:
+                    completed = expiry = score = None
+                    status = TrainingStatus.IN_PROGRESS if roll < 0.9 else TrainingStatus.NOT_STARTED
+                    progress = rng.choice([0.0, 25.0, 50.0, 75.0]) if status == TrainingStatus.IN_PROGRESS else 0.0
+                yield {
+                    "employee_id": index + 1,
+                    "title": title,
+                    "training_type": TrainingType.MANDATORY,
+                    "provider": "Internal Academy",
+                    "start_date": completed or (due - timedelta(days=14)),
+                    "end_date": completed,
+                    "due_date": due,
+                    "completion_date": completed,
+                    "status": status,
+                    "progress_percentage": progress,
+                    "score": score,
+                    "expiry_date": expiry,
+                    "duration_hours": 1.5,
+                    "cost": 0.0,
+                }
+            if rng.random() < 0.3:
+                title, provider = rng.choice(OPTIONAL_COURSES)
+                course_start = self.window_start + timedelta(days=rng.randrange((self.as_of - self.window_start).days))
+                done = course_start + timedelta(days=30) <= self.as_of
+                yield {
+                    "employee_id": index + 1,
+                    "title": title,
+                    "training_type": TrainingType.OPTIONAL,
+                    "provider": provider,
+                    "start_date": course_start,
+                    "end_date": course_start + timedelta(days=30),
+                    "due_date": None,
+                    "completion_date": course_start + timedelta(days=30) if done else None,
+                    "status": TrainingStatus.COMPLETED if done else TrainingStatus.IN_PROGRESS,
+                    "progress_percentage": 100.0 if done else 50.0,
+                    "score": None,
+                    "expiry_date": None,
+                    "duration_hours": float(rng.choice([4, 8, 16, 24])),
+                    "cost": float(rng.choice([150, 300, 750, 1200])),
+                }
+
+    def document_rows(self) -> Iterator[dict]:
+        rng = self.rng
+        for index, hire_date in enumerate(self.hire_dates):
+            employee_ref = f"EMP{index + 1:07d}"
+            docs = [
+                (DocumentType.CONTRACT, "Employment contract", None),
+                (DocumentType.ID_DOCUMENT, "Right to work check", hire_date + timedelta(days=365 * 10)),
+            ]
+            if rng.random() < 0.4:
+                docs.append((DocumentType.CERTIFICATE, "Professional certificate",
+                             self.window_start + timedelta(days=rng.randrange(365 * (self.years + 2)))))
+            if rng.random() < 0.5:
+                docs.append((DocumentType.POLICY_ACKNOWLEDGMENT, "Handbook acknowledgment", None))
+            for document_type, title, expiry in docs:
+                file_name = f"{employee_ref}_{document_type.value}.pdf"
+                yield {
+                    "employee_id": index + 1,
+                    "title": title,
+                    "document_type": document_type,
+                    "file_path": f"synthetic/{employee_ref}/{file_name}",
+                    "file_name": file_name,
+                    "file_size": rng.randint(40_000, 4_000_000),
+                    "mime_type": "application/pdf",
+                    "status": DocumentStatus.EXPIRED if expiry and expiry < self.as_of else DocumentStatus.ACTIVE,
+                    "expiry_date": expiry,
+                    "tags": json.dumps([document_type.value]),
+                    "version": "1.0",
+                }
+
+
+def seed_synthetic(
+    conn: Connection,
+    employees: int,
+    years: int,
+    password_hash: str,
+    seed: int = 42,
+    batch_size: int = 5000,
+    as_of: date = DEFAULT_AS_OF,
+    log: Callable[[str], None] = print,
+) -> Dict[str, int]:
+    """Write a synthetic dataset through ``conn`` and return row counts per table."""
+    dataset = SyntheticDataset(employees, years, seed=seed, as_of=as_of)
+    counts = {}
+    # Order matters: the per-employee generators read hire dates and
+    # managers recorded while employee rows are produced.
+    steps = [
+        (Department, dataset.department_rows),
+        (User, lambda: dataset.user_rows(password_hash)),
+        (Employee, dataset.employee_rows),
+        (Absence, dataset.absence_rows),
+        (Performance, dataset.performance_rows),
+        (Training, dataset.training_rows),
+        (Document, dataset.document_rows),
+    ]
+    for model, rows in steps:
+        counts[model.__tablename__] = _bulk_insert(conn, model, rows(), batch_size)
+        log(f"  {model.__tablename__}: {counts[model.__tablename__]} rows")
+    counts[EmployeeHierarchy.__tablename__] = rebuild_hierarchy(conn, batch_size)
+    log(f"  {EmployeeHierarchy.__tablename__}: {counts[EmployeeHierarchy.__tablename__]} rows")
+    counts[LeaveBalance.__tablename__] = rebuild_leave_ledger(conn, dataset.as_of, batch_size)
+    log(f"  {LeaveBalance.__tablename__}: {counts[LeaveBalance.__tablename__]} rows")
+    # Core inserts bypass the ORM hooks that keep the search index in sync
+    search_backend.ensure_index(conn)
+    counts["search_index"] = search_backend.rebuild(conn, batch_size)
+    log(f"  search index: {counts['search_index']} entries")
+    _reset_sequences(conn, [User, Employee, Department])
+    return counts
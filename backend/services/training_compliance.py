@@ -0,0 +1,95 @@
+from datetime import date
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.employee import Employee
+from backend.models.training import Training, TrainingStatus, TrainingType
+from backend.schemas.training import ComplianceStatus
+
+# Cell codes are indexes into this list. For the grouped query the non-zero
+# codes double as a priority: an employee's cell shows the lowest code across
+# their records for the course, so one valid completion makes them compliant
+# and otherwise the most urgent problem wins.
+COMPLIANCE_CODES = [
+    ComplianceStatus.MISSING,
+    ComplianceStatus.COMPLETED,
+    ComplianceStatus.OVERDUE,
+    ComplianceStatus.EXPIRED,
+    ComplianceStatus.IN_PROGRESS,
+    ComplianceStatus.NOT_STARTED,
+]
+_CODE = {status: code for code, status in enumerate(COMPLIANCE_CODES)}
+
+
+def compliance_code(as_of: date):
+    """SQL expression giving each training row its cell code as of ``as_of``."""
+    open_statuses = (TrainingStatus.NOT_STARTED, TrainingStatus.IN_PROGRESS)
+    return case(
+        (
+            (Training.status == TrainingStatus.COMPLETED)
+            & or_(Training.expiry_date.is_(None), Training.expiry_date >= as_of),
+            _CODE[ComplianceStatus.COMPLETED],
+        ),
+        (Training.status.in_(open_statuses) & (Training.due_date < as_of), _CODE[ComplianceStatus.OVERDUE]),
+        # Completed rows reaching here have lapsed but not been swept yet
+        (
+            Training.status.in_((TrainingStatus.EXPIRED, TrainingStatus.COMPLETED)),
+            _CODE[ComplianceStatus.EXPIRED],
+        ),
+        (Training.status == TrainingStatus.IN_PROGRESS, _CODE[ComplianceStatus.IN_PROGRESS]),
+        else_=_CODE[ComplianceStatus.NOT_STARTED],
+    )
+
+
+async def build_compliance_matrix(db: AsyncSession, as_of: date, department_id: Optional[int] = None,
+                                  include_inactive: bool = False) -> dict:
+    """Employee × mandatory-course matrix in columnar form.
+
+    Two queries: the employees that label the rows, and one grouped
+    aggregate over the mandatory training rows that fills the cells.
+    """
+    conditions = []
+    if department_id is not None:
+        conditions.append(Employee.department_id == department_id)
+    if not include_inactive:
+        conditions.append(Employee.is_active == True)
+
+    employees = (await db.execute(
+        select(Employee.id, Employee.employee_id, Employee.first_name, Employee.last_name, Employee.department_id)
+        .where(*conditions)
+        .order_by(Employee.last_name, Employee.first_name, Employee.id)
+    )).all()
+    cells = (await db.execute(
+        select(Training.employee_id, Training.title, func.min(compliance_code(as_of)))
+        .join(Employee, Employee.id == Training.employee_id)
+        .where(Training.training_type == TrainingType.MANDATORY, *conditions)
+        .group_by(Training.employee_id, Training.title)
+    )).all()
+
+    courses = sorted({title for _, title, _ in cells})
+    row_of = {row.id: index for index, row in enumerate(employees)}
+    column_of = {title: index for index, title in enumerate(courses)}
+    matrix = np.zeros((len(employees), len(courses)), dtype=np.int8)
+    if cells:
+        employee_ids, titles, codes = zip(*cells)
+        matrix[[row_of[i] for i in employee_ids], [column_of[t] for t in titles]] = codes
+
+    completed = (matrix == _CODE[ComplianceStatus.COMPLETED]).sum(axis=0)
+    return {
+        "as_of": as_of,
+        "department_id": department_id,
+        "statuses": COMPLIANCE_CODES,
+        "courses": courses,
+        "employees": {
+            "id": [row.id for row in employees],
+            "employee_id": [row.employee_id for row in employees],
+            "name": [f"{row.first_name} {row.last_name}" for row in employees],
+            "department_id": [row.department_id for row in employees],
+        },
+        "cells": matrix,
+        "completed": completed,
+        "completion_rate": np.round(completed * 100.0 / max(len(employees), 1), 1),
+    }
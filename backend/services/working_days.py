@@ -0,0 +1,191 @@
+"""
+Working-day calendar: weekdays less UK bank holidays, for one of the three
+bank-holiday divisions (england-and-wales, scotland, northern-ireland).
+
+Holidays come from ``backend/data/uk_bank_holidays.json``, which has the
+shape of https://www.gov.uk/bank-holidays.json so it can be refreshed from
+that feed; nothing is fetched at runtime. The calendar precomputes a
+working-day bitmap for every year the file covers and its running sum, so
+the working days in any span are two array lookups.
+"""
+
+import json
+import time
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.engine import Connection
+
+from backend.core.cache import bump_tables
+from backend.core.config import settings
+from backend.core.database import engine
+from backend.models.absence import Absence, AbsenceType
+from backend.services.leave_balance import rebuild_leave_ledger
+
+BUNDLED_HOLIDAYS_FILE = Path(__file__).resolve().parent.parent / "data" / "uk_bank_holidays.json"
+REGIONS = ("england-and-wales", "scotland", "northern-ireland")
+RECOMPUTE_BATCH_SIZE = 50000
+
+
+class WorkingDaysError(ValueError):
+    """Raised when an absence's dates and total_days do not fit together."""
+
+
+def _dates(values) -> np.ndarray:
+    return np.asarray(values, dtype="datetime64[D]")
+
+
+class WorkingDayCalendar:
+    """Working-day counts over the years covered by a list of bank holidays.
+
+    Spans reaching outside those years fall back to ``np.busday_count``,
+    which there knows about weekends only.
+    """
+
+    def __init__(self, holidays: Iterable[date]):
+        self.holidays = np.unique(_dates(list(holidays)))
+        years = self.holidays.astype("datetime64[Y]")
+        self.first_day = years.min().astype("datetime64[D]")
+        self.end_day = (years.max() + 1).astype("datetime64[D]")
+        working = np.is_busday(np.arange(self.first_day, self.end_day), holidays=self.holidays)
+        self._working = working
+        # _cumulative[i] is the number of working days before first_day + i
+        self._cumulative = np.concatenate(([0], np.cumsum(working, dtype=np.int32)))
+
+    def _covered(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        return (starts >= self.first_day) & (ends < self.end_day)
+
+    def is_working_day(self, days) -> np.ndarray:
+        days = np.atleast_1d(_dates(days))
+        covered = self._covered(days, days)
+        index = np.where(covered, days - self.first_day, 0).astype(np.int64)
+        return np.where(covered, self._working[index], np.is_busday(days))
+
+    def count(self, starts, ends) -> np.ndarray:
+        """Working days in each inclusive ``[start, end]`` span; 0 where end is before start."""
+        starts, ends = np.broadcast_arrays(np.atleast_1d(_dates(starts)), np.atleast_1d(_dates(ends)))
+        covered = self._covered(starts, ends)
+        first = np.where(covered, starts - self.first_day, 0).astype(np.int64)
+        last = np.where(covered, ends - self.first_day + 1, 0).astype(np.int64)
+        counts = self._cumulative[last] - self._cumulative[first]
+        if not covered.all():
+            outside = ~covered
+            counts[outside] = np.busday_count(starts[outside], ends[outside] + 1, holidays=self.holidays)
+        return np.maximum(counts, 0)
+
+    def half_day_deductions(self, starts, ends, start_half_day, end_half_day) -> np.ndarray:
+        """Days taken off a span's count for half days at either end.
+
+        A half day on a non-working day changes nothing, and a one-day span
+        marked half at both ends is still half a day.
+        """
+        starts, ends = _dates(starts), _dates(ends)
+        start_half = np.asarray(start_half_day, dtype=bool) & self.is_working_day(starts)
+        end_half = np.asarray(end_half_day, dtype=bool) & self.is_working_day(ends) & ((starts != ends) | ~start_half)
+        return 0.5 * start_half + 0.5 * end_half
+
+    def working_days(self, start: date, end: date, start_half_day: bool = False, end_half_day: bool = False) -> float:
+        return float((self.count(start, end) - self.half_day_deductions(start, end, start_half_day, end_half_day))[0])
+
+    def consistent_totals(self, starts, ends, totals) -> np.ndarray:
+        """Whether each total is the span's working days with or without half days at its ends."""
+        full = self.count(starts, ends)
+        totals = np.asarray(totals, dtype=float)
+        deduction = full - totals
+        could_halve = self.half_day_deductions(starts, ends, True, True)
+        halved = ((deduction == 0.5) & (could_halve >= 0.5)) | ((deduction == 1.0) & (could_halve == 1.0))
+        return (deduction == 0) | ((totals > 0) & halved)
+
+
+def load_holidays(region: str, path: Optional[str] = None) -> list:
+    if region not in REGIONS:
+        raise ValueError(f"Unknown bank holiday region {region!r}; expected one of {', '.join(REGIONS)}")
+    with open(path or BUNDLED_HOLIDAYS_FILE, encoding="utf-8") as f:
+        events = json.load(f)[region]["events"]
+    return [date.fromisoformat(event["date"]) for event in events]
+
+
+@lru_cache(maxsize=None)
+def get_calendar(region: str = settings.BANK_HOLIDAY_REGION) -> WorkingDayCalendar:
+    return WorkingDayCalendar(load_holidays(region, settings.BANK_HOLIDAYS_FILE or None))
+
+
+def resolve_total_days(start: date, end: date, absence_type: AbsenceType, total_days: Optional[float] = None,
+                       start_half_day: bool = False, end_half_day: bool = False,
+                       calendar: Optional[WorkingDayCalendar] = None) -> float:
+    """total_days for an absence: derived from the dates when not given, otherwise checked against them.
+
+    Without half-day flags a given total may still drop half a day at
+    either end, so clients that only send a total keep working. Only
+    annual leave must cover a working day; sickness over a weekend is
+    recorded with 0 days so it still counts towards linked SSP periods.
+    """
+    calendar = calendar or get_calendar()
+    if end < start:
+        raise WorkingDaysError("end_date must not be before start_date")
+    derived = calendar.working_days(start, end, start_half_day, end_half_day)
+    if derived <= 0 and absence_type == AbsenceType.ANNUAL_LEAVE:
+        raise WorkingDaysError("Annual leave must cover at least one working day")
+    if total_days is None:
+        return derived
+    if start_half_day or end_half_day:
+        consistent = total_days == derived
+    else:
+        consistent = bool(calendar.consistent_totals(start, end, total_days)[0])
+    if not consistent:
+        raise WorkingDaysError(f"total_days {total_days:g} does not match the {derived:g} working days "
+                               f"from {start} to {end}")
+    return total_days
+
+
+def recompute_absence_days(conn: Connection, calendar: Optional[WorkingDayCalendar] = None,
+                           batch_size: int = RECOMPUTE_BATCH_SIZE) -> dict:
+    """Correct total_days on every absence whose total its dates cannot explain.
+
+    Absences are scanned in id order, one batch of columns at a time; only
+    rows that change are written. Totals that differ by half days at the
+    ends are kept, since half days are not stored. Corrected annual leave
+    is re-debited by rebuilding the leave ledger in the same transaction.
+    """
+    calendar = calendar or get_calendar()
+    table = Absence.__table__
+    set_total = update(table).where(table.c.id == bindparam("absence_id")).values(total_days=bindparam("days"))
+    result = {"scanned": 0, "updated": 0, "annual_leave_updated": 0}
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            select(Absence.id, Absence.absence_type, Absence.start_date, Absence.end_date, Absence.total_days)
+            .where(Absence.id > last_id).order_by(Absence.id).limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        ids, types, starts, ends, totals = zip(*rows)
+        starts, ends = _dates(starts), _dates(ends)
+        wrong = np.flatnonzero(~calendar.consistent_totals(starts, ends, totals))
+        if len(wrong):
+            days = calendar.count(starts[wrong], ends[wrong])
+            conn.execute(set_total, [{"absence_id": ids[i], "days": float(d)} for i, d in zip(wrong, days)])
+            result["annual_leave_updated"] += sum(types[i] == AbsenceType.ANNUAL_LEAVE for i in wrong)
+        result["scanned"] += len(rows)
+        result["updated"] += len(wrong)
+        last_id = ids[-1]
+    if result["annual_leave_updated"]:
+        rebuild_leave_ledger(conn)
+    return result
+
+
+def recompute_all_absence_days(region: str = settings.BANK_HOLIDAY_REGION) -> dict:
+    """``recompute_absence_days`` over the whole table in one transaction on the sync engine."""
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        result = recompute_absence_days(conn, get_calendar(region))
+    # Core writes bypass the ORM hooks that invalidate caches
+    if result["updated"]:
+        bump_tables("absences", "leave_balances")
+    result["region"] = region
+    result["duration_seconds"] = time.perf_counter() - started
+    return result
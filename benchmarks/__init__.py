@@ -0,0 +1 @@
+# HR Dashboard benchmarks
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Concurrency Benchmark
+Drives a running API with many concurrent clients and reports throughput
+
+    python -m benchmarks.concurrency --url http://localhost:8000 --clients 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def _login(client: httpx.AsyncClient, email: str, password: str) -> dict:
+    response = await client.post("/api/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _worker(client, path, headers, requests, latencies, errors):
+    for _ in range(requests):
+        started = time.perf_counter()
+        try:
+            response = await client.get(path, headers=headers)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+        except httpx.HTTPError as exc:
+            errors.append(type(exc).__name__)
+        latencies.append(time.perf_counter() - started)
+
+
+async def run(url, path, clients, requests, email, password):
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        headers = await _login(client, email, password)
+        latencies, errors = [], []
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            _worker(client, path, headers, requests, latencies, errors)
+            for _ in range(clients)
+        ))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    print(f"{path}: {clients} clients x {requests} requests in {elapsed:.2f}s")
+    print(f"  throughput: {len(latencies) / elapsed:.1f} req/s, errors: {len(errors)}")
+    print(f"  latency p50={quantiles[49] * 1000:.1f}ms p95={quantiles[94] * 1000:.1f}ms p99={quantiles[98] * 1000:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/api/employees/")
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    parser.add_argument("--email", default="admin@company.com")
+    parser.add_argument("--password", default="admin123")
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.path, args.clients, args.requests, args.email, args.password))
+
+
+if __name__ == "__main__":
+    main()
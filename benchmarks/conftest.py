@@ -0,0 +1,65 @@
+"""
+Fixtures for the pytest-benchmark micro-benchmarks
+
+The database is chosen before any backend module is imported, because
+settings and engines are built at import time. By default a synthetic
+database is seeded once into ``.benchmarks/micro.db`` and reused (install
+``requirements-dev.txt`` first):
+
+    BENCH_EMPLOYEES=5000 pytest benchmarks/ --benchmark-autosave
+    pytest benchmarks/ --benchmark-compare --benchmark-compare-fail=median:10%
+"""
+
+import asyncio
+import os
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+BENCH_DIR = Path(__file__).resolve().parent.parent / ".benchmarks"
+BENCH_DIR.mkdir(exist_ok=True)
+os.environ.setdefault("DATABASE_URL", os.environ.get("BENCH_DATABASE_URL", f"sqlite:///{BENCH_DIR / 'micro.db'}"))
+
+from backend.core.database import AsyncSessionLocal  # noqa: E402
+from backend.init_db import init_synthetic_db  # noqa: E402
+from backend.routers.auth import create_access_token  # noqa: E402
+
+ADMIN_EMAIL = "admin@company.com"
+
+
+@pytest.fixture(scope="session")
+def bench_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def seeded_db():
+    init_synthetic_db(
+        employees=int(os.environ.get("BENCH_EMPLOYEES", 2000)),
+        years=int(os.environ.get("BENCH_YEARS", 2)),
+    )
+
+
+@pytest.fixture(scope="session")
+def db(bench_loop, seeded_db):
+    session = AsyncSessionLocal()
+    yield session
+    bench_loop.run_until_complete(session.close())
+
+
+@pytest.fixture(scope="session")
+def run(bench_loop):
+    """Run a coroutine factory to completion; benchmarks time the whole call."""
+    def runner(factory, *args, **kwargs):
+        return bench_loop.run_until_complete(factory(*args, **kwargs))
+    return runner
+
+
+@pytest.fixture(scope="session")
+def admin_token():
+    return create_access_token(data={"sub": ADMIN_EMAIL}, expires_delta=timedelta(hours=1))
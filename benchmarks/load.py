@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Load Benchmark
+Drives backend.main:app in-process against a seeded synthetic database and
+reports latency percentiles and throughput per endpoint. Results are saved
+as JSON; pass an earlier run as --baseline to flag regressions (the exit
+status is 1 when any endpoint regressed beyond --threshold).
+
+    python -m benchmarks.load --employees 20000 --years 3
+    python -m benchmarks.load --baseline .benchmarks/load/<earlier>.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import httpx
+
+RESULTS_DIR = Path(__file__).resolve().parent.parent / ".benchmarks" / "load"
+
+# (name, path, query parameters); names are the keys compared across runs
+ENDPOINTS = [
+    ("employees.list", "/api/employees/", {"limit": 100}),
+    ("employees.list_fast", "/api/employees/", {"limit": 500, "fast": "true"}),
+    ("employees.detail", "/api/employees/1", {}),
+    ("departments.list", "/api/departments/", {}),
+    ("absences.list", "/api/absences/", {"limit": 100}),
+    ("absences.by_status", "/api/absences/", {"status": "approved", "limit": 100}),
+    ("absences.calendar", "/api/absences/calendar", {"from": "{today-30}", "to": "{today+30}"}),
+    ("performance.list", "/api/performance/", {"limit": 100}),
+    ("training.list", "/api/training/", {"limit": 100}),
+    ("documents.list", "/api/documents/", {"limit": 100}),
+    ("dashboard.stats", "/api/dashboard/stats", {}),
+]
+
+
+def _resolve(params: dict) -> dict:
+    resolved = {}
+    for key, value in params.items():
+        if isinstance(value, str) and value.startswith("{today"):
+            offset = int(value[len("{today"):-1] or 0)
+            value = (date.today() + timedelta(days=offset)).isoformat()
+        resolved[key] = value
+    return resolved
+
+
+def summarize(latencies: list, errors: int, elapsed: float) -> dict:
+    latencies = sorted(latencies)
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 4),
+        "rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(quantiles[49] * 1000, 3),
+        "p95_ms": round(quantiles[94] * 1000, 3),
+        "p99_ms": round(quantiles[98] * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+    }
+
+
+async def _worker(client, path, params, headers, requests, latencies, errors):
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = await client.get(path, params=params, headers=headers)
+        latencies.append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            errors.append(response.status_code)
+
+
+async def run(endpoints, concurrency, requests, warmup, email, password):
+    from backend.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=120) as client:
+        login = await client.post("/api/auth/login", json={"email": email, "password": password})
+        login.raise_for_status()
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        results = {}
+        print(f"{'endpoint':<22}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+        for name, path, params in endpoints:
+            params = _resolve(params)
+            await _worker(client, path, params, headers, warmup, [], [])
+            latencies, errors = [], []
+            per_worker = max(1, requests // concurrency)
+            started = time.perf_counter()
+            await asyncio.gather(*(
+                _worker(client, path, params, headers, per_worker, latencies, errors)
+                for _ in range(concurrency)
+            ))
+            result = summarize(latencies, len(errors), time.perf_counter() - started)
+            results[name] = result
+            print(f"{name:<22}{result['rps']:>10.1f}{result['p50_ms']:>10.2f}"
+                  f"{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['errors']:>8}")
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Endpoints whose p95 rose or throughput fell by more than ``threshold``."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["p95_ms"] > previous["p95_ms"] * (1 + threshold):
+            regressions.append((name, "p95_ms", previous["p95_ms"], current["p95_ms"]))
+        if current["rps"] < previous["rps"] * (1 - threshold):
+            regressions.append((name, "rps", previous["rps"], current["rps"]))
+        if current["errors"] > previous["errors"]:
+            regressions.append((name, "errors", previous["errors"], current["errors"]))
+    return regressions
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database", default=str(RESULTS_DIR.parent / "load.db"),
+                        help="SQLite file to use; seeded when empty")
+    parser.add_argument("--employees", type=int, default=20000)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=1000, help="requests per endpoint")
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--endpoint", action="append", help="only run these endpoint names")
+    parser.add_argument("--email", default="admin@company.com")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--output", help="results file (default: .benchmarks/load/<timestamp>.json)")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed relative slowdown")
+    args = parser.parse_args()
+
+    # Settings and engines are created on import, so pick the database first
+    Path(args.database).parent.mkdir(parents=True, exist_ok=True)
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(args.database).resolve()}")
+    from backend.init_db import init_synthetic_db
+    init_synthetic_db(args.employees, args.years)
+
+    endpoints = [e for e in ENDPOINTS if not args.endpoint or e[0] in args.endpoint]
+    results = asyncio.run(run(endpoints, args.concurrency, args.requests, args.warmup, args.email, args.password))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "database": os.environ["DATABASE_URL"].split("@")[-1],
+            "employees": args.employees,
+            "years": args.years,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+        },
+        "results": results,
+    }
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results saved to {output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"Regressions against {args.baseline} (threshold {args.threshold:.0%}):")
+            for name, metric, before, after in regressions:
+                print(f"  {name}: {metric} {before} -> {after}")
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Serialization Benchmark
+Compares the default list path (ORM objects validated through Pydantic)
+with the opt-in ``?fast=true`` path (plain column rows encoded by orjson)
+for every list endpoint, in-process against the configured database
+
+    python -m backend.init_db --employees 20000 --years 3
+    python -m benchmarks.serialization --iterations 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from backend.core.config import settings
+from backend.main import app
+
+RESOURCES = [
+    "/api/employees/",
+    "/api/departments/",
+    "/api/absences/",
+    "/api/performance/",
+    "/api/training/",
+    "/api/documents/",
+]
+
+
+async def _time_requests(client, path, params, headers, iterations):
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        response = await client.get(path, params=params, headers=headers)
+        response.raise_for_status()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), len(response.content)
+
+
+async def run(iterations, limit, email, password):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        login = await client.post("/api/auth/login", json={"email": email, "password": password})
+        login.raise_for_status()
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        print(f"{'resource':<22}{'default ms':>12}{'fast ms':>10}{'speedup':>10}{'bytes':>10}")
+        for path in RESOURCES:
+            params = {"limit": limit}
+            default, size = await _time_requests(client, path, params, headers, iterations)
+            fast, _ = await _time_requests(client, path, {**params, "fast": "true"}, headers, iterations)
+            print(f"{path:<22}{default * 1000:>12.2f}{fast * 1000:>10.2f}{default / fast:>9.1f}x{size:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=settings.MAX_PAGE_SIZE)
+    parser.add_argument("--email", default="admin@company.com")
+    parser.add_argument("--password", default="admin123")
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations, args.limit, args.email, args.password))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Micro-benchmarks for the per-request hot paths: token minting and
+decoding, principal resolution, list queries and response building
+"""
+
+from datetime import timedelta
+
+import orjson
+import pytest
+from fastapi import Response
+from sqlalchemy import select
+
+from backend.core.config import settings
+from backend.core.pagination import PageParams, paginate
+from backend.core.serialization import schema_columns
+from backend.models.absence import Absence, AbsenceStatus
+from backend.models.employee import Employee
+from backend.routers.auth import _principal_cache, create_access_token, get_current_user
+from backend.schemas.absence import AbsenceResponse
+from backend.schemas.employee import EmployeeResponse
+
+from benchmarks.conftest import ADMIN_EMAIL
+
+PAGE_SIZE = settings.MAX_PAGE_SIZE
+
+
+def test_create_access_token(benchmark):
+    token = benchmark(create_access_token, data={"sub": ADMIN_EMAIL}, expires_delta=timedelta(minutes=30))
+    assert token
+
+
+def test_get_current_user_cached(benchmark, run, db, admin_token):
+    run(get_current_user, admin_token, db)
+    user = benchmark(run, get_current_user, admin_token, db)
+    assert user.email == ADMIN_EMAIL
+
+
+def test_get_current_user_uncached(benchmark, run, db, admin_token):
+    user = benchmark.pedantic(
+        run, args=(get_current_user, admin_token, db),
+        setup=_principal_cache.clear, rounds=200, warmup_rounds=5,
+    )
+    assert user.email == ADMIN_EMAIL
+
+
+def _page(fast=False, cursor=None):
+    return PageParams(cursor=cursor, limit=PAGE_SIZE, fast=fast)
+
+
+def test_list_employees_query(benchmark, run, db):
+    rows = benchmark(run, paginate, db, select(Employee), _page(), Response(), Employee.id)
+    assert len(rows) == PAGE_SIZE
+
+
+def test_list_absences_filtered_query(benchmark, run, db):
+    stmt = select(Absence).where(Absence.status == AbsenceStatus.APPROVED)
+    rows = benchmark(run, paginate, db, stmt, _page(), Response(), Absence.start_date, Absence.id)
+    assert rows
+
+
+def test_list_employees_deep_page(benchmark, run, db):
+    # Resume from the middle of the table: keyset pages cost the same anywhere
+    response = Response()
+    midpoint = PageParams(cursor=None, limit=max(1, PAGE_SIZE // 2), fast=False)
+    run(paginate, db, select(Employee), midpoint, response, Employee.id)
+    cursor = response.headers.get("X-Next-Cursor")
+    rows = benchmark(run, paginate, db, select(Employee), _page(cursor=cursor), Response(), Employee.id)
+    assert rows
+
+
+@pytest.fixture(scope="module")
+def employee_rows(run, db):
+    return run(paginate, db, select(Employee), _page(), Response(), Employee.id)
+
+
+@pytest.fixture(scope="module")
+def absence_rows(run, db):
+    return run(paginate, db, select(Absence), _page(), Response(), Absence.start_date, Absence.id)
+
+
+def test_build_employee_responses(benchmark, employee_rows):
+    # What FastAPI does with a response_model=List[EmployeeResponse] result
+    payload = benchmark(lambda: [EmployeeResponse.model_validate(row).model_dump(mode="json") for row in employee_rows])
+    assert len(payload) == len(employee_rows)
+
+
+def test_build_absence_responses(benchmark, absence_rows):
+    payload = benchmark(lambda: [AbsenceResponse.model_validate(row).model_dump(mode="json") for row in absence_rows])
+    assert len(payload) == len(absence_rows)
+
+
+def test_encode_employee_page_fast(benchmark, run, db):
+    # The ?fast=true path: plain column rows straight into orjson
+    columns = schema_columns(Employee, EmployeeResponse)
+    rows = run(_fetch_mappings, db, select(*columns).order_by(Employee.id).limit(PAGE_SIZE))
+    body = benchmark(orjson.dumps, rows)
+    assert body
+
+
+async def _fetch_mappings(db, stmt):
+    return [dict(row) for row in (await db.execute(stmt)).mappings()]
@@ -1,4 +1,6 @@
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000';
+// Largest page the list endpoints serve (MAX_PAGE_SIZE on the backend)
+const LIST_PAGE_SIZE = 500;
 
 class ApiService {
   constructor() {
@@ -34,8 +36,8 @@ class ApiService {
     return headers;
   }
 
-  // Generic API request method
-  async request(endpoint, options = {}) {
+  // Send a request and return the raw response (undefined after a 401)
+  async send(endpoint, options = {}) {
     const url = `${this.baseURL}${endpoint}`;
     const config = {
       headers: this.getHeaders(),
@@ -55,13 +57,39 @@ class ApiService {
         throw new Error(`HTTP error! status: ${response.status}`);
       }
       
-      return await response.json();
+      return response;
     } catch (error) {
       console.error('API request failed:', error);
       throw error;
     }
   }
 
+  // Generic API request method
+  async request(endpoint, options = {}) {
+    const response = await this.send(endpoint, options);
+    return response && await response.json();
+  }
+
+  // Fetch every page of a list endpoint, following X-Next-Cursor until
+  // the server stops sending it
+  async requestAll(endpoint) {
+    const items = [];
+    let cursor = null;
+    do {
+      const params = new URLSearchParams({ limit: LIST_PAGE_SIZE });
+      if (cursor) {
+        params.set('cursor', cursor);
+      }
+      const response = await this.send(`${endpoint}?${params}`);
+      if (!response) {
+        return;
+      }
+      items.push(...await response.json());
+      cursor = response.headers.get('X-Next-Cursor');
+    } while (cursor);
+    return items;
+  }
+
   // Authentication endpoints
   async login(email, password) {
     const response = await this.request('/api/auth/login', {
@@ -89,7 +117,7 @@ class ApiService {
 
   // Employee endpoints
   async getEmployees() {
-    return await this.request('/api/employees');
+    return await this.requestAll('/api/employees/');
   }
 
   async getEmployee(id) {
@@ -118,7 +146,7 @@ class ApiService {
 
   // Department endpoints
   async getDepartments() {
-    return await this.request('/api/departments');
+    return await this.requestAll('/api/departments/');
   }
 
   async createDepartment(departmentData) {
@@ -130,7 +158,7 @@ class ApiService {
 
   // Absence endpoints
   async getAbsences() {
-    return await this.request('/api/absences');
+    return await this.requestAll('/api/absences/');
   }
 
   async createAbsence(absenceData) {
@@ -142,7 +170,7 @@ class ApiService {
 
   // Performance endpoints
   async getPerformances() {
-    return await this.request('/api/performance');
+    return await this.requestAll('/api/performance/');
   }
 
   async createPerformance(performanceData) {
@@ -154,7 +182,7 @@ class ApiService {
 
   // Training endpoints
   async getTrainings() {
-    return await this.request('/api/training');
+    return await this.requestAll('/api/training/');
   }
 
   async createTraining(trainingData) {
@@ -166,7 +194,7 @@ class ApiService {
 
   // Document endpoints
   async getDocuments() {
-    return await this.request('/api/documents');
+    return await this.requestAll('/api/documents/');
   }
 
   async createDocument(documentData) {
@@ -176,61 +204,10 @@ class ApiService {
     });
   }
 
-  // Dashboard statistics
+  // Dashboard statistics (aggregated server-side)
   async getDashboardStats() {
     try {
-      const [employees, departments, absences, performances] = await Promise.all([
-        this.getEmployees(),
-        this.getDepartments(),
-        this.getAbsences(),
-        this.getPerformances(),
-      ]);
-
-      // Calculate statistics
-      const totalEmployees = employees.length;
-      const activeEmployees = employees.filter(emp => emp.is_active).length;
-      const pendingAbsences = absences.filter(abs => abs.status === 'pending').length;
-      
-      // Department distribution
-      const departmentStats = departments.map(dept => {
-        const deptEmployees = employees.filter(emp => emp.department_id === dept.id);
-        return {
-          name: dept.name,
-          count: deptEmployees.length,
-          percentage: totalEmployees > 0 ? Math.round((deptEmployees.length / totalEmployees) * 100) : 0,
-        };
-      });
-
-      // Performance distribution
-      const performanceStats = [
-        { rating: '5 - Excellent', count: 0, percentage: 0 },
-        { rating: '4 - Good', count: 0, percentage: 0 },
-        { rating: '3 - Average', count: 0, percentage: 0 },
-        { rating: '2 - Below Average', count: 0, percentage: 0 },
-        { rating: '1 - Poor', count: 0, percentage: 0 },
-      ];
-
-      performances.forEach(perf => {
-        const rating = perf.overall_rating;
-        const stat = performanceStats.find(s => s.rating === rating);
-        if (stat) {
-          stat.count += 1;
-        }
-      });
-
-      // Calculate percentages
-      const totalReviews = performances.length;
-      performanceStats.forEach(stat => {
-        stat.percentage = totalReviews > 0 ? Math.round((stat.count / totalReviews) * 100) : 0;
-      });
-
-      return {
-        total_employees: totalEmployees,
-        active_employees: activeEmployees,
-        pending_absences: pendingAbsences,
-        department_distribution: departmentStats,
-        performance_distribution: performanceStats,
-      };
+      return await this.request('/api/dashboard/stats');
     } catch (error) {
       console.error('Error fetching dashboard stats:', error);
       return {
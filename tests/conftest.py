@@ -0,0 +1,81 @@
+"""
+Fixtures for the backend tests
+
+As in the benchmarks, the database is chosen before any backend module is
+imported, because settings and engines are built at import time. A test
+session runs against a fresh SQLite file holding one admin user; tests add
+the rows they need through the API or the ``db`` session.
+"""
+
+import itertools
+import os
+import tempfile
+from datetime import date
+
+import pytest
+
+_TEST_DIR = tempfile.mkdtemp(prefix="hr-dashboard-tests-")
+os.environ["DATABASE_URL"] = os.environ.get("TEST_DATABASE_URL", f"sqlite:///{_TEST_DIR}/test.db")
+os.environ["UPLOAD_DIR"] = f"{_TEST_DIR}/uploads"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.core.database import Base, SessionLocal, engine  # noqa: E402
+from backend.main import app  # noqa: E402
+from backend.models.user import User, UserRole  # noqa: E402
+from backend.routers.auth import get_password_hash  # noqa: E402
+from backend.services.search import ensure_search_index  # noqa: E402
+
+ADMIN_EMAIL = "admin@example.com"
+ADMIN_PASSWORD = "admin123"
+_employee_numbers = itertools.count(1)
+
+
+@pytest.fixture(scope="session")
+def admin_id():
+    Base.metadata.create_all(bind=engine)
+    ensure_search_index()
+    with SessionLocal() as session:
+        admin = User(email=ADMIN_EMAIL, username="admin", full_name="Admin",
+                     hashed_password=get_password_hash(ADMIN_PASSWORD), role=UserRole.ADMIN)
+        session.add(admin)
+        session.commit()
+        return admin.id
+
+
+@pytest.fixture(scope="session")
+def client(admin_id):
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client):
+    response = client.post("/api/auth/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def db(admin_id):
+    with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def create_employee(client, auth_headers, admin_id):
+    """Create an employee through the API and return its JSON."""
+    def create(**fields):
+        number = next(_employee_numbers)
+        payload = {
+            "employee_id": f"T{number:05d}",
+            "user_id": admin_id,
+            "first_name": "Test",
+            "last_name": f"Employee{number}",
+            "hire_date": date(2020, 1, 1).isoformat(),
+            "position": "Analyst",
+            "employment_type": "Full-time",
+            **fields,
+        }
+        response = client.post("/api/employees/", json=payload, headers=auth_headers)
+        assert response.status_code == 200, response.text
+        return response.json()
+    return create
@@ -0,0 +1,32 @@
+"""
+Malformed bodies sent to the bulk employee import are rejected with 400
+"""
+
+import pytest
+
+
+@pytest.mark.parametrize("body, content_type", [
+    (b"{not json", "application/json"),
+    (b"", "application/json"),
+    (b"\xff\xfe[]", "application/json"),
+    (b'{"employee_id": "E1"}', "application/json"),
+    (b"[1, 2]", "application/json"),
+    (b"employee_id\n\xff", "text/csv"),
+])
+def test_malformed_bodies_are_rejected(client, auth_headers, body, content_type):
+    response = client.post("/api/employees/bulk", content=body,
+                           headers={**auth_headers, "Content-Type": content_type})
+    assert response.status_code == 400, response.text
+
+
+def test_rows_are_validated_individually(client, auth_headers, admin_id):
+    rows = [
+        {"employee_id": "BULK001", "user_id": admin_id, "first_name": "Ada", "last_name": "Lovelace",
+         "hire_date": "2024-01-01", "position": "Engineer", "employment_type": "Full-time"},
+        {"employee_id": "BULK002", "first_name": "No", "last_name": "User"},
+    ]
+    response = client.post("/api/employees/bulk", json=rows, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["created"] == 1
+    assert [error["row"] for error in result["errors"]] == [2]
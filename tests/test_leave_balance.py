@@ -0,0 +1,122 @@
+"""
+The annual leave ledger kept in step with absences by the after_flush hooks
+
+Each scenario is checked against the rows a full ``rebuild_leave_ledger``
+would write, as well as against hand-computed values.
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+
+from backend.core.database import engine
+from backend.models.absence import Absence
+from backend.models.leave_balance import LeaveBalance
+from backend.services.leave_balance import rebuild_leave_ledger
+
+
+def _ledger(conn, employee_id):
+    rows = conn.execute(
+        select(LeaveBalance.leave_year, LeaveBalance.entitlement_days, LeaveBalance.carried_over_days,
+               LeaveBalance.taken_days, LeaveBalance.pending_days)
+        .where(LeaveBalance.employee_id == employee_id)
+    ).all()
+    # Rows with nothing booked carry no information the rebuild must reproduce
+    return {row.leave_year: tuple(row[1:]) for row in rows if row.taken_days or row.pending_days}
+
+
+def ledger(employee_id):
+    with engine.connect() as conn:
+        return _ledger(conn, employee_id)
+
+
+def rebuilt_ledger(employee_id):
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        rebuild_leave_ledger(conn)
+        rows = _ledger(conn, employee_id)
+        transaction.rollback()
+    return rows
+
+
+@pytest.fixture
+def employee(create_employee):
+    # Joined at the start of the 2024 leave year, so nothing carries into it
+    return create_employee(hire_date="2024-01-01")
+
+
+def book(client, auth_headers, employee, start, end, **fields):
+    response = client.post("/api/absences/", headers=auth_headers, json={
+        "employee_id": employee["id"], "absence_type": "annual_leave",
+        "start_date": start.isoformat(), "end_date": end.isoformat(), **fields,
+    })
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def edit(client, auth_headers, absence, **changes):
+    response = client.put(f"/api/absences/{absence['id']}", json=changes, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def assert_ledger(employee, expected):
+    assert ledger(employee["id"]) == expected
+    assert rebuilt_ledger(employee["id"]) == expected
+
+
+def test_request_approve_edit_cancel(client, auth_headers, employee):
+    # Monday to Friday: five working days, pending until approved
+    absence = book(client, auth_headers, employee, date(2024, 6, 3), date(2024, 6, 7))
+    assert_ledger(employee, {2024: (28.0, 0.0, 0.0, 5.0)})
+
+    edit(client, auth_headers, absence, status="approved")
+    assert_ledger(employee, {2024: (28.0, 0.0, 5.0, 0.0)})
+
+    edit(client, auth_headers, absence, end_date="2024-06-05")
+    assert_ledger(employee, {2024: (28.0, 0.0, 3.0, 0.0)})
+
+    edit(client, auth_headers, absence, status="cancelled")
+    assert_ledger(employee, {})
+
+
+def test_moving_leave_between_years_moves_the_debit(client, auth_headers, employee):
+    absence = book(client, auth_headers, employee, date(2024, 6, 3), date(2024, 6, 4))
+    absence = edit(client, auth_headers, absence, status="approved")
+    assert_ledger(employee, {2024: (28.0, 0.0, 2.0, 0.0)})
+
+    edit(client, auth_headers, absence, start_date="2025-06-02", end_date="2025-06-03")
+    # 2024 had 28 days left, so 2025 carries the capped five over
+    assert_ledger(employee, {2025: (28.0, 5.0, 2.0, 0.0)})
+
+
+def test_carry_over_follows_earlier_bookings(client, auth_headers, employee):
+    later = book(client, auth_headers, employee, date(2025, 3, 3), date(2025, 3, 3))
+    edit(client, auth_headers, later, status="approved")
+    assert_ledger(employee, {2025: (28.0, 5.0, 1.0, 0.0)})
+
+    # 24 working days (1 January is a bank holiday) leave 4 to carry over
+    earlier = book(client, auth_headers, employee, date(2024, 1, 1), date(2024, 2, 2))
+    assert earlier["total_days"] == 24.0
+    edit(client, auth_headers, earlier, status="approved")
+    assert_ledger(employee, {2024: (28.0, 0.0, 24.0, 0.0), 2025: (28.0, 4.0, 1.0, 0.0)})
+
+    # Overdrawn: nothing carries over
+    edit(client, auth_headers, earlier, end_date="2024-02-09")
+    assert_ledger(employee, {2024: (28.0, 0.0, 29.0, 0.0), 2025: (28.0, 0.0, 1.0, 0.0)})
+
+
+def test_deleting_an_absence_reverses_its_debit(client, auth_headers, employee, db):
+    absence = book(client, auth_headers, employee, date(2024, 9, 2), date(2024, 9, 6))
+    edit(client, auth_headers, absence, status="approved")
+    assert_ledger(employee, {2024: (28.0, 0.0, 5.0, 0.0)})
+
+    db.delete(db.get(Absence, absence["id"]))
+    db.commit()
+    assert_ledger(employee, {})
+
+
+def test_other_absence_types_leave_the_ledger_alone(client, auth_headers, employee):
+    book(client, auth_headers, employee, date(2024, 6, 3), date(2024, 6, 7), absence_type="sick_leave")
+    assert_ledger(employee, {})
@@ -0,0 +1,102 @@
+"""
+Reporting lines: the closure table maintained by move_employee and
+detach_employee, checked against closure_rows over the manager_id column
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from backend.core.database import AsyncSessionLocal, engine
+from backend.models.employee import Employee
+from backend.models.employee_hierarchy import EmployeeHierarchy
+from backend.services.org_chart import ReportingCycleError, closure_rows, move_employee
+
+
+def _closure(pairs):
+    return sorted((row["ancestor_id"], row["descendant_id"], row["depth"]) for row in closure_rows(pairs))
+
+
+def assert_closure_consistent():
+    with engine.connect() as conn:
+        expected = _closure(conn.execute(select(Employee.id, Employee.manager_id)).all())
+        stored = sorted(tuple(row) for row in conn.execute(
+            select(EmployeeHierarchy.ancestor_id, EmployeeHierarchy.descendant_id, EmployeeHierarchy.depth)
+        ))
+    assert stored == expected
+
+
+def chain(client, auth_headers, employee):
+    response = client.get(f"/api/employees/{employee['id']}/chain", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    return [manager["id"] for manager in response.json()]
+
+
+@pytest.fixture
+def tree(create_employee):
+    """ceo <- head <- lead <- (dev, qa); dev <- intern"""
+    ceo = create_employee()
+    head = create_employee(manager_id=ceo["id"])
+    lead = create_employee(manager_id=head["id"])
+    dev = create_employee(manager_id=lead["id"])
+    qa = create_employee(manager_id=lead["id"])
+    intern = create_employee(manager_id=dev["id"])
+    return {"ceo": ceo, "head": head, "lead": lead, "dev": dev, "qa": qa, "intern": intern}
+
+
+def test_closure_rows_follow_manager_chains():
+    assert _closure([(1, None), (2, 1), (3, 2)]) == [
+        (1, 1, 0), (1, 2, 1), (1, 3, 2), (2, 2, 0), (2, 3, 1), (3, 3, 0),
+    ]
+
+
+def test_closure_rows_cut_cycles_and_missing_managers():
+    # 1 -> 2 -> 3 -> 1 is cut where it closes; 4 reports to a missing 99
+    rows = _closure([(1, 2), (2, 3), (3, 1), (4, 99)])
+    assert (4, 4, 0) in rows and all(ancestor != 99 for ancestor, _, _ in rows)
+    assert len(rows) == 1 + 6  # the cycle yields a chain of three, not an endless one
+    for employee in (1, 2, 3):
+        assert (employee, employee, 0) in rows
+
+
+def test_moving_a_subtree_rewrites_its_chains(client, auth_headers, tree):
+    response = client.put(f"/api/employees/{tree['dev']['id']}", json={"manager_id": tree["head"]["id"]},
+                          headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert chain(client, auth_headers, tree["intern"]) == [tree[name]["id"] for name in ("dev", "head", "ceo")]
+    reports = client.get(f"/api/employees/{tree['lead']['id']}/reports", headers=auth_headers).json()
+    assert [report["id"] for report in reports] == [tree["qa"]["id"]]
+    assert_closure_consistent()
+
+
+@pytest.mark.parametrize("new_manager", ["lead", "intern"])
+def test_cycles_are_rejected(client, auth_headers, tree, new_manager):
+    response = client.put(f"/api/employees/{tree['lead']['id']}", json={"manager_id": tree[new_manager]["id"]},
+                          headers=auth_headers)
+    assert response.status_code == 400
+    assert_closure_consistent()
+
+
+def test_move_employee_raises_on_cycles(tree):
+    async def move():
+        async with AsyncSessionLocal() as db:
+            await move_employee(db, tree["head"]["id"], tree["intern"]["id"])
+    with pytest.raises(ReportingCycleError):
+        asyncio.run(move())
+
+
+def test_deleting_a_manager_reparents_their_reports(client, auth_headers, tree, db):
+    response = client.delete(f"/api/employees/{tree['lead']['id']}", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    for name in ("dev", "qa"):
+        assert db.get(Employee, tree[name]["id"]).manager_id == tree["head"]["id"]
+    assert chain(client, auth_headers, tree["intern"]) == [tree[name]["id"] for name in ("dev", "head", "ceo")]
+    assert_closure_consistent()
+
+
+def test_deleting_the_top_manager_makes_reports_top_level(client, auth_headers, tree, db):
+    assert client.delete(f"/api/employees/{tree['ceo']['id']}", headers=auth_headers).status_code == 200
+    assert db.get(Employee, tree["head"]["id"]).manager_id is None
+    assert chain(client, auth_headers, tree["lead"]) == [tree["head"]["id"]]
+    assert_closure_consistent()
@@ -0,0 +1,113 @@
+"""
+Statutory Sick Pay rules on small hand-built sickness histories
+
+All dates fall in the 2024/25 rate year (£116.75 a week, three waiting
+days) with the default Monday to Friday qualifying days, and no earnings
+are recorded, so every qualifying day is eligible at the flat rate.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from backend.services.ssp import LINKING_GAP_DAYS, MAX_WEEKS, calculate_ssp, to_date
+
+WEEKMASK = "1111100"
+DAILY_RATE = 116.75 / 5
+PERIOD_END = date(2025, 3, 31)
+
+
+def _ssp(*spells, employee_id=1, period_start=None, period_end=PERIOD_END):
+    spells = sorted(spells)
+    return calculate_ssp([employee_id] * len(spells), [s for s, _ in spells], [e for _, e in spells],
+                         {}, period_start, period_end, WEEKMASK)
+
+
+def test_spell_under_four_days_is_not_a_piw():
+    piws = _ssp((date(2024, 6, 3), date(2024, 6, 5)))
+    assert len(piws.start) == 0
+
+
+def test_four_calendar_days_form_a_piw_even_over_a_weekend():
+    # Friday to Monday: four days of sickness but only two qualifying days
+    piws = _ssp((date(2024, 6, 7), date(2024, 6, 10)))
+    assert len(piws.start) == 1
+    assert piws.qualifying_days.tolist() == [2]
+    assert piws.waiting_days.tolist() == [2]
+    assert piws.paid_days.tolist() == [0]
+
+
+def test_back_to_back_spells_join_into_one_piw():
+    piws = _ssp((date(2024, 6, 3), date(2024, 6, 4)), (date(2024, 6, 5), date(2024, 6, 7)))
+    assert [to_date(d) for d in piws.start] == [date(2024, 6, 3)]
+    assert [to_date(d) for d in piws.end] == [date(2024, 6, 7)]
+
+
+def test_waiting_days_then_flat_rate():
+    piws = _ssp((date(2024, 6, 3), date(2024, 6, 7)))
+    assert piws.waiting_days.tolist() == [3]
+    assert piws.paid_days.tolist() == [2]
+    assert piws.amount.tolist() == [round(2 * DAILY_RATE, 2)]
+
+
+@pytest.mark.parametrize("gap, linked", [(LINKING_GAP_DAYS, True), (LINKING_GAP_DAYS + 1, False)])
+def test_piws_link_within_eight_weeks(gap, linked):
+    first_end = date(2024, 6, 7)
+    second_start = first_end + timedelta(days=gap + 1)
+    piws = _ssp((date(2024, 6, 3), first_end), (second_start, second_start + timedelta(days=6)))
+    assert len(piws.start) == 2
+    assert bool(piws.chain[0] == piws.chain[1]) is linked
+    assert to_date(piws.chain_start[1]) == (date(2024, 6, 3) if linked else second_start)
+
+
+def test_waiting_days_are_served_once_per_linked_piw():
+    # The first PIW (Saturday to Tuesday) serves two waiting days, so the
+    # linked second one owes just one more
+    piws = _ssp((date(2024, 6, 1), date(2024, 6, 4)), (date(2024, 7, 1), date(2024, 7, 5)))
+    assert piws.chain[0] == piws.chain[1]
+    assert piws.waiting_days.tolist() == [2, 1]
+    assert piws.paid_days.tolist() == [0, 4]
+    # An unlinked PIW starts its own waiting days
+    piws = _ssp((date(2024, 6, 3), date(2024, 6, 7)), (date(2024, 9, 2), date(2024, 9, 6)))
+    assert piws.chain[0] != piws.chain[1]
+    assert piws.waiting_days.tolist() == [3, 3]
+
+
+def test_payment_stops_after_28_weeks():
+    start = date(2024, 6, 3)  # a Monday
+    piws = _ssp((start, start + timedelta(weeks=40) - timedelta(days=1)))
+    cap = MAX_WEEKS * 5
+    assert piws.qualifying_days.tolist() == [200]
+    assert piws.waiting_days.tolist() == [3]
+    assert piws.paid_days.tolist() == [cap]
+    assert piws.chain_paid_days.tolist() == [cap]
+    assert piws.amount[0] == pytest.approx(cap * DAILY_RATE, abs=0.01)
+
+
+def test_cap_spans_linked_piws():
+    start = date(2024, 6, 3)
+    long_end = start + timedelta(weeks=27) - timedelta(days=1)
+    piws = _ssp((start, long_end), (long_end + timedelta(days=15), long_end + timedelta(days=15 + 4 * 7 - 1)))
+    assert piws.chain[0] == piws.chain[1]
+    # 27 weeks less the waiting days, then the rest of the 28 weeks
+    assert piws.paid_days.tolist() == [27 * 5 - 3, 8]
+    # Each PIW reports the whole linked PIW's paid days
+    assert piws.chain_paid_days.tolist() == [MAX_WEEKS * 5] * 2
+
+
+def test_period_bounds_amounts_but_not_history():
+    start = date(2024, 6, 3)
+    piws = _ssp((start, date(2024, 6, 14)), period_start=date(2024, 6, 10), period_end=date(2024, 6, 12))
+    # The waiting days fell in the week before the period
+    assert piws.qualifying_days.tolist() == [3]
+    assert piws.waiting_days.tolist() == [0]
+    assert piws.paid_days.tolist() == [3]
+
+
+def test_employees_are_independent():
+    piws = calculate_ssp([1, 2], [date(2024, 6, 3), date(2024, 6, 10)], [date(2024, 6, 7), date(2024, 6, 14)],
+                         {}, None, PERIOD_END, WEEKMASK)
+    assert piws.employee_id.tolist() == [1, 2]
+    assert len(np.unique(piws.chain)) == 2
+    assert piws.waiting_days.tolist() == [3, 3]